@@ -0,0 +1,438 @@
+"""Benchmarks for the locale tooling.
+
+    python scripts/bench_locales.py merge [--tenants 50] [--lang en]
+    python scripts/bench_locales.py lookup [--lang zh] [--rounds 200]
+    python scripts/bench_locales.py pipeline [--languages 50] [--keys 2000] [--output run.json]
+    python scripts/bench_locales.py messages [--rounds 2000]
+    python scripts/bench_locales.py memory
+
+--output writes a versioned JSON document (parameters, environment and
+rows, with sorted keys) that can be diffed against earlier runs.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from copy import deepcopy
+
+import locale_codec
+from locale_codec import LOCALES_DIR, dump_locale, locale_languages, locale_path
+from locale_compact import ShapeTable, compact, dump as dump_shapes
+from locale_cow import cow_merge, freeze
+from locale_flat import flatten
+from locale_merge import merge
+from locale_messages import compile_message, compile_tree, format_message
+from locale_plan import compile_plan
+from locale_routes import used_keys
+from locale_sources import TranslationSources
+from locale_synth import generate, payload
+
+RESULT_VERSION = 1
+
+translations = TranslationSources()
+
+
+def measure(fn, *args):
+    """Run fn under tracemalloc; return (seconds, retained blocks, retained bytes, peak bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return elapsed, blocks, size, peak
+
+
+def _tenant_trees(base, updates, tenants, scenario):
+    trees = []
+    for _ in range(tenants):
+        tree = deepcopy(base)
+        for key in updates:
+            if scenario == "add":
+                tree.pop(key, None)
+            else:
+                tree[key] = ""
+        trees.append(tree)
+    return trees
+
+
+def bench_merge(args):
+    with open(locale_path(args.lang), "r", encoding="utf-8") as f:
+        base = json.load(f)
+    updates = translations[args.lang]
+    rows = []
+    for scenario in ("add", "replace"):
+        for name in ("merge", "cow_merge", "plan"):
+            trees = _tenant_trees(base, updates, args.tenants, scenario)
+            if name == "merge":
+                def run():
+                    for tree in trees:
+                        merge(tree, updates)
+            elif name == "cow_merge":
+                def run():
+                    frozen = freeze(updates)
+                    for tree in trees:
+                        cow_merge(tree, frozen)
+            else:
+                def run():
+                    plan = compile_plan(updates)
+                    for tree in trees:
+                        plan.apply(tree)
+            elapsed, blocks, size, peak = measure(run)
+            rows.append({
+                "scenario": scenario,
+                "merge": name,
+                "tenants": args.tenants,
+                "seconds": round(elapsed, 6),
+                "blocks": blocks,
+                "bytes": size,
+                "peak_bytes": peak,
+            })
+            del trees
+    return rows
+
+
+def nested_t(translations, lang, key):
+    # Mirrors getNestedTranslation + t() in src/context/LanguageContext.tsx.
+    def get(tree):
+        current = tree
+        for part in key.split("."):
+            current = current[part] if isinstance(current, dict) and part in current else None
+        return current
+
+    value = get(translations[lang])
+    if value is None:
+        value = get(translations["en"])
+    return key if value is None else value
+
+
+def flat_t(bundles, lang, key):
+    value = bundles[lang].get(key)
+    if value is None:
+        value = bundles["en"].get(key)
+    return key if value is None else value
+
+
+def bench_lookup(args):
+    nested = {}
+    for lang in {args.lang, "en"}:
+        with open(locale_path(lang), "r", encoding="utf-8") as f:
+            nested[lang] = json.load(f)
+    flat = {lang: flatten(tree) for lang, tree in nested.items()}
+    # Whole-object lookups such as t("locationSpotlight") have no flat
+    # equivalent; those call sites keep using the nested tree.
+    keys = [key for key in used_keys(args.src) if not isinstance(nested_t(nested, args.lang, key), dict)]
+    for key in keys:
+        if nested_t(nested, args.lang, key) != flat_t(flat, args.lang, key):
+            raise SystemExit(f"flat and nested lookups disagree on {key!r}")
+
+    rows = []
+    for name, lookup, bundles in (("nested", nested_t, nested), ("flat", flat_t, flat)):
+        lang = args.lang
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for key in keys:
+                lookup(bundles, lang, key)
+        elapsed = time.perf_counter() - start
+        lookups = args.rounds * len(keys)
+        rows.append({
+            "lookup": name,
+            "lang": lang,
+            "keys": len(keys),
+            "lookups": lookups,
+            "seconds": round(elapsed, 6),
+            "ns_per_lookup": round(elapsed / lookups * 1e9, 1),
+        })
+    return rows
+
+
+def _best(fn, repeat, setup=tuple):
+    """Best wall time of fn(*setup()) over repeat untraced runs, then the peak bytes of one traced run.
+
+    setup() runs outside the timed region, so phases that mutate their
+    input can get a fresh copy each time.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        fn(*state)
+        times.append(time.perf_counter() - start)
+        del state
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    fn(*state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def bench_pipeline(args):
+    codec = locale_codec.select(args.codec)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        updates = []
+        for i in range(args.languages):
+            tree = generate(args.keys, args.depth, args.list_length, args.string_size, seed=i)
+            path = os.path.join(directory, f"l{i}.json")
+            with open(path, "wb") as f:
+                f.write(dump_locale(tree))
+            paths.append(path)
+            updates.append(payload(tree, args.fraction, args.string_size, seed=i))
+        size = sum(os.path.getsize(path) for path in paths)
+
+        def load():
+            trees = []
+            for path in paths:
+                with open(path, "rb") as f:
+                    trees.append(codec.loads(f.read()))
+            return trees
+
+        def merge_all(copies):
+            for tree, update in zip(copies, updates):
+                merge(tree, update)
+
+        trees = load()
+        phases = (
+            ("load", load, tuple),
+            ("merge", merge_all, lambda: ([deepcopy(tree) for tree in trees],)),
+            ("deepcopy", lambda: [deepcopy(tree) for tree in trees], tuple),
+            ("dump", lambda: [codec.dumps(tree) for tree in trees], tuple),
+        )
+        rows = []
+        for phase, fn, setup in phases:
+            elapsed, peak = _best(fn, args.repeat, setup)
+            rows.append({
+                "phase": phase,
+                "codec": codec.name,
+                "languages": args.languages,
+                "bytes": size,
+                "seconds": round(elapsed, 6),
+                "mb_per_s": round(size / elapsed / 1e6, 2) if elapsed else None,
+                "peak_bytes": peak,
+            })
+    return rows
+
+
+def replace_format(text, values):
+    # Mirrors the template.replace("{a}", ...) calls in src/pages.
+    for name, value in values.items():
+        text = text.replace("{" + name + "}", value)
+    return text
+
+
+def _arguments(tokens):
+    names = set()
+    stack = list(tokens)
+    while stack:
+        token = stack.pop()
+        if isinstance(token, list) and token[0] == "a":
+            names.add(token[1])
+        elif isinstance(token, list) and token[0] in ("p", "s"):
+            for branch in token[-1].values():
+                stack.extend(branch)
+    return names
+
+
+def bench_messages(args):
+    cases = []
+    languages = locale_languages()
+    for lang in languages:
+        with open(locale_path(lang), "r", encoding="utf-8") as f:
+            tree = json.load(f)
+        messages, errors = compile_tree(tree)
+        if errors:
+            raise SystemExit(f"{lang}: {errors[0][0]}: {errors[0][1]}")
+        flat = flatten(tree)
+        for path, tokens in messages.items():
+            # Messages inside arrays have no flat path to compare against.
+            if path in flat:
+                values = {name: f"<{name}>" for name in _arguments(tokens)}
+                cases.append((flat[path], tokens, values, lang))
+    for text, tokens, values, lang in cases:
+        if replace_format(text, values) != format_message(tokens, values, lang):
+            raise SystemExit(f"compiled and replaced output disagree on {text!r}")
+
+    def run_replace():
+        for text, _, values, _ in cases:
+            replace_format(text, values)
+
+    def run_parse():
+        for text, _, values, lang in cases:
+            format_message(compile_message(text), values, lang)
+
+    def run_compiled():
+        for _, tokens, values, lang in cases:
+            format_message(tokens, values, lang)
+
+    rows = []
+    for name, fn in (("replace", run_replace), ("parse+format", run_parse), ("compiled", run_compiled)):
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            fn()
+        elapsed = time.perf_counter() - start
+        renders = args.rounds * len(cases)
+        rows.append({
+            "method": name,
+            "messages": len(cases),
+            "renders": renders,
+            "seconds": round(elapsed, 6),
+            "ns_per_render": round(elapsed / renders * 1e9, 1),
+        })
+    return rows
+
+
+def bench_memory(args):
+    languages = locale_languages(args.locales_dir)
+    paths = [locale_path(lang, args.locales_dir) for lang in languages]
+    size = sum(os.path.getsize(path) for path in paths)
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        if dump_shapes(compact(json.loads(raw), ShapeTable())) != dump_locale(json.loads(raw)):
+            raise SystemExit(f"{path}: compact tree does not round-trip")
+
+    kept = []
+
+    def load_plain():
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                kept.append(json.load(f))
+
+    def load_compact():
+        table = ShapeTable()
+        kept.append(table)
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                kept.append(compact(json.load(f), table))
+
+    rows = []
+    for name, fn in (("dict", load_plain), ("compact", load_compact)):
+        elapsed, blocks, retained, peak = measure(fn)
+        kept.clear()
+        rows.append({
+            "tree": name,
+            "languages": len(paths),
+            "disk_bytes": size,
+            "retained_bytes": retained,
+            "x_disk": round(retained / size, 2),
+            "blocks": blocks,
+            "peak_bytes": peak,
+            "seconds": round(elapsed, 6),
+        })
+    return rows
+
+
+def result_document(args, rows):
+    params = {
+        key: value for key, value in sorted(vars(args).items())
+        if key not in ("json", "output", "run", "command")
+    }
+    return {
+        "version": RESULT_VERSION,
+        "benchmark": args.command,
+        "params": params,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "rows": rows,
+    }
+
+
+def print_rows(rows):
+    columns = list(rows[0])
+    widths = [max(len(col), *(len(str(row[col])) for row in rows)) for col in columns]
+    print("  ".join(col.ljust(width) for col, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[col]).ljust(width) for col, width in zip(columns, widths)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write a versioned result document to this file")
+    # Accepted after the subcommand too. SUPPRESS keeps a subcommand that
+    # omits them from resetting values given before it.
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help="print results as JSON")
+    output.add_argument(
+        "--output", default=argparse.SUPPRESS, help="also write a versioned result document to this file"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    merge_cmd = commands.add_parser(
+        "merge", parents=[output], help="merge vs cow_merge vs a compiled plan when one payload is applied to many trees"
+    )
+    merge_cmd.add_argument("--lang", default="en", choices=sorted(translations))
+    merge_cmd.add_argument("--tenants", type=int, default=50)
+    merge_cmd.set_defaults(run=bench_merge)
+
+    lookup_cmd = commands.add_parser(
+        "lookup", parents=[output], help="t() over nested trees vs flat bundles, using every static key in src/"
+    )
+    lookup_cmd.add_argument("--lang", default="zh", help="zh misses whole namespaces, so it exercises the fallback")
+    lookup_cmd.add_argument("--rounds", type=int, default=200)
+    lookup_cmd.add_argument("--src", default="src")
+    lookup_cmd.set_defaults(run=bench_lookup)
+
+    pipeline_cmd = commands.add_parser(
+        "pipeline", parents=[output], help="load, merge, deepcopy and dump on generated locale trees"
+    )
+    pipeline_cmd.add_argument("--languages", type=int, default=14)
+    pipeline_cmd.add_argument("--keys", type=int, default=2000, help="leaves per language")
+    pipeline_cmd.add_argument("--depth", type=int, default=3, help="object nesting below each namespace")
+    pipeline_cmd.add_argument("--list-length", type=int, default=5, help="items per array leaf (0 for none)")
+    pipeline_cmd.add_argument("--string-size", type=int, default=40, help="characters per string")
+    pipeline_cmd.add_argument("--fraction", type=float, default=0.1, help="share of leaves each payload rewrites")
+    pipeline_cmd.add_argument("--codec", choices=("auto", *locale_codec.CODECS), default="json")
+    pipeline_cmd.add_argument("--repeat", type=int, default=5, help="timed runs per phase; the best is kept")
+    pipeline_cmd.set_defaults(run=bench_pipeline)
+
+    messages_cmd = commands.add_parser(
+        "messages", parents=[output], help="str.replace interpolation vs parsing every render vs precompiled ICU tokens"
+    )
+    messages_cmd.add_argument("--rounds", type=int, default=2000)
+    messages_cmd.set_defaults(run=bench_messages)
+
+    memory_cmd = commands.add_parser(
+        "memory", parents=[output], help="memory held by every locale as json.load() dicts vs compact shared-shape trees"
+    )
+    memory_cmd.add_argument("--locales-dir", default=LOCALES_DIR)
+    memory_cmd.set_defaults(run=bench_memory)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = args.run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result_document(args, rows), f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_rows(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Build derived locale assets from src/locales/*.json.
+
+    python scripts/build_locales.py --emit chunks --emit flat --emit resolved [--out public/locales]
+    python scripts/build_locales.py --emit chunks --emit minified --compress -j 4
+    python scripts/build_locales.py --emit messages
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Mapping
+
+import locale_codec
+from locale_chunks import emit_chunks
+from locale_codec import LOCALES_DIR, load_locale, locale_languages, locale_path
+from locale_commit import locked
+from locale_compress import compress_outputs
+from locale_flat import emit_flat
+from locale_intern import emit_interned
+from locale_manifest import hash_bytes
+from locale_messages import MessageError, emit_messages
+from locale_minify import emit_minified
+from locale_resolve import emit_resolved
+
+OUT_DIR = "public/locales"
+# Outside public/, which the app build copies verbatim.
+LOCK_DIR = ".cache/locales"
+LOCK_NAME = "build.lock"
+
+EMITTERS = {
+    "chunks": emit_chunks,
+    "flat": emit_flat,
+    "resolved": emit_resolved,
+    "interned": emit_interned,
+    "minified": emit_minified,
+    "messages": emit_messages,
+}
+
+
+class LocaleFiles(Mapping):
+    """lang -> parsed locale tree, read and parsed only when first needed."""
+
+    def __init__(self, locales_dir=LOCALES_DIR):
+        self.locales_dir = locales_dir
+        self.languages = locale_languages(locales_dir)
+        self._raw = {}
+        self._trees = {}
+
+    def path(self, lang):
+        return locale_path(lang, self.locales_dir)
+
+    def raw(self, lang):
+        if lang not in self._raw:
+            with open(self.path(lang), "rb") as f:
+                self._raw[lang] = f.read()
+        return self._raw[lang]
+
+    def hash(self, lang):
+        return hash_bytes(self.raw(lang))
+
+    def __getitem__(self, lang):
+        if lang not in self._trees:
+            if lang not in self.languages:
+                raise KeyError(lang)
+            self._trees[lang] = load_locale(self.raw(lang))
+        return self._trees[lang]
+
+    def __iter__(self):
+        return iter(self.languages)
+
+    def __len__(self):
+        return len(self.languages)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--emit", action="append", choices=sorted(EMITTERS), required=True,
+        help="output to build; repeat for several",
+    )
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    parser.add_argument("--out", default=OUT_DIR, help=f"output directory (default: {OUT_DIR})")
+    parser.add_argument(
+        "--compress", action="store_true",
+        help="write .gz (and .br if the brotli module is installed) next to every JSON output",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="compression worker processes; 0 uses every core (default: 1)",
+    )
+    parser.add_argument("--codec", choices=("auto", *locale_codec.CODECS), default="auto", help="JSON backend")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    locale_codec.select(args.codec)
+    locales = LocaleFiles(args.locales_dir)
+    os.makedirs(args.out, exist_ok=True)
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    with locked(LOCK_DIR, LOCK_NAME):
+        for name in args.emit:
+            try:
+                stats = EMITTERS[name](locales, args.out)
+            except MessageError as exc:
+                print(f"{name}: {exc}", file=sys.stderr)
+                return 1
+            print(f"{name}: " + ", ".join(f"{count} {what}" for what, count in stats.items()))
+        if args.compress:
+            jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+            stats = compress_outputs(args.out, jobs)
+            print("compress: " + ", ".join(f"{count} {what}" for what, count in stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Canonical, streaming encoder for locale files.
+
+merge() appends new keys wherever the update history put them, so two
+files holding the same translations can differ byte for byte. encode()
+writes a tree in the json.dumps(..., ensure_ascii=False, indent=2) layout
+with a stable key order, in chunks through a buffered writer rather than
+as one string:
+
+    source  keys as they are in the tree (what json.dumps writes)
+    alpha   keys sorted by code point at every level
+    en      keys in the order of the reference tree (en.json) at the same
+            path; keys it does not have follow, sorted
+
+Array items keep their positions; objects inside an array are ordered by
+the reference item at the same index. The same tree and reference always
+produce the same bytes.
+
+    python scripts/locale_canonical.py --order en [--check] [langs...]
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+from locale_commit import LocaleTransaction, locked, temp_beside
+from locale_manifest import hash_file
+from locale_stream import CHUNK_SIZE, JsonWriter
+
+ORDERS = ("source", "alpha", "en")
+REFERENCE = "en"
+
+
+def _keys(node, order, reference):
+    if order == "source":
+        return list(node)
+    if order == "alpha" or not isinstance(reference, dict):
+        return sorted(node)
+    known = [key for key in reference if key in node]
+    return known + sorted(key for key in node if key not in reference)
+
+
+def _child(reference, key):
+    if isinstance(reference, dict):
+        return reference.get(key)
+    if isinstance(reference, list) and isinstance(key, int) and key < len(reference):
+        return reference[key]
+    return None
+
+
+def encode(tree, out, order="source", reference=None, buffer_size=CHUNK_SIZE):
+    """Write tree to the binary file out; return the sha256 hex digest of what was written."""
+    if order not in ORDERS:
+        raise ValueError(f"unknown key order {order!r}")
+    writer = JsonWriter(out, buffer_size)
+    # Each frame holds the remaining (key, value, reference) items of one container.
+    stack = []
+
+    def enter(value, ref):
+        if isinstance(value, dict):
+            writer.open("{")
+            keys = _keys(value, order, ref)
+            stack.append(iter([(key, value[key], _child(ref, key)) for key in keys]))
+        elif isinstance(value, list):
+            writer.open("[")
+            stack.append(iter([(None, item, _child(ref, i)) for i, item in enumerate(value)]))
+        else:
+            writer.scalar(value)
+
+    enter(tree, reference)
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            writer.close()
+            continue
+        key, value, ref = item
+        if key is not None:
+            writer.key(key)
+        enter(value, ref)
+    writer.flush()
+    return writer.digest.hexdigest()
+
+
+def canonical_bytes(tree, order="source", reference=None):
+    out = io.BytesIO()
+    encode(tree, out, order, reference)
+    return out.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rewrite locale files in a canonical key order.")
+    parser.add_argument("languages", nargs="*", help="only these languages (default: all)")
+    parser.add_argument("--order", choices=ORDERS, default="en")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    parser.add_argument(
+        "--check", action="store_true", help="write nothing; exit 1 if any file is not canonical"
+    )
+    args = parser.parse_args(argv)
+
+    languages = args.languages or locale_languages(args.locales_dir)
+    reference = None
+    if args.order == "en":
+        with open(locale_path(REFERENCE, args.locales_dir), "r", encoding="utf-8") as f:
+            reference = json.load(f)
+
+    stale = []
+    with locked(args.locales_dir), LocaleTransaction() as txn:
+        for lang in languages:
+            path = locale_path(lang, args.locales_dir)
+            with open(path, "r", encoding="utf-8") as f:
+                tree = json.load(f)
+            fd, tmp = temp_beside(path)
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    output_hash = encode(tree, out, args.order, reference)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            if output_hash == hash_file(path):
+                os.unlink(tmp)
+                continue
+            stale.append(lang)
+            if args.check:
+                os.unlink(tmp)
+            else:
+                txn.adopt(tmp, path)
+    verb = "not canonical" if args.check else "rewritten"
+    for lang in stale:
+        print(f"{lang}: {verb}")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
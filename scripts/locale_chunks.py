@@ -0,0 +1,88 @@
+"""Per-language, per-namespace locale chunks for lazy loading.
+
+Each top-level namespace of src/locales/<lang>.json becomes
+<out>/<lang>/<namespace>.json. <out>/manifest.json lists every chunk with
+its content hash and size. It also lists the namespaces each route needs
+(see locale_routes), so the provider can fetch only the current language
+and the chunks for the current route.
+
+Regeneration is incremental. A language whose source file hash matches the
+manifest is not parsed. Within a changed language, only the chunks whose
+content hash changed are rewritten.
+"""
+
+import json
+import os
+
+from locale_codec import dump_locale
+from locale_commit import LocaleTransaction, same_content
+from locale_manifest import hash_bytes, load_cache
+from locale_routes import route_namespaces
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _files_exist(out_dir, entries):
+    return all(os.path.exists(os.path.join(out_dir, entry["file"])) for entry in entries.values())
+
+
+def emit_chunks(locales, out_dir, dump=dump_locale, src_dir="src"):
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    old = load_cache(manifest_path, MANIFEST_VERSION) or {"sources": {}, "languages": {}}
+    sources = {}
+    languages = {}
+    stats = {"written": 0, "unchanged": 0, "removed": 0}
+    txn = LocaleTransaction()
+    try:
+        for lang in locales:
+            source_hash = locales.hash(lang)
+            previous = old["languages"].get(lang, {})
+            sources[lang] = source_hash
+            if old["sources"].get(lang) == source_hash and _files_exist(out_dir, previous):
+                languages[lang] = previous
+                stats["unchanged"] += len(previous)
+                continue
+
+            entries = {}
+            for namespace, subtree in locales[lang].items():
+                data = dump(subtree)
+                entry = {
+                    "file": f"{lang}/{namespace}.json",
+                    "hash": hash_bytes(data)[:16],
+                    "bytes": len(data),
+                }
+                entries[namespace] = entry
+                path = os.path.join(out_dir, entry["file"])
+                if previous.get(namespace) == entry and os.path.exists(path):
+                    stats["unchanged"] += 1
+                    continue
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                txn.stage(path, data)
+                stats["written"] += 1
+            languages[lang] = entries
+
+        en = languages.get("en", {})
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "fallback": "en",
+            "sources": sources,
+            "languages": languages,
+            **route_namespaces(src_dir, known=set(en)),
+        }
+        data = (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+        if not same_content(manifest_path, data):
+            txn.stage(manifest_path, data)
+        txn.commit()
+    except BaseException:
+        txn.rollback()
+        raise
+
+    live = {entry["file"] for entries in languages.values() for entry in entries.values()}
+    for entries in old["languages"].values():
+        for entry in entries.values():
+            path = os.path.join(out_dir, entry["file"])
+            if entry["file"] not in live and os.path.exists(path):
+                os.unlink(path)
+                stats["removed"] += 1
+    return stats
@@ -0,0 +1,171 @@
+"""JSON backends for reading and writing locale files.
+
+Every codec must produce exactly the bytes of
+json.dumps(tree, ensure_ascii=False, indent=2).encode("utf-8"), so the
+backend in use never shows up in a diff. "auto" picks orjson when it is
+installed and the stdlib otherwise.
+
+orjson writes the same layout except for a few numbers: 1e16 for 1e+16,
+0.00001 for 1e-05, null for NaN and Infinity. In pretty output a number
+always ends its line, so those tokens are found with a few cheap scans
+(strings end their line with a quote and never match); when one is
+present, or orjson refuses the tree (integers beyond 64 bits, non-string
+keys), the stdlib encoder is used instead. Reading stays on the stdlib:
+json.loads is already C, and orjson turns integers beyond 64 bits into
+floats.
+
+    python scripts/locale_codec.py [--locales-dir src/locales]
+
+checks every available backend against the stdlib on the locale files and
+on generated edge cases, and exits 1 on the first mismatch.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+LOCALES_DIR = "src/locales"
+
+# Separate patterns keep a literal prefix each, which re scans for far
+# faster than an alternation. A legitimate null also falls back.
+_DIVERGENT = (
+    re.compile(rb"e-?[0-9]+,?\n"),
+    re.compile(rb"0\.0000[0-9]*,?\n"),
+    re.compile(rb"null,?\n"),
+)
+
+
+class JsonCodec:
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data.decode("utf-8"))
+
+    def dumps(self, tree):
+        return json.dumps(tree, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def dumps(self, tree):
+        try:
+            output = orjson.dumps(tree, option=orjson.OPT_INDENT_2)
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            return super().dumps(tree)
+        for pattern in _DIVERGENT:
+            if pattern.search(output):
+                return super().dumps(tree)
+        return output
+
+
+CODECS = {"json": JsonCodec}
+if orjson is not None:
+    CODECS["orjson"] = OrjsonCodec
+
+_current = None
+
+
+def select(name="auto"):
+    """Make the named codec the one current() returns; "auto" prefers orjson."""
+    global _current
+    if name == "auto":
+        name = "orjson" if "orjson" in CODECS else "json"
+    if name not in CODECS:
+        raise ValueError(f"JSON codec {name!r} is not available (have: {', '.join(CODECS)})")
+    _current = CODECS[name]()
+    return _current
+
+
+def current():
+    return _current or select()
+
+
+def locale_path(lang, locales_dir=LOCALES_DIR):
+    return os.path.join(locales_dir, f"{lang}.json")
+
+
+def locale_languages(locales_dir=LOCALES_DIR):
+    """Every language with a <lang>.json file in locales_dir, sorted."""
+    return sorted(name[:-5] for name in os.listdir(locales_dir) if name.endswith(".json"))
+
+
+def load_locale(raw):
+    return current().loads(raw)
+
+
+def dump_locale(data):
+    """json.dumps(data, ensure_ascii=False, indent=2) as UTF-8, from the selected codec."""
+    return current().dumps(data)
+
+
+def dump_compact(data):
+    """data as UTF-8 JSON without indentation or spaces after separators."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _samples(seed=0):
+    rng = random.Random(seed)
+    floats = [0.0, -0.0, 0.1, 1.5, 4.9, 1e-4, 1e-5, -1e-7, 1e15, 1e16, 1.7e308, 5e-324, 123456789.123]
+    floats += [rng.uniform(-1e6, 1e6) for _ in range(200)]
+    floats += [rng.random() * 10 ** rng.randint(-30, 30) for _ in range(200)]
+    yield {"floats": floats}
+    yield {"ints": [0, -1, 2**63 - 1, 2**63, 2**64, -(2**63) - 1, 10**30]}
+    yield {"nonfinite": [float("nan"), float("inf"), float("-inf")]}
+    yield {"strings": ["", "é😀", "  ", "\x00\x1f\x7f", '"\\/', 'x": 1e5']}
+    yield {"empty": [{}, [], {"a": []}, [[{}]]], "null": None, "flags": [True, False]}
+    yield {1: "int key", "nested": {"deep": [{"k": [1, {"l": "v"}]}]}}
+
+
+def check(locales_dir):
+    """Return a list of mismatches between every codec and the stdlib."""
+    reference = JsonCodec()
+    cases = []
+    for name in sorted(os.listdir(locales_dir)):
+        if name.endswith(".json"):
+            with open(os.path.join(locales_dir, name), "rb") as f:
+                cases.append((name, f.read()))
+    for i, tree in enumerate(_samples()):
+        cases.append((f"sample {i}", reference.dumps(tree)))
+    cases.append(("duplicate keys", b'{"a": 1, "b": 2, "a": 3}'))
+    cases.append(("source NaN", b'{"a": NaN, "b": -Infinity}'))
+
+    failures = []
+    for codec_name, codec_class in CODECS.items():
+        codec = codec_class()
+        for case, raw in cases:
+            expected_tree = reference.loads(raw)
+            expected = reference.dumps(expected_tree)
+            if codec.dumps(expected_tree) != expected:
+                failures.append(f"{codec_name}: dumps differs on {case}")
+            if reference.dumps(codec.loads(raw)) != expected:
+                failures.append(f"{codec_name}: loads differs on {case}")
+    for i, tree in enumerate(_samples()):
+        expected = reference.dumps(tree)
+        for codec_name, codec_class in CODECS.items():
+            if codec_class().dumps(tree) != expected:
+                failures.append(f"{codec_name}: dumps differs on in-memory sample {i}")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that every JSON codec matches the stdlib byte for byte.")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    args = parser.parse_args(argv)
+    failures = check(args.locales_dir)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    print(f"{', '.join(CODECS)}: {'FAILED' if failures else 'identical'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import contextlib
+import os
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_NAME = ".update.lock"
+
+
+@contextlib.contextmanager
+def locked(directory, name=LOCK_NAME):
+    """Hold an exclusive advisory lock on directory for the duration of the block.
+
+    Concurrent invocations block here and run one after another instead of
+    interleaving their reads and writes.
+    """
+    with open(os.path.join(directory, name), "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def same_content(path, data):
+    """True if path already holds exactly data, so rewriting it can be skipped."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _fsync_dir(directory):
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def temp_beside(path, suffix=".tmp"):
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=suffix, dir=directory or ".")
+    return fd, tmp
+
+
+class LocaleTransaction:
+    """All-or-nothing replacement of a set of files.
+
+    Every file is first written to a temp file beside its target. commit()
+    fsyncs the whole batch, then renames each temp over its target. If a
+    rename fails, the targets already replaced are restored from hard-link
+    backups. Each file is always either wholly old or wholly new, never
+    truncated. The batch as a whole is all-or-nothing only for processes
+    that hold locked() around it. The renames happen one at a time, so a
+    reader that does not take the lock may see some files old and some new
+    while commit() runs.
+    """
+
+    def __init__(self):
+        self.staged = []
+
+    def stage(self, path, data):
+        fd, tmp = temp_beside(path, ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        self.staged.append((tmp, path))
+
+    def adopt(self, tmp, path):
+        """Stage a temp file that was already written, e.g. by a worker process."""
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        self.staged.append((tmp, path))
+
+    def commit(self):
+        try:
+            for tmp, _ in self.staged:
+                fd = os.open(tmp, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            backups = [(path, self._backup(path)) for _, path in self.staged]
+        except BaseException:
+            self.rollback()
+            raise
+
+        replaced = []
+        try:
+            for tmp, path in self.staged:
+                os.replace(tmp, path)
+                replaced.append(path)
+        except BaseException:
+            for path, backup in backups:
+                if path not in replaced:
+                    continue
+                if backup is None:
+                    os.unlink(path)
+                else:
+                    os.replace(backup, path)
+            self.rollback()
+            raise
+        finally:
+            for _, backup in backups:
+                if backup is not None and os.path.exists(backup):
+                    os.unlink(backup)
+
+        for directory in {os.path.dirname(path) or "." for _, path in self.staged}:
+            _fsync_dir(directory)
+        self.staged = []
+
+    def rollback(self):
+        for tmp, _ in self.staged:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        self.staged = []
+
+    def _backup(self, path):
+        if not os.path.exists(path):
+            return None
+        fd, backup = temp_beside(path, ".bak")
+        os.close(fd)
+        os.unlink(backup)
+        try:
+            os.link(path, backup)
+        except OSError:
+            shutil.copy2(path, backup)
+        return backup
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+def write_outputs(outputs, directory=None, suffixes=(".json",)):
+    """Replace every path -> data in outputs whose content differs, all or none.
+
+    With directory, files below it that end in one of suffixes and are not
+    in outputs are deleted afterwards (dot files and dot directories are
+    left alone). Returns {"written": n, "unchanged": n, "removed": n}.
+    """
+    stats = {"written": 0, "unchanged": 0, "removed": 0}
+    with LocaleTransaction() as txn:
+        for path, data in outputs.items():
+            if same_content(path, data):
+                stats["unchanged"] += 1
+                continue
+            parent = os.path.dirname(path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            txn.stage(path, data)
+            stats["written"] += 1
+    if directory is not None and os.path.isdir(directory):
+        for root, dirs, names in os.walk(directory):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for name in names:
+                path = os.path.join(root, name)
+                if name.endswith(suffixes) and not name.startswith(".") and path not in outputs:
+                    os.unlink(path)
+                    stats["removed"] += 1
+    return stats
@@ -0,0 +1,181 @@
+"""Compact in-memory locale trees.
+
+json.load() gives every object its own dict, with its own hash table and
+its own references to the key strings. The 14 locales share almost all of
+their structure, so a CompactNode stores only a tuple of values and a
+reference to a Shape: the interned tuple of its keys plus a key -> slot
+index. Objects with the same keys in the same order, in any language,
+share one Shape, and so one copy of their key strings. Arrays become
+tuples.
+
+    table = ShapeTable()
+    node = compact(json.load(f), table)
+    merge(node, payload, table)
+    data = dump(node)   # the bytes dump_locale(to_plain(node)) would give
+
+Adding a key moves a node to the next Shape through a cached transition,
+so nodes updated the same way keep sharing. to_plain() restores the
+json.load() tree exactly, key order included.
+"""
+
+import io
+
+from locale_merge import SEPARATOR, merge_keyed, same_value
+from locale_stream import CHUNK_SIZE, JsonWriter
+
+
+class Shape:
+    __slots__ = ("keys", "index", "transitions")
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.transitions = {}
+
+
+class ShapeTable:
+    """The Shapes shared by every tree compacted with this table."""
+
+    __slots__ = ("shapes",)
+
+    def __init__(self):
+        self.shapes = {}
+
+    def shape(self, keys):
+        keys = tuple(keys)
+        shape = self.shapes.get(keys)
+        if shape is None:
+            shape = self.shapes[keys] = Shape(keys)
+        return shape
+
+    def extend(self, shape, key):
+        following = shape.transitions.get(key)
+        if following is None:
+            following = shape.transitions[key] = self.shape(shape.keys + (key,))
+        return following
+
+
+class CompactNode:
+    __slots__ = ("shape", "values")
+
+    def __init__(self, shape, values):
+        self.shape = shape
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, key):
+        return key in self.shape.index
+
+    def __getitem__(self, key):
+        return self.values[self.shape.index[key]]
+
+    def get(self, key, default=None):
+        slot = self.shape.index.get(key)
+        return default if slot is None else self.values[slot]
+
+    def keys(self):
+        return self.shape.keys
+
+    def items(self):
+        return zip(self.shape.keys, self.values)
+
+    def set(self, key, value, table):
+        slot = self.shape.index.get(key)
+        if slot is None:
+            self.shape = table.extend(self.shape, key)
+            self.values += (value,)
+        else:
+            self.values = self.values[:slot] + (value,) + self.values[slot + 1:]
+
+
+def compact(value, table):
+    if isinstance(value, dict):
+        return CompactNode(table.shape(value), tuple([compact(item, table) for item in value.values()]))
+    if isinstance(value, list):
+        return tuple([compact(item, table) for item in value])
+    return value
+
+
+def to_plain(value):
+    if isinstance(value, CompactNode):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [to_plain(item) for item in value]
+    return value
+
+
+_MISSING = object()
+
+
+def merge(node, updates, table, counts=None, keyed=None, prefix=""):
+    """locale_merge.merge() for a CompactNode and a plain payload; return True if node changed."""
+    changed = False
+    for key, value in updates.items():
+        current = node.get(key, _MISSING)
+        if isinstance(value, dict):
+            if isinstance(current, CompactNode):
+                changed = merge(current, value, table, counts, keyed, prefix + key + SEPARATOR) or changed
+            elif current is not _MISSING:
+                node.set(key, compact(value, table), table)
+                changed = True
+                if counts is not None:
+                    counts["overwritten"] += 1
+            else:
+                child = CompactNode(table.shape(()), ())
+                merge(child, value, table, counts)
+                node.set(key, child, table)
+                changed = True
+        elif current is _MISSING:
+            node.set(key, compact(value, table), table)
+            changed = True
+            if counts is not None:
+                counts["added"] += 1
+        elif keyed and isinstance(value, list) and prefix + key in keyed and isinstance(current, tuple):
+            # Rare enough to go through the plain merge.
+            items = to_plain(current)
+            if merge_keyed(items, value, keyed[prefix + key], counts, prefix + key):
+                node.set(key, compact(items, table), table)
+                changed = True
+        elif not same_value(to_plain(current), value):
+            node.set(key, compact(value, table), table)
+            changed = True
+            if counts is not None:
+                counts["overwritten"] += 1
+    return changed
+
+
+def write(node, out, buffer_size=CHUNK_SIZE):
+    """Stream node to the binary file out in the dump_locale() layout."""
+    writer = JsonWriter(out, buffer_size)
+    stack = []
+
+    def enter(value):
+        if isinstance(value, CompactNode):
+            writer.open("{")
+            stack.append(iter(value.items()))
+        elif isinstance(value, tuple):
+            writer.open("[")
+            stack.append(iter([(None, item) for item in value]))
+        else:
+            writer.scalar(value)
+
+    enter(node)
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            writer.close()
+            continue
+        key, value = item
+        if key is not None:
+            writer.key(key)
+        enter(value)
+    writer.flush()
+
+
+def dump(node):
+    out = io.BytesIO()
+    write(node, out)
+    return out.getvalue()
@@ -0,0 +1,98 @@
+"""Precompressed copies of the generated locale assets.
+
+compress_outputs() writes <file>.json.gz next to every JSON file under the
+output directory (and <file>.json.br when the brotli module is installed),
+at the same maximum levels scripts/postbuild.mjs uses. postbuild.mjs
+leaves a precompressed file alone when it still decompresses to its
+source, so locale assets are compressed once, here.
+
+Compressed bytes are cached under COMPRESS_CACHE by the sha256 of their
+source, so unchanged content is never compressed twice, even after the
+output directory is wiped; entries no current output uses are pruned.
+Cache misses are compressed in a process pool.
+"""
+
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from locale_commit import temp_beside, write_outputs
+from locale_manifest import hash_bytes
+
+try:
+    import brotli
+except ImportError:  # .br files are then left to postbuild.mjs
+    brotli = None
+
+COMPRESS_CACHE = ".cache/locales/compressed"
+FORMATS = ("gz", "br") if brotli is not None else ("gz",)
+
+
+def compress(data, fmt):
+    if fmt == "gz":
+        # mtime=0 keeps the output a pure function of the input.
+        return gzip.compress(data, 9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def _compress_job(job):
+    path, fmt = job
+    with open(path, "rb") as f:
+        return compress(f.read(), fmt)
+
+
+def _sources(out_dir):
+    for root, dirs, names in os.walk(out_dir):
+        dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+        for name in sorted(names):
+            if name.endswith(".json") and not name.startswith("."):
+                yield os.path.join(root, name)
+
+
+def _store(path, data):
+    fd, tmp = temp_beside(path)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def compress_outputs(out_dir, jobs=1, cache_dir=COMPRESS_CACHE):
+    os.makedirs(cache_dir, exist_ok=True)
+    targets = {}
+    misses = {}
+    for path in _sources(out_dir):
+        with open(path, "rb") as f:
+            digest = hash_bytes(f.read())
+        for fmt in FORMATS:
+            cached = os.path.join(cache_dir, f"{digest}.{fmt}")
+            targets[f"{path}.{fmt}"] = cached
+            if not os.path.exists(cached):
+                # Identical sources share one job.
+                misses.setdefault(cached, (path, fmt))
+
+    jobs = min(jobs, len(misses))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            compressed = pool.map(_compress_job, misses.values(), chunksize=4)
+            for cached, data in zip(misses, compressed):
+                _store(cached, data)
+    else:
+        for cached, job in misses.items():
+            _store(cached, _compress_job(job))
+
+    live = set(targets.values())
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if path not in live:
+            os.unlink(path)
+
+    outputs = {}
+    for target, cached in targets.items():
+        with open(cached, "rb") as f:
+            outputs[target] = f.read()
+    # Also drops compressed copies of files an emitter has since removed:
+    # every JSON file _sources() saw has its copies in outputs. Without
+    # brotli, .br files are postbuild.mjs's and are left alone.
+    stats = write_outputs(outputs, out_dir, tuple(f".json.{fmt}" for fmt in FORMATS))
+    stats["compressed"] = len(misses)
+    return stats
@@ -0,0 +1,200 @@
+"""Translation coverage per namespace and language.
+
+    python scripts/locale_coverage.py [langs...] [--json]
+
+For every top-level namespace of en.json and every other language, counts
+the en leaves under it (keys), the ones the language lacks or holds with a
+different type (missing), the strings still equal to the English text
+(identical) and the strings whose {placeholders} differ (placeholders).
+A leaf is translated when it is none of these; coverage is translated /
+keys. Strings without a letter (numbers, "/", "—") are not counted as
+identical.
+
+Results are cached in COVERAGE_CACHE. A language whose file and en.json
+are both unchanged is not even parsed; otherwise each namespace is hashed
+on both sides and only namespaces whose hashes changed are compared again.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+from locale_manifest import hash_file, hash_payload, load_cache, save_cache
+from validate_locales import REFERENCE, kind, placeholders
+
+COVERAGE_CACHE = ".cache/locales/coverage.json"
+COVERAGE_VERSION = 1
+COUNTS = ("keys", "missing", "identical", "placeholders")
+
+
+def compare(reference, tree):
+    """Counts for one namespace: reference is the en subtree, tree the language's (None if absent)."""
+    counts = dict.fromkeys(COUNTS, 0)
+    stack = [(reference, tree)]
+    while stack:
+        expected, actual = stack.pop()
+        if isinstance(expected, dict):
+            actual = actual if isinstance(actual, dict) else {}
+            stack.extend((value, actual.get(key)) for key, value in expected.items())
+        elif isinstance(expected, list):
+            actual = actual if isinstance(actual, list) else []
+            stack.extend(
+                (value, actual[i] if i < len(actual) else None) for i, value in enumerate(expected)
+            )
+        else:
+            counts["keys"] += 1
+            if kind(actual) != kind(expected):
+                counts["missing"] += 1
+            elif isinstance(expected, str):
+                if actual == expected and any(char.isalpha() for char in expected):
+                    counts["identical"] += 1
+                elif placeholders(actual) != placeholders(expected):
+                    counts["placeholders"] += 1
+    return counts
+
+
+def coverage(counts):
+    if not counts["keys"]:
+        return 1.0
+    translated = counts["keys"] - counts["missing"] - counts["identical"] - counts["placeholders"]
+    return translated / counts["keys"]
+
+
+class CoverageCache:
+    """lang -> {"file", "reference", "namespaces": {ns: {"hashes": [en, lang], "counts"}}}."""
+
+    def __init__(self, path=COVERAGE_CACHE, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path=COVERAGE_CACHE):
+        data = load_cache(path, COVERAGE_VERSION)
+        return cls(path, data.get("entries", {}) if data else None)
+
+    def save(self):
+        save_cache(self.path, {"version": COVERAGE_VERSION, "entries": dict(sorted(self.entries.items()))})
+
+
+def build_matrix(languages, locales_dir=LOCALES_DIR, cache=None):
+    """Return ({lang: {namespace: counts}}, {"parsed": n, "compared": n, "reused": n})."""
+    cache = cache if cache is not None else CoverageCache(None)
+    stats = {"parsed": 0, "compared": 0, "reused": 0}
+    reference_path = locale_path(REFERENCE, locales_dir)
+    reference_hash = hash_file(reference_path)
+    reference = None
+    reference_hashes = None
+    matrix = {}
+    for lang in languages:
+        if lang == REFERENCE:
+            continue
+        path = locale_path(lang, locales_dir)
+        file_hash = hash_file(path)
+        entry = cache.entries.get(lang)
+        if entry and entry["file"] == file_hash and entry["reference"] == reference_hash:
+            matrix[lang] = {ns: item["counts"] for ns, item in entry["namespaces"].items()}
+            stats["reused"] += len(entry["namespaces"])
+            continue
+        if reference is None:
+            with open(reference_path, "r", encoding="utf-8") as f:
+                reference = json.load(f)
+            reference_hashes = {ns: hash_payload(subtree) for ns, subtree in reference.items()}
+        with open(path, "r", encoding="utf-8") as f:
+            tree = json.load(f)
+        stats["parsed"] += 1
+        previous = entry["namespaces"] if entry else {}
+        namespaces = {}
+        for ns, subtree in reference.items():
+            hashes = [reference_hashes[ns], hash_payload(tree.get(ns))]
+            item = previous.get(ns)
+            if item and item["hashes"] == hashes:
+                stats["reused"] += 1
+            else:
+                item = {"hashes": hashes, "counts": compare(subtree, tree.get(ns))}
+                stats["compared"] += 1
+            namespaces[ns] = item
+        cache.entries[lang] = {"file": file_hash, "reference": reference_hash, "namespaces": namespaces}
+        matrix[lang] = {ns: item["counts"] for ns, item in namespaces.items()}
+    for lang in set(cache.entries) - set(matrix):
+        # Languages not asked for this time keep their entry unless the file is gone.
+        if not os.path.exists(locale_path(lang, locales_dir)):
+            del cache.entries[lang]
+    return matrix, stats
+
+
+def totals(row):
+    total = dict.fromkeys(COUNTS, 0)
+    for counts in row.values():
+        for name in COUNTS:
+            total[name] += counts[name]
+    return total
+
+
+def report(matrix):
+    return {
+        "reference": REFERENCE,
+        "languages": {
+            lang: {
+                "total": {**totals(row), "coverage": round(coverage(totals(row)), 4)},
+                "namespaces": {
+                    ns: {**counts, "coverage": round(coverage(counts), 4)} for ns, counts in row.items()
+                },
+            }
+            for lang, row in matrix.items()
+        },
+    }
+
+
+def _percent(counts):
+    # Rounded down, so 100 means complete.
+    return str(int(coverage(counts) * 100))
+
+
+def print_table(matrix):
+    """Coverage % per namespace (rows) and language (columns), then the totals."""
+    languages = list(matrix)
+    namespaces = list(next(iter(matrix.values()), {}))
+    width = max([len(ns) for ns in namespaces] + [len("placeholders")])
+
+    def line(label, cells):
+        print(label.ljust(width) + "".join(cell.rjust(5) for cell in cells))
+
+    line("", languages)
+    for ns in namespaces:
+        cells = []
+        for lang in languages:
+            counts = matrix[lang][ns]
+            cells.append("-" if counts["keys"] and counts["missing"] == counts["keys"] else _percent(counts))
+        line(ns, cells)
+    line("total %", [_percent(totals(matrix[lang])) for lang in languages])
+    for name in COUNTS[1:]:
+        line(name, [str(totals(matrix[lang])[name]) for lang in languages])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Translation coverage per namespace and language.")
+    parser.add_argument("languages", nargs="*", help="only these languages (default: all)")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    parser.add_argument("--cache", default=COVERAGE_CACHE, help="coverage cache location")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the cache")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    languages = args.languages or locale_languages(args.locales_dir)
+    cache = None if args.no_cache else CoverageCache.load(args.cache)
+    matrix, stats = build_matrix(languages, args.locales_dir, cache)
+    if cache is not None and (stats["parsed"] or not os.path.exists(args.cache)):
+        cache.save()
+
+    if args.json:
+        print(json.dumps(report(matrix), ensure_ascii=False, indent=2))
+    elif matrix:
+        print_table(matrix)
+        print(f"({stats['compared']} namespaces compared, {stats['reused']} from cache)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
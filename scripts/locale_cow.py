@@ -0,0 +1,97 @@
+"""Copy-on-write merge with structural sharing of update subtrees.
+
+freeze() turns a payload into read-only FrozenDict/FrozenList nodes once.
+cow_merge() then links those nodes straight into each target tree instead
+of rebuilding or deep-copying them, so one payload applied to many trees
+is stored once. A target node that is itself shared (frozen) is copied one
+level deep only when an update actually changes it; its untouched
+children stay shared.
+
+A tree that has been through cow_merge() may contain shared nodes, so
+update it only with cow_merge(). locale_merge.merge() writes into nodes
+in place and raises TypeError on the first shared one, possibly after
+part of the payload has been applied.
+"""
+
+from locale_merge import same_value
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is shared between locale trees and cannot be modified")
+
+
+class FrozenDict(dict):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value):
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+_MISSING = object()
+
+
+def _merge(node, updates):
+    out = node
+    changed = False
+    for key, value in updates.items():
+        old = node.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old, dict):
+            new, child_changed = _merge(old, value)
+            if not child_changed:
+                continue
+        elif old is not _MISSING and same_value(old, value):
+            continue
+        else:
+            new = value
+        if out is node and isinstance(node, FrozenDict):
+            out = dict(node)
+        out[key] = new
+        changed = True
+    return out, changed
+
+
+def cow_merge(target, updates):
+    """Merge updates into the mutable dict target; return True if it changed.
+
+    Produces the same tree as locale_merge.merge, but subtrees taken from
+    the payload are shared rather than copied.
+    """
+    if isinstance(target, FrozenDict):
+        raise TypeError("cow_merge needs a mutable root; use dict(target)")
+    _, changed = _merge(target, freeze(updates))
+    return changed
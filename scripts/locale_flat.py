@@ -0,0 +1,51 @@
+"""Pre-flattened locale bundles: {"featuresPage.heroTitle": "..."}.
+
+With a flat bundle, t(key) becomes a single hash lookup instead of
+key.split(".") and a walk down the nested tree. Objects are flattened
+down to their leaves. Arrays are kept whole as the value at their path
+(t("blog.posts") returns the list), so unflatten() restores the original
+tree exactly. Whole-object lookups such as t("locationSpotlight") have no
+entry and still need the nested bundle.
+"""
+
+import os
+
+from locale_codec import dump_locale
+from locale_commit import write_outputs
+
+SEPARATOR = "."
+FLAT_DIR = "flat"
+
+
+def flatten(tree, sep=SEPARATOR):
+    flat = {}
+    stack = [(iter(tree.items()), "")]
+    while stack:
+        items, prefix = stack[-1]
+        for key, value in items:
+            if sep in key:
+                raise ValueError(f"key {prefix + key!r} contains the separator {sep!r}")
+            if isinstance(value, dict) and value:
+                stack.append((iter(value.items()), f"{prefix}{key}{sep}"))
+                break
+            flat[prefix + key] = value
+        else:
+            stack.pop()
+    return flat
+
+
+def unflatten(flat, sep=SEPARATOR):
+    tree = {}
+    for path, value in flat.items():
+        node = tree
+        *parents, leaf = path.split(sep)
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return tree
+
+
+def emit_flat(locales, out_dir, dump=dump_locale):
+    directory = os.path.join(out_dir, FLAT_DIR)
+    outputs = {os.path.join(directory, f"{lang}.json"): dump(flatten(locales[lang])) for lang in locales}
+    return write_outputs(outputs, directory)
@@ -0,0 +1,132 @@
+"""Cross-locale string interning.
+
+Values that occur more than once across all locale files (slugs, dates,
+icon names, routes, brand strings...) are stored once in
+interned/strings.json. Every occurrence in interned/<lang>.json is replaced
+by its integer index in that table. A string is only interned when that
+makes the output shorter, so single occurrences and strings shorter than
+their index stay inline. Real numbers are wrapped as
+{"$n": value} so they cannot be mistaken for indices. decode() restores
+the original tree, including key order.
+"""
+
+import gzip
+import json
+import os
+from collections import Counter
+
+from locale_codec import dump_compact
+from locale_commit import write_outputs
+
+INTERNED_DIR = "interned"
+TABLE_NAME = "strings.json"
+REPORT_NAME = "report.json"
+NUMBER_KEY = "$n"
+
+
+def _strings(value):
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+def build_table(trees):
+    """Strings worth interning, most frequent first (ties by first appearance)."""
+    counts = Counter()
+    for tree in trees:
+        counts.update(_strings(tree))
+    table = []
+    for text, count in counts.most_common():
+        if count < 2:
+            break
+        inline = len(json.dumps(text, ensure_ascii=False))
+        # Each use shrinks to the index; the table pays for one copy plus a comma.
+        if count * (inline - len(str(len(table)))) > inline + 1:
+            table.append(text)
+    return table
+
+
+def encode(value, index):
+    if isinstance(value, str):
+        return index.get(value, value)
+    if isinstance(value, dict):
+        if len(value) == 1 and NUMBER_KEY in value:
+            raise ValueError(f"cannot intern an object whose only key is {NUMBER_KEY!r}")
+        return {key: encode(item, index) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode(item, index) for item in value]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {NUMBER_KEY: value}
+    return value
+
+
+def decode(value, table):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return table[value]
+    if isinstance(value, dict):
+        if len(value) == 1 and NUMBER_KEY in value:
+            return value[NUMBER_KEY]
+        return {key: decode(item, table) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item, table) for item in value]
+    return value
+
+
+def _sizes(data):
+    return {"raw": len(data), "gzip": len(gzip.compress(data, 9, mtime=0))}
+
+
+def emit_interned(locales, out_dir):
+    directory = os.path.join(out_dir, INTERNED_DIR)
+    trees = {lang: locales[lang] for lang in locales}
+    table = build_table(trees.values())
+    index = {text: i for i, text in enumerate(table)}
+
+    table_data = dump_compact(table)
+    report = {"strings": len(table), "table": _sizes(table_data), "languages": {}}
+    outputs = {os.path.join(directory, TABLE_NAME): table_data}
+    totals = {"before_raw": 0, "before_gzip": 0, "after_raw": 0, "after_gzip": 0}
+    for lang, tree in trees.items():
+        encoded = encode(tree, index)
+        data = dump_compact(encoded)
+        if dump_compact(decode(json.loads(data), table)) != dump_compact(tree):
+            raise AssertionError(f"{lang}: interned form does not round-trip")
+        before = _sizes(dump_compact(tree))
+        after = _sizes(data)
+        report["languages"][lang] = {
+            "before": before,
+            "after": after,
+            "saved_raw": before["raw"] - after["raw"],
+            "saved_gzip": before["gzip"] - after["gzip"],
+        }
+        totals["before_raw"] += before["raw"]
+        totals["before_gzip"] += before["gzip"]
+        totals["after_raw"] += after["raw"]
+        totals["after_gzip"] += after["gzip"]
+        outputs[os.path.join(directory, f"{lang}.json")] = data
+    # The table is shipped once, so it is charged once against the total.
+    totals["after_raw"] += report["table"]["raw"]
+    totals["after_gzip"] += report["table"]["gzip"]
+    report["total"] = totals
+    outputs[os.path.join(directory, REPORT_NAME)] = (
+        json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    ).encode("utf-8")
+
+    stats = write_outputs(outputs, directory)
+    stats["saved_raw"] = totals["before_raw"] - totals["after_raw"]
+    stats["saved_gzip"] = totals["before_gzip"] - totals["after_gzip"]
+    return stats
+
+
+def load_interned(directory, lang):
+    """Read interned/<lang>.json back into the plain locale tree."""
+    with open(os.path.join(directory, TABLE_NAME), "r", encoding="utf-8") as f:
+        table = json.load(f)
+    with open(os.path.join(directory, f"{lang}.json"), "r", encoding="utf-8") as f:
+        return decode(json.load(f), table)
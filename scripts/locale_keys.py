@@ -0,0 +1,286 @@
+"""Cross-locale key index.
+
+A trie over every key path of every locale file. Each node carries a
+bitmap of the languages that have its path (bit i is languages[i]), so
+per-path questions cost one walk down the path:
+
+    python scripts/locale_keys.py languages contactPage.form.securityQuestion
+    python scripts/locale_keys.py only uk        # paths no other language has
+    python scripts/locale_keys.py missing de     # en paths de lacks
+    python scripts/locale_keys.py extra de       # de paths en lacks
+
+Paths are written as validate_locales.format_path() prints them, with
+array items as [i]. Each node also keeps the bitmap of languages that have
+the node but lack something below it, so the whole-tree queries only
+descend into subtrees that can hold an answer, and report the topmost path
+of each.
+
+The index is cached in KEY_INDEX together with the content hash of every
+file it was built from, the same sha256 the update manifest records. On
+load only the languages whose hash changed are re-walked.
+"""
+
+import argparse
+import json
+import re
+import sys
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+from locale_manifest import hash_file, load_cache, save_cache
+from validate_locales import REFERENCE, format_path
+
+KEY_INDEX = ".cache/locales/keys.json"
+KEY_INDEX_VERSION = 1
+
+_SEGMENT = re.compile(r"\[(\d+)\]|\.?([^.\[]+)")
+
+
+def parse_path(text):
+    """Inverse of format_path(): "a.b[1].c" -> ("a", "b", 1, "c")."""
+    path = []
+    pos = 0
+    while pos < len(text):
+        match = _SEGMENT.match(text, pos)
+        if match is None or (match.group(2) is not None and pos and text[pos] != "."):
+            raise ValueError(f"malformed key path {text!r}")
+        index, key = match.groups()
+        path.append(int(index) if index is not None else key)
+        pos = match.end()
+    return tuple(path)
+
+
+class KeyNode:
+    __slots__ = ("mask", "incomplete", "children")
+
+    def __init__(self):
+        self.mask = 0
+        # Languages that have this node but miss one of its descendants.
+        self.incomplete = 0
+        self.children = {}
+
+
+class KeyIndex:
+    def __init__(self, languages=(), reference=REFERENCE):
+        self.languages = list(languages)
+        self.reference = reference
+        self.hashes = {}
+        self.root = KeyNode()
+
+    def bit(self, lang):
+        return 1 << self.languages.index(lang)
+
+    def names(self, mask):
+        return [lang for i, lang in enumerate(self.languages) if mask >> i & 1]
+
+    def add(self, lang, tree):
+        if lang not in self.languages:
+            self.languages.append(lang)
+        bit = self.bit(lang)
+        self.root.mask |= bit
+        stack = [(self.root, tree)]
+        while stack:
+            node, value = stack.pop()
+            if isinstance(value, dict):
+                items = value.items()
+            elif isinstance(value, list):
+                items = enumerate(value)
+            else:
+                continue
+            for segment, child in items:
+                child_node = node.children.get(segment)
+                if child_node is None:
+                    child_node = node.children[segment] = KeyNode()
+                child_node.mask |= bit
+                stack.append((child_node, child))
+
+    def remove(self, lang):
+        """Clear lang from every node; nodes no language has any more are dropped."""
+        bit = self.bit(lang)
+        self.root.mask &= ~bit
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            for segment, child in list(node.children.items()):
+                if not child.mask & bit:
+                    continue
+                child.mask &= ~bit
+                if child.mask:
+                    stack.append(child)
+                else:
+                    del node.children[segment]
+
+    def finish(self):
+        """Recompute the incomplete bitmaps after add() and remove() calls."""
+        order = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        for node in reversed(order):
+            incomplete = 0
+            for child in node.children.values():
+                incomplete |= child.incomplete | (node.mask & ~child.mask)
+            node.incomplete = incomplete
+
+    def find(self, path):
+        node = self.root
+        for segment in path:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def _mask(self, path):
+        node = self.find(parse_path(path) if isinstance(path, str) else path)
+        return 0 if node is None else node.mask
+
+    def present(self, path):
+        return self.names(self._mask(path))
+
+    def missing(self, path):
+        return self.names(self.root.mask & ~self._mask(path))
+
+    def extra(self, path):
+        """Languages that have path although the reference language does not."""
+        mask = self._mask(path)
+        if mask & self.bit(self.reference):
+            return []
+        return self.names(mask)
+
+    def count(self, path):
+        return bin(self._mask(path)).count("1")
+
+    def _topmost(self, want, descend):
+        """Topmost paths whose node satisfies want(mask), visiting only nodes where descend(node)."""
+        found = []
+        stack = [((), self.root)]
+        while stack:
+            path, node = stack.pop()
+            for segment, child in node.children.items():
+                if want(child.mask):
+                    found.append(path + (segment,))
+                elif descend(child):
+                    stack.append((path + (segment,), child))
+        found.sort(key=format_path)
+        return [format_path(path) for path in found]
+
+    def only_in(self, lang):
+        bit = self.bit(lang)
+        # Every other language on a node must lose it somewhere below.
+        return self._topmost(
+            lambda mask: mask == bit,
+            lambda node: node.mask & bit and not (node.mask & ~bit & ~node.incomplete),
+        ) if self.root.mask & bit else []
+
+    def missing_paths(self, lang):
+        """Topmost reference paths lang lacks."""
+        bit, ref = self.bit(lang), self.bit(self.reference)
+        return self._topmost(
+            lambda mask: mask & ref and not mask & bit,
+            lambda node: node.mask & bit and node.incomplete & bit,
+        )
+
+    def extra_paths(self, lang):
+        """Topmost paths lang has and the reference lacks."""
+        bit, ref = self.bit(lang), self.bit(self.reference)
+        return self._topmost(
+            lambda mask: mask & bit and not mask & ref,
+            lambda node: node.mask & bit and node.incomplete & ref,
+        )
+
+    def to_json(self):
+        def encode(node):
+            return [node.mask, [[segment, encode(child)] for segment, child in node.children.items()]]
+
+        return {
+            "version": KEY_INDEX_VERSION,
+            "reference": self.reference,
+            "languages": self.languages,
+            "hashes": self.hashes,
+            "trie": encode(self.root),
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        index = cls(data["languages"], data["reference"])
+        index.hashes = data["hashes"]
+        stack = [(index.root, data["trie"])]
+        while stack:
+            node, (mask, children) = stack.pop()
+            node.mask = mask
+            for segment, child in children:
+                node.children[segment] = KeyNode()
+                stack.append((node.children[segment], child))
+        index.finish()
+        return index
+
+
+def _load_cached(path, reference):
+    data = load_cache(path, KEY_INDEX_VERSION)
+    if data is None or data.get("reference") != reference:
+        return None
+    return KeyIndex.from_json(data)
+
+
+def load_index(locales_dir=LOCALES_DIR, cache_path=KEY_INDEX, reference=REFERENCE):
+    """Return (index, languages re-walked), refreshing and saving the cache as needed."""
+    languages = locale_languages(locales_dir)
+    hashes = {lang: hash_file(locale_path(lang, locales_dir)) for lang in languages}
+    index = _load_cached(cache_path, reference) if cache_path else None
+    if index is None or set(index.languages) != set(languages):
+        # Bits are positional, so a new or deleted file means a rebuild.
+        index = KeyIndex(languages, reference)
+    changed = [lang for lang in languages if index.hashes.get(lang) != hashes[lang]]
+    if not changed:
+        return index, changed
+    for lang in changed:
+        if lang in index.hashes:
+            index.remove(lang)
+        with open(locale_path(lang, locales_dir), "r", encoding="utf-8") as f:
+            index.add(lang, json.load(f))
+        index.hashes[lang] = hashes[lang]
+    index.finish()
+    if cache_path:
+        save_cache(cache_path, index.to_json(), ensure_ascii=False, separators=(",", ":"))
+    return index, changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query key paths across every locale file.")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    parser.add_argument("--cache", default=KEY_INDEX, help="index cache location")
+    parser.add_argument("--no-cache", action="store_true", help="build the index in memory only")
+    parser.add_argument("--json", action="store_true", help="print the answer as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("languages", help="which languages have and lack PATH").add_argument("path")
+    for name, what in (
+        ("only", "paths no language but LANG has"),
+        ("missing", f"{REFERENCE} paths LANG lacks"),
+        ("extra", f"LANG paths {REFERENCE} lacks"),
+    ):
+        commands.add_parser(name, help=what).add_argument("lang")
+    args = parser.parse_args(argv)
+
+    index, _ = load_index(args.locales_dir, None if args.no_cache else args.cache)
+    if args.command == "languages":
+        answer = {"present": index.present(args.path), "missing": index.missing(args.path)}
+    else:
+        if args.lang not in index.languages:
+            parser.error(f"no locale file for {args.lang!r}")
+        query = {"only": index.only_in, "missing": index.missing_paths, "extra": index.extra_paths}
+        answer = query[args.command](args.lang)
+
+    if args.json:
+        print(json.dumps(answer, ensure_ascii=False, indent=2))
+    elif args.command == "languages":
+        for label, langs in answer.items():
+            print(f"{label}: {', '.join(langs) or '-'}")
+    else:
+        for path in answer:
+            print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+
+from locale_commit import temp_beside
+
+MANIFEST_PATH = ".cache/locales/manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path, chunk_size=1 << 16):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_payload(updates):
+    # Key order is significant: merge appends new keys in payload order.
+    text = json.dumps(updates, ensure_ascii=False, separators=(",", ":"))
+    return hash_bytes(text.encode("utf-8"))
+
+
+def load_cache(path, version):
+    """The JSON object saved at path, or None if it is missing, unreadable or another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
+
+
+def save_cache(path, data, **options):
+    """json.dump data to path through a temp file of its own, then rename it into place."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, tmp = temp_beside(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **options)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def variant_hash(payload_hash, order, reference, keyed):
+    # Folded into the manifest entry so that switching orders or keyed
+    # paths re-merges files the payload alone would skip.
+    if order == "source" and not keyed:
+        return payload_hash
+    variant = [payload_hash, order, hash_payload(reference), sorted((keyed or {}).items())]
+    return hash_payload(variant)
+
+
+class Manifest:
+    """Content hashes of every locale file and of the payload last merged into it."""
+
+    def __init__(self, path=MANIFEST_PATH, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        data = load_cache(path, MANIFEST_VERSION)
+        return cls(path, data.get("entries", {}) if data else None)
+
+    def get(self, locale_file):
+        entry = self.entries.get(locale_file)
+        if entry is None:
+            return None
+        return entry["file"], entry["payload"]
+
+    def record(self, locale_file, file_hash, payload_hash):
+        self.entries[locale_file] = {"file": file_hash, "payload": payload_hash}
+
+    def forget(self, locale_file):
+        self.entries.pop(locale_file, None)
+
+    def save(self):
+        save_cache(
+            self.path,
+            {"version": MANIFEST_VERSION, "entries": dict(sorted(self.entries.items()))},
+            indent=2,
+        )
@@ -0,0 +1,140 @@
+"""The merge rules shared by every update path.
+
+merge() folds an update payload into a locale tree: objects merge key by
+key and any other value replaces what was there. Arrays are replaced
+whole, unless their dotted path is listed in `keyed` (path -> identity
+field, e.g. {"blog.posts": "slug"}). Such an array is merged record by
+record with merge_keyed(): each update record is matched to the existing
+record with the same identity through a hash index, merged into it, and
+records the update does not mention are left untouched. Unmatched update
+records are appended.
+"""
+
+from copy import deepcopy
+
+SEPARATOR = "."
+
+
+class KeyedMergeError(ValueError):
+    pass
+
+
+def _kind(value):
+    if isinstance(value, dict):
+        return dict
+    if isinstance(value, list):
+        return list
+    return type(value)
+
+
+def same_value(old, new):
+    """True if old == new with the same JSON type at every level and the same key order.
+
+    Plain == treats True as 1 and 1.0 as 1 at any depth, and ignores key
+    order, so a changed value would be kept or left out of a diff.
+    """
+    if _kind(old) is not _kind(new):
+        return False
+    if not isinstance(old, (dict, list)):
+        return old == new
+    stack = [(old, new)]
+    while stack:
+        a, b = stack.pop()
+        kind = _kind(a)
+        if kind is not _kind(b):
+            return False
+        if kind is dict:
+            if len(a) != len(b) or list(a) != list(b):
+                return False
+            stack.extend(zip(a.values(), b.values()))
+        elif kind is list:
+            if len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+        elif a != b:
+            return False
+    return True
+
+
+def merge(target, updates, counts=None, keyed=None, prefix=""):
+    """Merge updates into target in place; return True if target changed.
+
+    counts, if given, is a dict whose "added" and "overwritten" entries are
+    incremented for each leaf created and each existing value replaced.
+    """
+    changed = False
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            node = target.get(key)
+            if isinstance(node, dict):
+                if keyed:
+                    changed = merge(node, value, counts, keyed, prefix + key + SEPARATOR) or changed
+                else:
+                    changed = merge(node, value, counts) or changed
+            elif key in target:
+                target[key] = deepcopy(value)
+                changed = True
+                if counts is not None:
+                    counts["overwritten"] += 1
+            else:
+                merge(target.setdefault(key, {}), value, counts)
+                changed = True
+        elif key not in target:
+            target[key] = value
+            changed = True
+            if counts is not None:
+                counts["added"] += 1
+        elif keyed and isinstance(value, list) and prefix + key in keyed and isinstance(target[key], list):
+            changed = merge_keyed(target[key], value, keyed[prefix + key], counts, prefix + key) or changed
+        elif not same_value(target[key], value):
+            target[key] = value
+            changed = True
+            if counts is not None:
+                counts["overwritten"] += 1
+    return changed
+
+
+def _identity(record, field, path, where):
+    if not isinstance(record, dict) or field not in record:
+        raise KeyedMergeError(f"{path}: {where} record without {field!r}: {record!r:.80}")
+    identity = record[field]
+    if isinstance(identity, (dict, list)):
+        raise KeyedMergeError(f"{path}: {field!r} must be a string or number, got {identity!r:.80}")
+    return type(identity), identity
+
+
+def merge_keyed(items, updates, field, counts=None, path="?"):
+    """Merge the records in updates into the list items by their field value; return True if items changed."""
+    index = {}
+    for i, item in enumerate(items):
+        identity = _identity(item, field, path, "existing")
+        if identity in index:
+            raise KeyedMergeError(f"{path}: duplicate {field} {identity[1]!r}")
+        index[identity] = i
+    changed = False
+    seen = set()
+    for update in updates:
+        identity = _identity(update, field, path, "update")
+        if identity in seen:
+            raise KeyedMergeError(f"{path}: duplicate {field} {identity[1]!r} in the update")
+        seen.add(identity)
+        i = index.get(identity)
+        if i is None:
+            items.append(update)
+            changed = True
+            if counts is not None:
+                counts["added"] += 1
+        else:
+            changed = merge(items[i], update, counts) or changed
+    return changed
+
+
+def parse_keyed(specs):
+    """["blog.posts=slug", ...] -> {"blog.posts": "slug", ...}"""
+    keyed = {}
+    for spec in specs or ():
+        path, sep, field = spec.partition("=")
+        if not sep or not path or not field:
+            raise ValueError(f"expected PATH=FIELD, got {spec!r}")
+        keyed[path] = field
+    return keyed
@@ -0,0 +1,353 @@
+"""Precompiled ICU messages.
+
+Every locale string that contains a brace is parsed once, at build time,
+into a token array, and messages/<lang>.json maps its path (as printed by
+validate_locales.format_path) to that array:
+
+    "Discover more about {section}."   ["Discover more about ", ["a", "section"], "."]
+    "{n, plural, =0 {none} one {# min} other {# mins}}"
+        [["p", "n", 0, {"=0": ["none"], "one": [["#"], " min"], "other": [["#"], " mins"]}]]
+
+Tokens are a literal string, ["a", name] for an argument, ["#"] for the
+number inside a plural branch, ["p", name, offset, branches] for a plural
+and ["s", name, branches] for a select. Quoting follows ICU: '' is an
+apostrophe, and an apostrophe directly before {, } (or # inside a plural)
+starts a quoted literal up to the next single apostrophe; any other
+apostrophe is literal, so "l'équipe" needs no escaping.
+
+A message that does not parse fails the build with every error listed.
+format_message() evaluates a compiled message the way the site would, with
+CLDR plural rules for the languages in src/locales.
+"""
+
+import os
+
+from locale_codec import dump_compact
+from locale_commit import write_outputs
+from validate_locales import format_path
+
+MESSAGES_DIR = "messages"
+CATEGORIES = ("zero", "one", "two", "few", "many", "other")
+
+_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+
+class MessageError(ValueError):
+    pass
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def error(self, reason):
+        raise MessageError(f"{reason} at offset {self.pos} in {self.text!r}")
+
+    def peek(self):
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def skip_space(self):
+        while self.peek().isspace():
+            self.pos += 1
+
+    def name(self, what):
+        self.skip_space()
+        start = self.pos
+        while self.peek() in _NAME_CHARS:
+            self.pos += 1
+        if start == self.pos:
+            self.error(f"expected {what}")
+        return self.text[start:self.pos]
+
+    def expect(self, char):
+        self.skip_space()
+        if self.peek() != char:
+            self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def message(self, in_plural, nested):
+        """Tokens up to the closing brace of a branch (nested) or the end of the text."""
+        tokens = []
+        literal = []
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "'":
+                following = text[self.pos + 1:self.pos + 2]
+                if following == "'":
+                    literal.append("'")
+                    self.pos += 2
+                    continue
+                if following in ("{", "}") or (in_plural and following == "#"):
+                    end = self.pos + 1
+                    quoted = []
+                    while True:
+                        close = text.find("'", end)
+                        if close == -1:
+                            self.error("unterminated quote")
+                        quoted.append(text[end:close])
+                        if text[close + 1:close + 2] != "'":
+                            break
+                        quoted.append("'")
+                        end = close + 2
+                    literal.append("".join(quoted))
+                    self.pos = close + 1
+                    continue
+                literal.append(char)
+                self.pos += 1
+            elif char == "{":
+                if literal:
+                    tokens.append("".join(literal))
+                    literal = []
+                self.pos += 1
+                tokens.append(self.argument(in_plural))
+            elif char == "}":
+                if not nested:
+                    self.error("unmatched '}'")
+                break
+            elif char == "#" and in_plural:
+                if literal:
+                    tokens.append("".join(literal))
+                    literal = []
+                tokens.append(["#"])
+                self.pos += 1
+            else:
+                literal.append(char)
+                self.pos += 1
+        else:
+            if nested:
+                self.error("unclosed branch")
+        if literal:
+            tokens.append("".join(literal))
+        return tokens
+
+    def argument(self, in_plural):
+        name = self.name("an argument name")
+        self.skip_space()
+        if self.peek() == "}":
+            self.pos += 1
+            return ["a", name]
+        self.expect(",")
+        kind = self.name("an argument type")
+        if kind not in ("plural", "select"):
+            self.error(f"unsupported argument type {kind!r}")
+        self.expect(",")
+        offset = 0
+        if kind == "plural":
+            self.skip_space()
+            if self.text.startswith("offset:", self.pos):
+                self.pos += len("offset:")
+                value = self.name("an offset")
+                if not value.isdigit():
+                    self.error(f"offset {value!r} is not a number")
+                offset = int(value)
+        branches = {}
+        while True:
+            self.skip_space()
+            if self.peek() == "}":
+                self.pos += 1
+                break
+            if kind == "plural" and self.peek() == "=":
+                self.pos += 1
+                value = self.name("an exact value")
+                if not value.isdigit():
+                    self.error(f"exact value ={value} is not a number")
+                selector = f"={value}"
+            else:
+                selector = self.name("a selector or '}'")
+                if kind == "plural" and selector not in CATEGORIES:
+                    self.error(f"unknown plural category {selector!r}")
+            if selector in branches:
+                self.error(f"duplicate selector {selector!r}")
+            self.expect("{")
+            # A select inside a plural branch still renders the plural's #.
+            branches[selector] = self.message(kind == "plural" or in_plural, nested=True)
+            self.pos += 1
+        if "other" not in branches:
+            self.error(f"{kind} {name!r} has no 'other' branch")
+        if kind == "plural":
+            return ["p", name, offset, branches]
+        return ["s", name, branches]
+
+
+def compile_message(text):
+    """Token array for one message; raises MessageError if it does not parse."""
+    return _Parser(text).message(in_plural=False, nested=False)
+
+
+def is_message(text):
+    return "{" in text or "}" in text
+
+
+def compile_tree(tree):
+    """Return ({path: tokens}, [(path, error)]) for every message in a locale tree."""
+    messages = {}
+    errors = []
+    stack = [((), tree)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend((path + (key,), child) for key, child in reversed(value.items()))
+        elif isinstance(value, list):
+            stack.extend((path + (i,), child) for i, child in reversed(list(enumerate(value))))
+        elif isinstance(value, str) and is_message(value):
+            try:
+                messages[format_path(path)] = compile_message(value)
+            except MessageError as exc:
+                errors.append((format_path(path), str(exc)))
+    return messages, errors
+
+
+# CLDR plural rules. n is the absolute value, i its integer part, v the
+# number of visible fraction digits.
+
+
+def _other(n, i, v):
+    return "other"
+
+
+def _one_i1(n, i, v):
+    return "one" if i == 1 and v == 0 else "other"
+
+
+def _one_n1(n, i, v):
+    return "one" if n == 1 else "other"
+
+
+def _millions(i, v):
+    return v == 0 and i != 0 and i % 1000000 == 0
+
+
+def _es(n, i, v):
+    if n == 1:
+        return "one"
+    return "many" if _millions(i, v) else "other"
+
+
+def _one_i01(n, i, v):
+    if i in (0, 1):
+        return "one"
+    return "many" if _millions(i, v) else "other"
+
+
+def _cs(n, i, v):
+    if v:
+        return "many"
+    if i == 1:
+        return "one"
+    return "few" if 2 <= i <= 4 else "other"
+
+
+def _east_slavic(n, i, v):
+    if v:
+        return "other"
+    if i % 10 == 1 and i % 100 != 11:
+        return "one"
+    if 2 <= i % 10 <= 4 and not 12 <= i % 100 <= 14:
+        return "few"
+    return "many"
+
+
+def _ar(n, i, v):
+    if n == 0:
+        return "zero"
+    if n == 1:
+        return "one"
+    if n == 2:
+        return "two"
+    if n == i:
+        if 3 <= i % 100 <= 10:
+            return "few"
+        if 11 <= i % 100 <= 99:
+            return "many"
+    return "other"
+
+
+PLURAL_RULES = {
+    "ar": _ar,
+    "az": _one_n1,
+    "cs": _cs,
+    "de": _one_i1,
+    "en": _one_i1,
+    "es": _es,
+    "fr": _one_i01,
+    "ja": _other,
+    "ko": _other,
+    "pt": _one_i01,
+    "ru": _east_slavic,
+    "tr": _one_n1,
+    "uk": _east_slavic,
+    "zh": _other,
+}
+
+
+def _number_text(n):
+    if isinstance(n, float) and n.is_integer():
+        return str(int(n))
+    return str(n)
+
+
+def plural_category(lang, n):
+    """CLDR plural category of the number n (or numeric string) in lang."""
+    if isinstance(n, str):
+        text = n.lstrip("-")
+        n = float(text) if "." in text else int(text)
+    else:
+        text = _number_text(abs(n))
+    n = abs(n)
+    i = int(n)
+    v = len(text.partition(".")[2]) if "e" not in text else 0
+    rule = PLURAL_RULES.get(lang.split("-")[0], _other)
+    return rule(n, i, v)
+
+
+def _render(tokens, values, lang, out, pound):
+    for token in tokens:
+        if isinstance(token, str):
+            out.append(token)
+            continue
+        kind = token[0]
+        if kind == "a":
+            value = values[token[1]]
+            out.append(value if isinstance(value, str) else _number_text(value))
+        elif kind == "#":
+            out.append(_number_text(pound))
+        elif kind == "p":
+            _, name, offset, branches = token
+            value = values[name]
+            number = float(value) if isinstance(value, str) else value
+            exact = f"={_number_text(number)}"
+            if exact in branches:
+                branch = branches[exact]
+            else:
+                branch = branches.get(plural_category(lang, number - offset), branches["other"])
+            _render(branch, values, lang, out, number - offset)
+        else:
+            _, name, branches = token
+            branch = branches.get(str(values[name]), branches["other"])
+            _render(branch, values, lang, out, pound)
+
+
+def format_message(tokens, values, lang="en"):
+    """Render a compiled message; a missing value raises KeyError."""
+    out = []
+    _render(tokens, values, lang, out, None)
+    return "".join(out)
+
+
+def emit_messages(locales, out_dir):
+    directory = os.path.join(out_dir, MESSAGES_DIR)
+    outputs = {}
+    errors = []
+    count = 0
+    for lang in locales:
+        messages, problems = compile_tree(locales[lang])
+        errors.extend(f"{lang}: {path}: {problem}" for path, problem in problems)
+        outputs[os.path.join(directory, f"{lang}.json")] = dump_compact(messages)
+        count += len(messages)
+    if errors:
+        raise MessageError("messages that do not parse:\n  " + "\n  ".join(errors))
+    stats = write_outputs(outputs, directory)
+    stats["messages"] = count
+    return stats
@@ -0,0 +1,26 @@
+"""Minified locale bundles.
+
+min/<lang>.json holds the whole locale and min/<lang>/<namespace>.json each
+top-level namespace, all without indentation or spaces after separators.
+That is the same data as src/locales and the chunks, at about 80% of the
+size before compression.
+"""
+
+import os
+
+from locale_codec import dump_compact
+from locale_commit import write_outputs
+
+MIN_DIR = "min"
+
+
+def emit_minified(locales, out_dir):
+    directory = os.path.join(out_dir, MIN_DIR)
+    outputs = {}
+    for lang in locales:
+        tree = locales[lang]
+        outputs[os.path.join(directory, f"{lang}.json")] = dump_compact(tree)
+        for namespace, subtree in tree.items():
+            outputs[os.path.join(directory, lang, f"{namespace}.json")] = dump_compact(subtree)
+    # Also drops namespaces (or languages) that no longer exist.
+    return write_outputs(outputs, directory)
@@ -0,0 +1,208 @@
+"""RFC 6902 JSON Patch support for locale files.
+
+merge_patch() turns an update payload into the minimal patch that takes a
+locale tree to what merge() would produce. It walks only the payload, so
+the cost follows the size of the update rather than the document. diff()
+computes a minimal patch between any two trees; applying it reproduces
+the target byte for byte, key order included. apply() executes a patch
+in place, at a cost of one pointer walk per operation.
+"""
+
+from copy import deepcopy
+
+from locale_merge import same_value
+
+
+class PatchError(ValueError):
+    pass
+
+
+def escape(key):
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def pointer(path):
+    return "".join("/" + escape(str(part)) for part in path)
+
+
+def parse_pointer(text):
+    if text == "":
+        return []
+    if not text.startswith("/"):
+        raise PatchError(f"invalid JSON pointer {text!r}")
+    return [unescape(token) for token in text[1:].split("/")]
+
+
+def diff(old, new, path=()):
+    """Minimal list of operations that turns old into new."""
+    ops = []
+    _diff(old, new, list(path), ops)
+    return ops
+
+
+def _diff(old, new, path, ops):
+    if same_value(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        # Removals keep the surviving keys in place and additions append, so
+        # a patch can only reach new's key order if it is that order already.
+        kept = [key for key in old if key in new]
+        if kept + [key for key in new if key not in old] != list(new):
+            ops.append({"op": "replace", "path": pointer(path), "value": new})
+            return
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": pointer(path + [key])})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, path + [key], ops)
+            else:
+                ops.append({"op": "add", "path": pointer(path + [key]), "value": value})
+    elif isinstance(old, list) and isinstance(new, list):
+        _diff_list(old, new, path, ops)
+    else:
+        ops.append({"op": "replace", "path": pointer(path), "value": new})
+
+
+def _diff_list(old, new, path, ops):
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and same_value(old[start], new[start]):
+        start += 1
+    end_old, end_new = len(old), len(new)
+    while end_old > start and end_new > start and same_value(old[end_old - 1], new[end_new - 1]):
+        end_old -= 1
+        end_new -= 1
+    common = min(end_old, end_new) - start
+    for offset in range(common):
+        index = start + offset
+        _diff(old[index], new[index], path + [index], ops)
+    index = start + common
+    for _ in range(end_old - start - common):
+        ops.append({"op": "remove", "path": pointer(path + [index])})
+    for offset in range(end_new - start - common):
+        ops.append({"op": "add", "path": pointer(path + [index + offset]), "value": new[index + offset]})
+
+
+def merge_patch(tree, updates, path=()):
+    """Patch that applies updates to tree with locale_merge.merge semantics."""
+    ops = []
+    _merge_patch(tree, updates, list(path), ops)
+    return ops
+
+
+def _merge_patch(node, updates, path, ops):
+    for key, value in updates.items():
+        child = path + [key]
+        if key not in node:
+            ops.append({"op": "add", "path": pointer(child), "value": value})
+            continue
+        old = node[key]
+        if isinstance(value, dict) and isinstance(old, dict):
+            _merge_patch(old, value, child, ops)
+        elif isinstance(value, list) and isinstance(old, list):
+            _diff_list(old, value, child, ops)
+        elif not same_value(old, value):
+            ops.append({"op": "replace", "path": pointer(child), "value": value})
+
+
+def _resolve(doc, tokens):
+    node = doc
+    for token in tokens:
+        node = _child(node, token)
+    return node
+
+
+def _child(node, token):
+    if isinstance(node, dict):
+        if token not in node:
+            raise PatchError(f"missing key {token!r}")
+        return node[token]
+    if isinstance(node, list):
+        return node[_index(node, token)]
+    raise PatchError(f"cannot descend into {type(node).__name__}")
+
+
+def _index(node, token, allow_end=False):
+    if token == "-" and allow_end:
+        return len(node)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise PatchError(f"invalid array index {token!r}")
+    index = int(token)
+    if index > len(node) or (index == len(node) and not allow_end):
+        raise PatchError(f"array index {index} out of range")
+    return index
+
+
+def _add(doc, tokens, value):
+    if not tokens:
+        return value
+    parent = _resolve(doc, tokens[:-1])
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        parent[last] = value
+    elif isinstance(parent, list):
+        parent.insert(_index(parent, last, allow_end=True), value)
+    else:
+        raise PatchError(f"cannot add to {type(parent).__name__}")
+    return doc
+
+
+def _remove(doc, tokens):
+    if not tokens:
+        raise PatchError("cannot remove the document root")
+    parent = _resolve(doc, tokens[:-1])
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise PatchError(f"missing key {last!r}")
+        return parent.pop(last)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, last))
+    raise PatchError(f"cannot remove from {type(parent).__name__}")
+
+
+def _replace(doc, tokens, value):
+    if not tokens:
+        return value
+    parent = _resolve(doc, tokens[:-1])
+    last = tokens[-1]
+    if isinstance(parent, dict):
+        if last not in parent:
+            raise PatchError(f"missing key {last!r}")
+        parent[last] = value
+    elif isinstance(parent, list):
+        parent[_index(parent, last)] = value
+    else:
+        raise PatchError(f"cannot replace in {type(parent).__name__}")
+    return doc
+
+
+def apply(doc, patch):
+    """Apply patch to doc in place and return the result (a new object if the root was replaced)."""
+    for op in patch:
+        name = op.get("op")
+        tokens = parse_pointer(op["path"])
+        if name == "add":
+            doc = _add(doc, tokens, deepcopy(op["value"]))
+        elif name == "remove":
+            _remove(doc, tokens)
+        elif name == "replace":
+            doc = _replace(doc, tokens, deepcopy(op["value"]))
+        elif name == "move":
+            source = parse_pointer(op["from"])
+            if tokens[: len(source)] == source and tokens != source:
+                raise PatchError("cannot move a value into one of its children")
+            doc = _add(doc, tokens, _remove(doc, source))
+        elif name == "copy":
+            doc = _add(doc, tokens, deepcopy(_resolve(doc, parse_pointer(op["from"]))))
+        elif name == "test":
+            if not same_value(_resolve(doc, tokens), op["value"]):
+                raise PatchError(f"test failed at {op['path']!r}")
+        else:
+            raise PatchError(f"unknown operation {name!r}")
+    return doc
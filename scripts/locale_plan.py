@@ -0,0 +1,130 @@
+"""Compile an update payload into a flat merge plan.
+
+merge() re-walks the nested payload and re-checks every node's type for
+each tree it is applied to. A MergePlan does that walk once: the payload
+becomes an ordered list of steps, and apply() runs them against any number
+of locale trees in a single loop without recursion.
+
+Each step is (op, depth, key, value). DESCEND makes the dict at key (under
+the node at depth - 1) the current node at depth, creating or replacing it
+when it is missing or not a dict. SET assigns a leaf. KEYED merges a list
+of records into the list at key by identity field (see
+locale_merge.merge_keyed), and acts like SET when there is no list there
+yet. Because steps are in payload pre-order, a plain list indexed by depth
+is enough to track the current path.
+"""
+
+from locale_manifest import hash_payload
+from locale_merge import SEPARATOR, merge_keyed, same_value
+
+DESCEND = "descend"
+SET = "set"
+KEYED = "keyed"
+
+_cache = {}
+CACHE_SIZE = 64
+
+
+class MergePlan:
+    __slots__ = ("steps", "paths", "depth")
+
+    def __init__(self, steps, paths, depth):
+        self.steps = steps
+        self.paths = paths
+        self.depth = depth
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        """Yield (op, dotted path, value) for inspection."""
+        for (op, _, _, value), path in zip(self.steps, self.paths):
+            yield op, ".".join(path), value
+
+    def __repr__(self):
+        sets = sum(1 for step in self.steps if step[0] is SET)
+        return f"<MergePlan {sets} sets, {len(self.steps) - sets} sections, depth {self.depth}>"
+
+    def apply(self, target, counts=None):
+        """Apply the plan to target in place; return True if it changed.
+
+        counts is filled in the same way as by locale_merge.merge.
+        """
+        nodes = [target] * (self.depth + 1)
+        changed = False
+        # Depth of a non-dict value a DESCEND replaced. merge() counts that
+        # as one overwrite, so the steps below it are not counted.
+        replaced = None
+        for op, depth, key, value in self.steps:
+            if replaced is not None and depth <= replaced:
+                replaced = None
+            tally = counts if replaced is None else None
+            node = nodes[depth - 1]
+            if op is KEYED:
+                field, value, path = value
+                if isinstance(node.get(key), list):
+                    changed = merge_keyed(node[key], value, field, tally, path) or changed
+                    continue
+                op = SET
+            if op is SET:
+                if key not in node:
+                    node[key] = value
+                    changed = True
+                    if tally is not None:
+                        tally["added"] += 1
+                elif not same_value(node[key], value):
+                    node[key] = value
+                    changed = True
+                    if tally is not None:
+                        tally["overwritten"] += 1
+            else:
+                child = node.get(key)
+                if not isinstance(child, dict):
+                    if key in node:
+                        if tally is not None:
+                            tally["overwritten"] += 1
+                        replaced = depth
+                    child = node[key] = {}
+                    changed = True
+                nodes[depth] = child
+        return changed
+
+
+def compile_plan(updates, keyed=None):
+    steps = []
+    paths = []
+    max_depth = 0
+    stack = [(iter(updates.items()), ())]
+    while stack:
+        items, prefix = stack[-1]
+        for key, value in items:
+            path = prefix + (key,)
+            depth = len(path)
+            if isinstance(value, dict):
+                steps.append((DESCEND, depth, key, None))
+                paths.append(path)
+                max_depth = max(max_depth, depth)
+                stack.append((iter(value.items()), path))
+                break
+            dotted = SEPARATOR.join(path) if keyed else None
+            if keyed and isinstance(value, list) and dotted in keyed:
+                steps.append((KEYED, depth, key, (keyed[dotted], value, dotted)))
+            else:
+                steps.append((SET, depth, key, value))
+            paths.append(path)
+        else:
+            stack.pop()
+    return MergePlan(tuple(steps), tuple(paths), max_depth)
+
+
+def merge_plan(updates, payload_hash=None, keyed=None):
+    """Return the compiled plan for updates, reusing one compiled earlier for an equal payload."""
+    if payload_hash is None:
+        payload_hash = hash_payload(updates)
+    cache_key = (payload_hash, tuple(sorted(keyed.items())) if keyed else ())
+    plan = _cache.get(cache_key)
+    if plan is None:
+        if len(_cache) >= CACHE_SIZE:
+            del _cache[next(iter(_cache))]
+        plan = _cache[cache_key] = compile_plan(updates, keyed)
+    return plan
@@ -0,0 +1,58 @@
+"""Optional per-phase instrumentation for locale updates.
+
+update_locale(profile=True) times each phase of one language with a
+PhaseTimer and traces its peak memory with tracemalloc. With profiling
+off no timer exists and the only cost is a handful of `is not None`
+checks per file. Tracing slows allocation-heavy phases down, so compare
+phase times between profiled runs only.
+
+Each profiled run of update_locales.py appends one JSON object per line to
+PROFILE_LOG.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+
+PROFILE_LOG = ".cache/locales/runs.jsonl"
+
+
+class PhaseTimer:
+    """Wall time per named phase, measured between consecutive mark() calls."""
+
+    __slots__ = ("phases", "counts", "_last", "_owner")
+
+    def __init__(self):
+        self.phases = {}
+        self.counts = {"bytes_read": 0, "bytes_written": 0, "added": 0, "overwritten": 0}
+        # Nested timers (or a caller that is already tracing) share one trace.
+        self._owner = not tracemalloc.is_tracing()
+        if self._owner:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def finish(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._owner:
+            tracemalloc.stop()
+        return {
+            "phases": {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+            **self.counts,
+            "peak_bytes": peak,
+        }
+
+
+def append_record(record, path=PROFILE_LOG):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
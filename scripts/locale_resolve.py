@@ -0,0 +1,79 @@
+"""Fully resolved locale bundles with the en fallback baked in.
+
+t() looks a key up in the current language and, on a miss, walks
+translations.en a second time. A resolved bundle already holds the en
+value wherever the language has none, so every lookup is answered from
+one tree. resolved/fallback-report.json lists each leaf that was filled
+from en, and each conflict where the language holds a leaf but en holds an
+object (the language's value wins there, as it does for t() on that key).
+"""
+
+import json
+import os
+
+from locale_codec import dump_locale
+from locale_commit import write_outputs
+from locale_flat import SEPARATOR, flatten
+
+FALLBACK = "en"
+RESOLVED_DIR = "resolved"
+REPORT_NAME = "fallback-report.json"
+
+_MISSING = object()
+
+
+def _filled_paths(value, path):
+    if isinstance(value, dict) and value:
+        return [path + SEPARATOR + key for key in flatten(value)]
+    return [path]
+
+
+def resolve(tree, fallback, filled=None, conflicts=None, prefix=""):
+    """Return tree with every key it lacks (or holds as null) taken from fallback."""
+    filled = [] if filled is None else filled
+    conflicts = [] if conflicts is None else conflicts
+    out = {}
+    for key, value in tree.items():
+        path = prefix + key
+        base = fallback.get(key, _MISSING)
+        if value is None and base is not _MISSING and base is not None:
+            out[key] = base
+            filled.extend(_filled_paths(base, path))
+        elif isinstance(value, dict) and isinstance(base, dict):
+            out[key] = resolve(value, base, filled, conflicts, path + SEPARATOR)
+        else:
+            if isinstance(base, dict) and not isinstance(value, dict):
+                conflicts.append(path)
+            out[key] = value
+    for key, base in fallback.items():
+        if key not in tree:
+            out[key] = base
+            filled.extend(_filled_paths(base, prefix + key))
+    return out
+
+
+def emit_resolved(locales, out_dir, dump=dump_locale):
+    directory = os.path.join(out_dir, RESOLVED_DIR)
+    fallback = locales[FALLBACK]
+    report = {"fallback": FALLBACK, "languages": {}}
+    outputs = {}
+    filled_total = 0
+    for lang in locales:
+        filled = []
+        conflicts = []
+        tree = locales[lang]
+        if lang != FALLBACK:
+            tree = resolve(tree, fallback, filled, conflicts)
+        report["languages"][lang] = {
+            "filled": len(filled),
+            "keys": filled,
+            "conflicts": conflicts,
+        }
+        filled_total += len(filled)
+        outputs[os.path.join(directory, f"{lang}.json")] = dump(tree)
+    outputs[os.path.join(directory, REPORT_NAME)] = (
+        json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+    ).encode("utf-8")
+    stats = write_outputs(outputs, directory)
+    stats["filled"] = filled_total
+    return stats
@@ -0,0 +1,108 @@
+"""Static scan of which translation namespaces each route needs.
+
+Routes and their lazily imported pages are read from src/App.tsx. Each
+page's import graph is then followed through local modules, and the first
+segment of every t("namespace.key") call along the way is collected.
+Namespaces reached from App.tsx's static imports are reported as shared:
+every route needs them.
+"""
+
+import os
+import re
+
+SRC_DIR = "src"
+APP_MODULE = "App.tsx"
+
+_LAZY_RE = re.compile(r"const\s+(\w+)\s*=\s*lazy\(\s*\(\)\s*=>\s*import\(\s*[\"']([^\"']+)[\"']\s*\)\s*\)")
+_ROUTE_RE = re.compile(r"<Route\b([^>]*?)component=\{(\w+)\}")
+_PATH_RE = re.compile(r"path=\"([^\"]*)\"")
+_IMPORT_RE = re.compile(r"^\s*import\s+(?:[^;]*?\s+from\s+)?[\"']([^\"']+)[\"']", re.M)
+# t("ns.key"), t("ns"), and any other literal shaped like "ns.key" (keys are
+# often built in a local variable or passed through a helper before t()).
+_KEY_RE = re.compile(r"\bt\(\s*[\"'`]([A-Za-z_$][\w$]*)[.\"'`]")
+_LITERAL_RE = re.compile(r"[\"'`]([A-Za-z_$][\w$]*)\.[\w${]")
+_STATIC_KEY_RE = re.compile(r"\bts?\(\s*[\"']([A-Za-z_$][\w$]*(?:\.[\w$]+)*)[\"']\s*\)")
+_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js")
+
+
+def _resolve(spec, importer, src_dir):
+    if spec.startswith("src/"):
+        base = os.path.join(os.path.dirname(os.path.abspath(src_dir)), spec)
+    elif spec.startswith("."):
+        base = os.path.join(os.path.dirname(importer), spec)
+    else:
+        return None
+    base = os.path.normpath(base)
+    for candidate in [base] + [base + ext for ext in _EXTENSIONS] + [
+        os.path.join(base, "index" + ext) for ext in _EXTENSIONS
+    ]:
+        if os.path.isfile(candidate) and candidate.endswith(_EXTENSIONS):
+            return candidate
+    return None
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def module_namespaces(path, src_dir=SRC_DIR, seen=None, exclude=(), known=None):
+    """Namespaces used by path and every local module it (transitively) imports.
+
+    With known (a set of namespace names), dotted string literals outside
+    t() calls are counted as well when their first segment is a namespace.
+    """
+    seen = set() if seen is None else seen
+    namespaces = set()
+    stack = [os.path.normpath(path)]
+    while stack:
+        module = stack.pop()
+        if module in seen or module in exclude:
+            continue
+        seen.add(module)
+        text = _read(module)
+        namespaces.update(_KEY_RE.findall(text))
+        if known:
+            namespaces.update(name for name in _LITERAL_RE.findall(text) if name in known)
+        for spec in _IMPORT_RE.findall(text):
+            resolved = _resolve(spec, module, src_dir)
+            if resolved is not None:
+                stack.append(resolved)
+    return namespaces
+
+
+def route_namespaces(src_dir=SRC_DIR, known=None):
+    """Return {"shared": [...], "routes": {path: [...]}} with namespaces sorted.
+
+    A route without a path (the catch-all) is reported under "*".
+    """
+    app = os.path.normpath(os.path.join(src_dir, APP_MODULE))
+    text = _read(app)
+    pages = {}
+    for name, spec in _LAZY_RE.findall(text):
+        resolved = _resolve(spec, app, src_dir)
+        if resolved is not None:
+            pages[name] = resolved
+
+    shared = module_namespaces(app, src_dir, exclude=set(pages.values()), known=known)
+    routes = {}
+    for attrs, component in _ROUTE_RE.findall(text):
+        if component not in pages:
+            continue
+        match = _PATH_RE.search(attrs)
+        path = match.group(1) if match else "*"
+        if path in routes:
+            continue
+        routes[path] = sorted(module_namespaces(pages[component], src_dir, known=known) - shared)
+    return {"shared": sorted(shared), "routes": routes}
+
+
+def used_keys(src_dir=SRC_DIR):
+    """Every static t("...") key in src_dir, once per call site, in file order."""
+    keys = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(_EXTENSIONS):
+                keys.extend(_STATIC_KEY_RE.findall(_read(os.path.join(root, name))))
+    return keys
@@ -0,0 +1,124 @@
+"""Per-language translation payloads, loaded on demand.
+
+Each language's updates live in scripts/translations/<lang>.py as a single
+`updates = {...}` literal. Loading one never touches the others. A parsed
+payload is snapshotted with marshal under .cache/locales/sources; the
+snapshot is reused while the source's mtime and size are unchanged, or
+while its sha256 still matches (e.g. after a checkout that only touched
+mtimes).
+"""
+
+import ast
+import marshal
+import os
+from collections.abc import Mapping
+
+from locale_manifest import hash_bytes
+
+SOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translations")
+SNAPSHOT_DIR = ".cache/locales/sources"
+SOURCE_NAME = "updates"
+
+
+def source_path(lang, sources_dir=SOURCES_DIR):
+    return os.path.join(sources_dir, f"{lang}.py")
+
+
+def parse_source(text, filename="<translations>"):
+    """Evaluate the `updates = {...}` literal without executing the module."""
+    for node in ast.parse(text, filename).body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == SOURCE_NAME
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"{filename}: no `{SOURCE_NAME} = {{...}}` assignment")
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, "rb") as f:
+            header = marshal.load(f)
+            if not isinstance(header, tuple) or header[0] != marshal.version:
+                return None, None
+            return header, marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None, None
+
+
+def load_source(lang, sources_dir=SOURCES_DIR, snapshot_dir=SNAPSHOT_DIR):
+    path = source_path(lang, sources_dir)
+    st = os.stat(path)
+    snapshot = os.path.join(snapshot_dir, f"{lang}.marshal")
+    header, updates = _read_snapshot(snapshot)
+    if header is not None and header[1:3] == (st.st_mtime_ns, st.st_size):
+        return updates
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    source_hash = hash_bytes(raw)
+    if header is None or header[3] != source_hash:
+        updates = parse_source(raw.decode("utf-8"), path)
+    _write_snapshot(snapshot, st, source_hash, updates)
+    return updates
+
+
+def _write_snapshot(snapshot, st, source_hash, updates):
+    try:
+        os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+        tmp = f"{snapshot}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump((marshal.version, st.st_mtime_ns, st.st_size, source_hash), f)
+            marshal.dump(updates, f)
+        os.replace(tmp, snapshot)
+    except OSError:
+        pass
+
+
+def available_languages(sources_dir=SOURCES_DIR):
+    return sorted(
+        name[:-3]
+        for name in os.listdir(sources_dir)
+        if name.endswith(".py") and not name.startswith("_")
+    )
+
+
+class TranslationSources(Mapping):
+    """Read-only lang -> updates mapping that loads each payload on first access."""
+
+    def __init__(self, sources_dir=SOURCES_DIR, snapshot_dir=SNAPSHOT_DIR):
+        self.sources_dir = sources_dir
+        self.snapshot_dir = snapshot_dir
+        self._langs = None
+        self._loaded = {}
+
+    @property
+    def languages(self):
+        if self._langs is None:
+            self._langs = available_languages(self.sources_dir)
+        return self._langs
+
+    def only(self, languages):
+        """The same payloads restricted to languages, still loaded on first access."""
+        view = TranslationSources(self.sources_dir, self.snapshot_dir)
+        view._langs = [lang for lang in languages if lang in self]
+        view._loaded = self._loaded
+        return view
+
+    def __getitem__(self, lang):
+        if lang not in self._loaded:
+            if lang not in self:
+                raise KeyError(lang)
+            self._loaded[lang] = load_source(lang, self.sources_dir, self.snapshot_dir)
+        return self._loaded[lang]
+
+    def __contains__(self, lang):
+        return lang in self.languages
+
+    def __iter__(self):
+        return iter(self.languages)
+
+    def __len__(self):
+        return len(self.languages)
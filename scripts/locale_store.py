@@ -0,0 +1,434 @@
+"""SQLite store for the locale trees.
+
+    python scripts/locale_store.py import [langs...] [--force]
+    python scripts/locale_store.py get contactPage.form.securityQuestion
+    python scripts/update_locales.py --store .cache/locales/locales.sqlite
+    python scripts/locale_store.py export [langs...]
+
+Every object, array and scalar of every locale is one row of `entries`,
+keyed by (lang, key_path) with key_path as validate_locales.format_path()
+prints it. sort_key holds the position of each item within its parent, 4
+big-endian bytes per level, so ordering a language's rows by sort_key
+walks its tree in document order and a subtree is one sort_key range.
+Scalars are stored as text: strings as they are, anything else as its
+JSON. source_hash is the sha256 of the file a row was imported from, or of
+the payload that last wrote it.
+
+`locales` records per language the hash of the file the rows were last
+imported from or exported to, the payload last merged (as in the update
+manifest), whether the rows changed since, and the whitespace that
+followed the document. Import skips files whose hash is unchanged and
+refuses, without --force, to overwrite rows that were changed in the store
+and not exported yet. Export streams the rows back through JsonWriter, so
+a file in the dump_locale() layout comes out byte for byte as it went in;
+import reports files in any other layout. As with update_locale(), a
+language a merge changed loses its trailing newline.
+
+update_locales.py --store merges every payload into the store in a single
+transaction, with the same rules and counts as merge(), instead of
+rewriting each file.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+from locale_commit import LocaleTransaction, locked, temp_beside
+from locale_manifest import hash_bytes, hash_file, hash_payload, variant_hash
+from locale_merge import SEPARATOR, merge_keyed, same_value
+from locale_stream import JsonWriter
+
+STORE_PATH = ".cache/locales/locales.sqlite"
+STORE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS locales (
+    lang TEXT PRIMARY KEY,
+    file_hash TEXT NOT NULL,
+    payload_hash TEXT,
+    dirty INTEGER NOT NULL DEFAULT 0,
+    trailer TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS entries (
+    lang TEXT NOT NULL,
+    key_path TEXT NOT NULL,
+    sort_key BLOB NOT NULL,
+    key TEXT,
+    kind TEXT NOT NULL,
+    value TEXT,
+    source_hash TEXT NOT NULL,
+    PRIMARY KEY (lang, key_path)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS entries_order ON entries (lang, sort_key);
+"""
+
+
+class StoreError(ValueError):
+    pass
+
+
+def _position(i):
+    return i.to_bytes(4, "big")
+
+
+def _after(sort_key):
+    """The first sort_key past every descendant of sort_key."""
+    if not sort_key:
+        return b"\xff" * 5
+    return sort_key[:-4] + _position(int.from_bytes(sort_key[-4:], "big") + 1)
+
+
+def _child_path(path, segment):
+    if isinstance(segment, int):
+        return f"{path}[{segment}]"
+    return f"{path}{SEPARATOR}{segment}" if path else segment
+
+
+def _encode(value):
+    if isinstance(value, dict):
+        return "object", None
+    if isinstance(value, list):
+        return "array", None
+    if isinstance(value, str):
+        return "string", value
+    return "scalar", json.dumps(value)
+
+
+def _decode(kind, value):
+    return value if kind == "string" else json.loads(value)
+
+
+def _rows(lang, value, path, sort_key, key, source_hash):
+    """entries rows for value and everything below it, in document order."""
+    stack = [(value, path, sort_key, key)]
+    while stack:
+        value, path, sort_key, key = stack.pop()
+        kind, text = _encode(value)
+        yield lang, path, sort_key, key, kind, text, source_hash
+        if kind == "object":
+            items = [
+                (child, _child_path(path, name), sort_key + _position(i), name)
+                for i, (name, child) in enumerate(value.items())
+            ]
+        elif kind == "array":
+            items = [
+                (child, _child_path(path, i), sort_key + _position(i), None)
+                for i, child in enumerate(value)
+            ]
+        else:
+            continue
+        stack.extend(reversed(items))
+
+
+class LocaleStore:
+    def __init__(self, path=STORE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # Transactions are opened explicitly, see transaction().
+        self.db = sqlite3.connect(path, isolation_level=None)
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, STORE_VERSION):
+            raise StoreError(f"{path}: store version {version}, expected {STORE_VERSION}")
+        self.db.executescript(_SCHEMA)
+        self.db.execute(f"PRAGMA user_version = {STORE_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def transaction(self):
+        return _Transaction(self.db)
+
+    def languages(self):
+        return [row[0] for row in self.db.execute("SELECT lang FROM locales ORDER BY lang")]
+
+    def state(self, lang):
+        """(file_hash, payload_hash, dirty) or None if lang was never imported."""
+        return self.db.execute(
+            "SELECT file_hash, payload_hash, dirty FROM locales WHERE lang = ?", (lang,)
+        ).fetchone()
+
+    def _row(self, lang, path):
+        return self.db.execute(
+            "SELECT sort_key, kind, value FROM entries WHERE lang = ? AND key_path = ?", (lang, path)
+        ).fetchone()
+
+    def _insert(self, lang, value, path, sort_key, key, source_hash):
+        try:
+            self.db.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                _rows(lang, value, path, sort_key, key, source_hash),
+            )
+        except sqlite3.IntegrityError as exc:
+            raise StoreError(f"{lang}: two keys share a path under {path or 'the root'!r} ({exc})") from None
+
+    def _delete(self, lang, sort_key):
+        self.db.execute(
+            "DELETE FROM entries WHERE lang = ? AND sort_key >= ? AND sort_key < ?",
+            (lang, sort_key, _after(sort_key)),
+        )
+
+    def subtree(self, lang, path=""):
+        """Rebuild the value at path as json.load() would return it."""
+        row = self._row(lang, path)
+        if row is None:
+            raise KeyError(path)
+        sort_key = row[0]
+        rows = self.db.execute(
+            "SELECT sort_key, key, kind, value FROM entries"
+            " WHERE lang = ? AND sort_key >= ? AND sort_key < ? ORDER BY sort_key",
+            (lang, sort_key, _after(sort_key)),
+        )
+        base = len(sort_key) // 4
+        parents = []
+        root = None
+        for sort_key, key, kind, value in rows:
+            depth = len(sort_key) // 4 - base
+            del parents[depth:]
+            node = {} if kind == "object" else [] if kind == "array" else _decode(kind, value)
+            if depth == 0:
+                root = node
+            elif key is None:
+                parents[-1].append(node)
+            else:
+                parents[-1][key] = node
+            parents.append(node)
+        return root
+
+    def write(self, lang, out):
+        """Stream lang to the binary file out in the dump_locale() layout; return its sha256."""
+        writer = JsonWriter(out)
+        rows = self.db.execute(
+            "SELECT sort_key, key, kind, value FROM entries WHERE lang = ? ORDER BY sort_key", (lang,)
+        )
+        for sort_key, key, kind, value in rows:
+            depth = len(sort_key) // 4
+            while len(writer.stack) > depth:
+                writer.close()
+            if key is not None:
+                writer.key(key)
+            if kind == "object":
+                writer.open("{")
+            elif kind == "array":
+                writer.open("[")
+            else:
+                writer.scalar(_decode(kind, value))
+        while writer.stack:
+            writer.close()
+        writer.flush()
+        trailer = self.db.execute("SELECT trailer FROM locales WHERE lang = ?", (lang,)).fetchone()
+        if trailer and trailer[0]:
+            data = trailer[0].encode("utf-8")
+            out.write(data)
+            writer.digest.update(data)
+        return writer.digest.hexdigest()
+
+    def import_files(self, languages, locales_dir=LOCALES_DIR, force=False):
+        """Load locale files in one transaction; return {lang: status}."""
+        statuses = {}
+        with self.transaction():
+            for lang in languages:
+                path = locale_path(lang, locales_dir)
+                with open(path, "rb") as f:
+                    raw = f.read()
+                file_hash = hash_bytes(raw)
+                state = self.state(lang)
+                if state is not None and state[0] == file_hash and not force:
+                    statuses[lang] = "unchanged"
+                    continue
+                if state is not None and state[2] and not force:
+                    raise StoreError(f"{lang}: the store has changes not exported yet; export first or use --force")
+                tree = json.loads(raw)
+                trailer = raw[len(raw.rstrip()):].decode("utf-8")
+                self.db.execute("DELETE FROM entries WHERE lang = ?", (lang,))
+                self._insert(lang, tree, "", b"", None, file_hash)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO locales (lang, file_hash, payload_hash, dirty, trailer)"
+                    " VALUES (?, ?, NULL, 0, ?)",
+                    (lang, file_hash, trailer),
+                )
+                if self.write(lang, _Discard()) == file_hash:
+                    statuses[lang] = "imported"
+                else:
+                    statuses[lang] = "imported (not in the dump_locale() layout; export will reformat it)"
+        return statuses
+
+    def export_files(self, languages, locales_dir=LOCALES_DIR, force=False):
+        """Write every changed language back to its locale file, all or none; return {lang: status}."""
+        statuses = {}
+        exported = {}
+        with LocaleTransaction() as txn:
+            for lang in languages:
+                state = self.state(lang)
+                if state is None:
+                    raise StoreError(f"{lang}: not in the store")
+                path = locale_path(lang, locales_dir)
+                if not state[2] and not force and os.path.exists(path) and hash_file(path) == state[0]:
+                    statuses[lang] = "unchanged"
+                    continue
+                fd, tmp = temp_beside(path)
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        exported[lang] = self.write(lang, f)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+                txn.adopt(tmp, path)
+                statuses[lang] = "exported"
+        with self.transaction():
+            for lang, file_hash in exported.items():
+                self.db.execute("UPDATE locales SET file_hash = ?, dirty = 0 WHERE lang = ?", (file_hash, lang))
+        return statuses
+
+    def merge(self, lang, updates, counts=None, keyed=None, source_hash=""):
+        """locale_merge.merge() applied to the rows of lang; return True if they changed."""
+        if self._row(lang, "") is None:
+            raise StoreError(f"{lang}: not in the store")
+        return self._merge(lang, "", b"", updates, counts, keyed, source_hash)
+
+    def _append_key(self, lang, sort_key):
+        last = self.db.execute(
+            "SELECT max(sort_key) FROM entries"
+            " WHERE lang = ? AND sort_key > ? AND sort_key < ? AND length(sort_key) = ?",
+            (lang, sort_key, _after(sort_key), len(sort_key) + 4),
+        ).fetchone()[0]
+        return sort_key + _position(0 if last is None else int.from_bytes(last[-4:], "big") + 1)
+
+    def _replace(self, lang, path, sort_key, key, value, source_hash):
+        self._delete(lang, sort_key)
+        self._insert(lang, value, path, sort_key, key, source_hash)
+
+    def _merge(self, lang, path, sort_key, updates, counts, keyed, source_hash):
+        changed = False
+        for key, value in updates.items():
+            child = _child_path(path, key)
+            row = self._row(lang, child)
+            if isinstance(value, dict):
+                if row is not None and row[1] == "object":
+                    changed = self._merge(lang, child, row[0], value, counts, keyed, source_hash) or changed
+                elif row is not None:
+                    self._replace(lang, child, row[0], key, value, source_hash)
+                    changed = True
+                    if counts is not None:
+                        counts["overwritten"] += 1
+                else:
+                    child_key = self._append_key(lang, sort_key)
+                    self._insert(lang, {}, child, child_key, key, source_hash)
+                    self._merge(lang, child, child_key, value, counts, None, source_hash)
+                    changed = True
+            elif row is None:
+                self._insert(lang, value, child, self._append_key(lang, sort_key), key, source_hash)
+                changed = True
+                if counts is not None:
+                    counts["added"] += 1
+            elif keyed and isinstance(value, list) and child in keyed and row[1] == "array":
+                items = self.subtree(lang, child)
+                if merge_keyed(items, value, keyed[child], counts, child):
+                    self._replace(lang, child, row[0], key, items, source_hash)
+                    changed = True
+            else:
+                current = self.subtree(lang, child) if row[1] in ("object", "array") else _decode(row[1], row[2])
+                if not same_value(current, value):
+                    self._replace(lang, child, row[0], key, value, source_hash)
+                    changed = True
+                    if counts is not None:
+                        counts["overwritten"] += 1
+        return changed
+
+    def update_all(self, translations, keyed=None, force=False):
+        """Merge every payload in one transaction; return {lang: result} shaped like update_locale()'s."""
+        results = {}
+        with self.transaction():
+            for lang, updates in translations.items():
+                state = self.state(lang)
+                if state is None:
+                    raise StoreError(f"{lang}: not in the store; import it first")
+                payload_hash = variant_hash(hash_payload(updates), "source", None, keyed)
+                result = {"lang": lang, "path": self.path, "payload_hash": payload_hash}
+                results[lang] = result
+                if state[1] == payload_hash and not force:
+                    result["status"] = "skipped"
+                    continue
+                counts = {"added": 0, "overwritten": 0}
+                changed = self.merge(lang, updates, counts, keyed, payload_hash)
+                result["counts"] = counts
+                result["status"] = "updated" if changed else "unchanged"
+                self.db.execute(
+                    "UPDATE locales SET payload_hash = ?, dirty = dirty OR ?,"
+                    " trailer = CASE WHEN ? THEN '' ELSE trailer END WHERE lang = ?",
+                    (payload_hash, changed, changed, lang),
+                )
+        return results
+
+
+class _Discard:
+    def write(self, data):
+        pass
+
+
+class _Transaction:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import, query and export the SQLite locale store.")
+    parser.add_argument("--store", default=STORE_PATH, help=f"database file (default: {STORE_PATH})")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, what in (
+        ("import", "load locale files into the store (skips unchanged files)"),
+        ("export", "write languages changed in the store back to their locale files"),
+    ):
+        command = commands.add_parser(name, help=what)
+        command.add_argument("languages", nargs="*", help="only these languages (default: all)")
+        command.add_argument("--force", action="store_true", help="import or export even if nothing changed")
+    commands.add_parser("get", help="the value at PATH in every language").add_argument("path")
+    args = parser.parse_args(argv)
+
+    with LocaleStore(args.store) as store, locked(args.locales_dir):
+        if args.command == "get":
+            for lang in store.languages():
+                try:
+                    value = json.dumps(store.subtree(lang, args.path), ensure_ascii=False)
+                except KeyError:
+                    value = "-"
+                print(f"{lang}: {value}")
+            return 0
+        languages = args.languages
+        if not languages and args.command == "import":
+            languages = locale_languages(args.locales_dir)
+        elif not languages:
+            languages = store.languages()
+        try:
+            if args.command == "import":
+                statuses = store.import_files(languages, args.locales_dir, args.force)
+            else:
+                statuses = store.export_files(languages, args.locales_dir, args.force)
+        except StoreError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+    for lang, status in statuses.items():
+        print(f"{lang}: {status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
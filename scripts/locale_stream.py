@@ -0,0 +1,305 @@
+"""Event-driven merge for locale files too large to load whole.
+
+The input is tokenized chunk by chunk and re-emitted as it is read, in
+exactly the layout json.dump(..., ensure_ascii=False, indent=2) produces.
+Only the subtrees named in the update payload are materialized, so peak
+memory follows the size of the updates rather than the size of the file.
+"""
+
+import codecs
+import hashlib
+import json
+import re
+from json.decoder import JSONDecodeError, scanstring
+from json.encoder import encode_basestring
+from json.scanner import NUMBER_RE
+
+from locale_merge import same_value
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_LITERALS = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+)
+
+
+class _Reader:
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(self.chunk_size)
+        self.eof = not chunk
+        self.buf += self.decoder.decode(chunk, final=self.eof)
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def error(self, msg):
+        return JSONDecodeError(msg, self.buf, self.pos)
+
+    def string(self):
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos + 1)
+            except JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            self.pos = end
+            return value
+
+    def number(self):
+        while len(self.buf) - self.pos < 32 and self.fill():
+            pass
+        while True:
+            match = NUMBER_RE.match(self.buf, self.pos)
+            if match is not None and match.end() == len(self.buf) and self.fill():
+                continue
+            break
+        if match is None:
+            return self.literal()
+        integer, frac, exp = match.groups()
+        self.pos = match.end()
+        if frac or exp:
+            return float(integer + (frac or "") + (exp or ""))
+        return int(integer)
+
+    def literal(self):
+        while len(self.buf) - self.pos < 9 and self.fill():
+            pass
+        for text, value in _LITERALS:
+            if self.buf.startswith(text, self.pos):
+                self.pos += len(text)
+                return value
+        raise self.error("Expecting value")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.pos += 1
+
+
+def iter_events(f, chunk_size=CHUNK_SIZE):
+    """Yield (event, value) pairs for the JSON document in binary file f.
+
+    Events are start_map, key, end_map, start_array, end_array and value.
+    """
+    reader = _Reader(f, chunk_size)
+    yield from _events(reader)
+    if reader.peek():
+        raise reader.error("Extra data")
+
+
+def _events(reader):
+    char = reader.peek()
+    if char == "{":
+        reader.pos += 1
+        yield "start_map", None
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                if reader.peek() != '"':
+                    raise reader.error("Expecting property name enclosed in double quotes")
+                yield "key", reader.string()
+                reader.expect(":")
+                yield from _events(reader)
+                char = reader.peek()
+                reader.pos += 1
+                if char == "}":
+                    break
+                if char != ",":
+                    raise reader.error("Expecting ',' delimiter")
+        yield "end_map", None
+    elif char == "[":
+        reader.pos += 1
+        yield "start_array", None
+        if reader.peek() == "]":
+            reader.pos += 1
+        else:
+            while True:
+                yield from _events(reader)
+                char = reader.peek()
+                reader.pos += 1
+                if char == "]":
+                    break
+                if char != ",":
+                    raise reader.error("Expecting ',' delimiter")
+        yield "end_array", None
+    elif char == '"':
+        yield "value", reader.string()
+    elif char == "":
+        raise reader.error("Expecting value")
+    else:
+        yield "value", reader.number()
+
+
+def build(event, value, events):
+    """Materialize the subtree that starts with (event, value)."""
+    if event == "value":
+        return value
+    if event == "start_map":
+        node = {}
+        for event, value in events:
+            if event == "end_map":
+                return node
+            node[value] = build(*next(events), events)
+    node = []
+    for event, value in events:
+        if event == "end_array":
+            return node
+        node.append(build(event, value, events))
+
+
+class JsonWriter:
+    """Incremental writer reproducing json.dumps(..., ensure_ascii=False, indent=2)."""
+
+    def __init__(self, out, buffer_size=CHUNK_SIZE):
+        self.out = out
+        self.buffer_size = buffer_size
+        self.pending = []
+        self.pending_size = 0
+        self.stack = []
+        self.digest = hashlib.sha256()
+
+    def write(self, text):
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if self.pending_size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        data = "".join(self.pending).encode("utf-8")
+        self.digest.update(data)
+        self.out.write(data)
+        self.pending = []
+        self.pending_size = 0
+
+    def _item(self):
+        frame = self.stack[-1]
+        self.write(("\n" if frame[1] == 0 else ",\n") + "  " * len(self.stack))
+        frame[1] += 1
+
+    def _array_item(self):
+        if self.stack and self.stack[-1][0] == "]":
+            self._item()
+
+    def open(self, char):
+        self._array_item()
+        self.write(char)
+        self.stack.append(["}" if char == "{" else "]", 0])
+
+    def close(self):
+        close, count = self.stack.pop()
+        if count:
+            self.write("\n" + "  " * len(self.stack))
+        self.write(close)
+
+    def key(self, key):
+        self._item()
+        self.write(encode_basestring(key) + ": ")
+
+    def scalar(self, value):
+        self._array_item()
+        if isinstance(value, str):
+            self.write(encode_basestring(value))
+        else:
+            self.write(json.dumps(value))
+
+    def value(self, value):
+        self._array_item()
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+        if self.stack:
+            text = text.replace("\n", "\n" + "  " * len(self.stack))
+        self.write(text)
+
+
+def _copy(event, value, events, writer):
+    depth = 0
+    while True:
+        if event == "value":
+            writer.scalar(value)
+        elif event == "key":
+            writer.key(value)
+        elif event == "start_map":
+            writer.open("{")
+            depth += 1
+        elif event == "start_array":
+            writer.open("[")
+            depth += 1
+        else:
+            writer.close()
+            depth -= 1
+        if depth == 0:
+            return
+        event, value = next(events)
+
+
+def _merge_map(events, writer, updates):
+    writer.open("{")
+    changed = False
+    seen = set()
+    for event, key in events:
+        if event == "end_map":
+            break
+        child = next(events)
+        if key not in updates:
+            writer.key(key)
+            _copy(*child, events, writer)
+            continue
+        seen.add(key)
+        new = updates[key]
+        writer.key(key)
+        if isinstance(new, dict) and child[0] == "start_map":
+            changed = _merge_map(events, writer, new) or changed
+        else:
+            old = build(*child, events)
+            writer.value(new)
+            changed = changed or not same_value(old, new)
+    for key, new in updates.items():
+        if key not in seen:
+            writer.key(key)
+            writer.value(new)
+            changed = True
+    writer.close()
+    return changed
+
+
+def stream_merge(src, out, updates, chunk_size=CHUNK_SIZE):
+    """Merge updates into the JSON object read from src, writing the result to out.
+
+    Both files are binary. Returns (changed, sha256 hex digest of the output).
+    """
+    events = iter_events(src, chunk_size)
+    event, _ = next(events)
+    if event != "start_map":
+        raise ValueError("locale file must contain a JSON object")
+    writer = JsonWriter(out, chunk_size)
+    changed = _merge_map(events, writer, updates)
+    for _ in events:
+        pass
+    writer.flush()
+    return changed, writer.digest.hexdigest()
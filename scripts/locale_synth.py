@@ -0,0 +1,93 @@
+"""Synthetic locale trees for benchmarks.
+
+generate() builds a tree shaped like src/locales/*.json: namespaces of
+nested objects whose leaves are strings, with some leaves holding arrays
+of small objects (like blog.posts). Every size knob is explicit and the
+output depends only on the seed, so two runs with the same arguments
+measure exactly the same data.
+"""
+
+import random
+import string
+
+ALPHABET = string.ascii_letters + string.digits + "     "
+LIST_EVERY = 25
+
+
+def _key(rng, used):
+    while True:
+        key = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        if key not in used:
+            used.add(key)
+            return key
+
+
+def _text(rng, size):
+    return "".join(rng.choice(ALPHABET) for _ in range(size)).strip() or "x"
+
+
+def _item(rng, string_size):
+    return {
+        "slug": _text(rng, 12).replace(" ", "-").lower(),
+        "title": _text(rng, string_size),
+        "excerpt": _text(rng, string_size * 3),
+    }
+
+
+def _fill(node, rng, keys, depth, fanout, list_length, string_size, counter):
+    used = set(node)
+    while keys > 0:
+        key = _key(rng, used)
+        if depth > 1 and keys > 1:
+            share = min(keys, max(1, keys // fanout))
+            node[key] = {}
+            _fill(node[key], rng, share, depth - 1, fanout, list_length, string_size, counter)
+            keys -= share
+            continue
+        counter[0] += 1
+        if list_length and counter[0] % LIST_EVERY == 0:
+            node[key] = [_item(rng, string_size) for _ in range(list_length)]
+        else:
+            node[key] = _text(rng, string_size)
+        keys -= 1
+
+
+def generate(keys=2000, depth=3, list_length=5, string_size=40, namespaces=20, seed=0):
+    """A locale tree with about `keys` leaves spread over `namespaces` top-level objects."""
+    rng = random.Random(seed)
+    tree = {}
+    used = set()
+    per_namespace = max(1, keys // namespaces)
+    counter = [0]
+    remaining = keys
+    while remaining > 0:
+        share = min(per_namespace, remaining)
+        node = tree[_key(rng, used)] = {}
+        _fill(node, rng, share, depth, 8, list_length, string_size, counter)
+        remaining -= share
+    return tree
+
+
+def _leaf_paths(tree, prefix=()):
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            yield from _leaf_paths(value, prefix + (key,))
+        else:
+            yield prefix + (key,)
+
+
+def payload(tree, fraction=0.1, string_size=40, seed=0):
+    """An update payload that rewrites `fraction` of the leaves and adds as many new ones."""
+    rng = random.Random(seed)
+    paths = list(_leaf_paths(tree))
+    count = max(1, int(len(paths) * fraction))
+    updates = {}
+    for path in rng.sample(paths, min(count, len(paths))):
+        node = updates
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = _text(rng, string_size)
+    node = updates.setdefault("synthetic", {})
+    for i in range(count):
+        node[f"added{i}"] = _text(rng, string_size)
+    return updates
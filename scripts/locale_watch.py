@@ -0,0 +1,183 @@
+"""Watch mode for update_locales.py.
+
+    python scripts/update_locales.py --watch [--interval 0.5] [--debounce 0.3]
+
+Polls scripts/translations/*.py and src/locales/*.json by stat (no
+inotify needed). After a burst of changes has been quiet for the debounce
+period, each affected language is re-merged:
+
+- an edited payload re-merges only the top-level namespaces whose payload
+  differs from the previous version;
+- a locale file changed by someone else is re-parsed and gets its whole
+  payload again.
+
+Parsed locale trees and payloads stay in memory between iterations, so
+untouched files are never read twice. Files are written atomically under
+the same lock as a normal run, and the manifest is kept up to date, so a
+later batch run skips what the watcher already merged. A payload or
+locale file that does not parse (e.g. saved mid-edit) is reported and
+retried on its next change, and so is a language whose merge fails (e.g.
+a duplicate --key-by identity): its file is left alone, the other
+languages are still written, and it is re-read from disk on its next
+change. Keys removed from a
+payload stay in the locale file, as in a batch run.
+"""
+
+import os
+import sys
+import time
+
+from locale_codec import dump_locale, load_locale, locale_path
+from locale_commit import LocaleTransaction, locked
+from locale_manifest import Manifest, hash_bytes, hash_payload, variant_hash
+from locale_merge import KeyedMergeError, merge
+from locale_sources import SOURCES_DIR, available_languages, load_source, source_path
+
+_ABSENT = object()
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def changed_namespaces(old, new):
+    """Top-level keys whose payload differs (hashed, so key order and 1 vs True count)."""
+    def digest(payload, key):
+        value = payload.get(key, _ABSENT)
+        return None if value is _ABSENT else hash_payload(value)
+
+    return [key for key in {**old, **new} if digest(old, key) != digest(new, key)]
+
+
+class Watcher:
+    """Polling loop that keeps every watched payload and locale tree in memory."""
+
+    def __init__(self, locales_dir, sources_dir=SOURCES_DIR, manifest_path=None, languages=None, keyed=None):
+        self.locales_dir = locales_dir
+        self.keyed = keyed
+        self.sources_dir = sources_dir
+        self.manifest_path = manifest_path
+        self.only = set(languages or ())
+        self.stats = {}
+        self.payloads = {}
+        self.trees = {}
+        self.hashes = {}
+
+    def languages(self):
+        return [lang for lang in available_languages(self.sources_dir) if not self.only or lang in self.only]
+
+    def _paths(self, lang):
+        return source_path(lang, self.sources_dir), locale_path(lang, self.locales_dir)
+
+    def poll(self):
+        """Paths whose (mtime, size) differ from the last poll."""
+        seen = {}
+        for lang in self.languages():
+            for path in self._paths(lang):
+                seen[path] = _stat(path)
+        changed = {path for path, st in seen.items() if self.stats.get(path) != st}
+        changed |= set(self.stats) - set(seen)
+        self.stats = seen
+        return changed
+
+    def wait(self, interval, debounce):
+        """Block until something changed and then stayed quiet for debounce seconds."""
+        changed = set()
+        quiet_since = None
+        while True:
+            time.sleep(interval)
+            burst = self.poll()
+            if burst:
+                changed |= burst
+                quiet_since = time.monotonic()
+            elif changed and time.monotonic() - quiet_since >= debounce:
+                return changed
+
+    def update(self, changed):
+        """Re-merge the languages touched by the changed paths; return one report line per language."""
+        reports = []
+        work = {}
+        for lang in self.languages():
+            source, target = self._paths(lang)
+            if source not in changed and target not in changed and lang in self.payloads:
+                continue
+            if not os.path.exists(target):
+                reports.append(f"{lang}: no locale file {target}")
+                continue
+            try:
+                payload = load_source(lang, self.sources_dir)
+            except (SyntaxError, ValueError, TypeError) as exc:
+                reports.append(f"{lang}: payload not loaded, keeping the previous one: {exc}")
+                continue
+            if target in changed or lang not in self.trees:
+                try:
+                    with open(target, "rb") as f:
+                        raw = f.read()
+                    tree = load_locale(raw)
+                except (OSError, ValueError) as exc:
+                    # Saved half-way or mid-rename: wait for the file to change again.
+                    self.trees.pop(lang, None)
+                    self.hashes.pop(lang, None)
+                    reports.append(f"{lang}: locale file not loaded, retrying on its next change: {exc}")
+                    continue
+                self.trees[lang] = tree
+                self.hashes[lang] = hash_bytes(raw)
+                updates, namespaces = payload, None
+            else:
+                namespaces = changed_namespaces(self.payloads[lang], payload)
+                updates = {key: payload[key] for key in namespaces if key in payload}
+            self.payloads[lang] = payload
+            if updates:
+                work[lang] = (updates, namespaces)
+            elif namespaces:
+                reports.append(f"{lang}: only removals in {', '.join(namespaces)}, nothing to merge")
+
+        if not work:
+            return reports
+        with locked(self.locales_dir):
+            merged = []
+            with LocaleTransaction() as txn:
+                for lang, (updates, namespaces) in work.items():
+                    what = "full payload" if namespaces is None else ", ".join(namespaces)
+                    try:
+                        changed = merge(self.trees[lang], updates, keyed=self.keyed)
+                        data = dump_locale(self.trees[lang]) if changed else None
+                    except (KeyedMergeError, ValueError, OSError) as exc:
+                        # The tree may be half merged: re-read it and the payload on the next change.
+                        del self.trees[lang], self.payloads[lang], self.hashes[lang]
+                        reports.append(f"{lang}: failed, nothing written ({what}): {exc}")
+                        continue
+                    merged.append(lang)
+                    if not changed:
+                        reports.append(f"{lang}: unchanged ({what})")
+                        continue
+                    txn.stage(self._paths(lang)[1], data)
+                    self.hashes[lang] = hash_bytes(data)
+                    reports.append(f"{lang}: written ({what})")
+            for lang in merged:
+                target = self._paths(lang)[1]
+                # Our own write must not look like an outside edit on the next poll.
+                self.stats[target] = _stat(target)
+            if self.manifest_path is not None and merged:
+                # Reloaded each time: a batch run may have saved it meanwhile.
+                manifest = Manifest.load(self.manifest_path)
+                for lang in merged:
+                    payload_hash = variant_hash(hash_payload(self.payloads[lang]), "source", None, self.keyed)
+                    manifest.record(self._paths(lang)[1], self.hashes[lang], payload_hash)
+                manifest.save()
+        return reports
+
+    def run(self, interval=0.5, debounce=0.3):
+        self.poll()
+        for line in self.update(set(self.stats)):
+            print(line)
+        print(f"Watching {self.sources_dir} and {self.locales_dir} (Ctrl-C to stop)")
+        while True:
+            changed = self.wait(interval, debounce)
+            for line in self.update(changed):
+                print(line)
+            sys.stdout.flush()
@@ -2,7 +2,7 @@ import { promises as fs } from "fs";
 import path from "path";
 import { fileURLToPath } from "url";
 import { pipeline } from "stream/promises";
-import { createGzip, createBrotliCompress } from "zlib";
+import { createGzip, createBrotliCompress, gunzipSync, brotliDecompressSync } from "zlib";
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const buildDir = path.join(__dirname, "../build");
@@ -19,29 +19,57 @@ async function* walk(dir) {
   }
 }
 
+// Precompressed files shipped with the source (e.g. public/locales, see
+// scripts/locale_compress.py) are kept when they still decompress to it.
+async function isFresh(filePath, compressedPath, decompress) {
+  let compressed;
+  try {
+    compressed = await fs.readFile(compressedPath);
+  } catch (error) {
+    return false;
+  }
+  try {
+    return decompress(compressed).equals(await fs.readFile(filePath));
+  } catch (error) {
+    return false;
+  }
+}
+
 async function compressFile(filePath) {
   const ext = path.extname(filePath);
   if (!COMPRESS_EXTENSIONS.has(ext)) {
-    return;
+    return 0;
   }
 
-  const source = await fs.open(filePath, "r");
-  try {
-    const gzipPath = `${filePath}.gz`;
-    const brotliPath = `${filePath}.br`;
-
-    const gzip = createGzip({ level: 9 });
-    await pipeline(source.createReadStream(), gzip, (await fs.open(gzipPath, "w")).createWriteStream());
-    await fs.utimes(gzipPath, new Date(), new Date());
+  let reused = 0;
+  const gzipPath = `${filePath}.gz`;
+  if (await isFresh(filePath, gzipPath, gunzipSync)) {
+    reused += 1;
+  } else {
+    const source = await fs.open(filePath, "r");
+    try {
+      const gzip = createGzip({ level: 9 });
+      await pipeline(source.createReadStream(), gzip, (await fs.open(gzipPath, "w")).createWriteStream());
+      await fs.utimes(gzipPath, new Date(), new Date());
+    } finally {
+      await source.close();
+    }
+  }
 
-    const source2 = await fs.open(filePath, "r");
-    const brotli = createBrotliCompress({ quality: 11 });
-    await pipeline(source2.createReadStream(), brotli, (await fs.open(brotliPath, "w")).createWriteStream());
-    await fs.utimes(brotliPath, new Date(), new Date());
-    await source2.close();
-  } finally {
-    await source.close();
+  const brotliPath = `${filePath}.br`;
+  if (await isFresh(filePath, brotliPath, brotliDecompressSync)) {
+    reused += 1;
+  } else {
+    const source = await fs.open(filePath, "r");
+    try {
+      const brotli = createBrotliCompress({ quality: 11 });
+      await pipeline(source.createReadStream(), brotli, (await fs.open(brotliPath, "w")).createWriteStream());
+      await fs.utimes(brotliPath, new Date(), new Date());
+    } finally {
+      await source.close();
+    }
   }
+  return reused;
 }
 
 async function run() {
@@ -52,11 +80,12 @@ async function run() {
     return;
   }
 
+  let reused = 0;
   for await (const file of walk(buildDir)) {
-    await compressFile(file);
+    reused += await compressFile(file);
   }
 
-  console.log("Assets compressed with gzip and Brotli");
+  console.log(`Assets compressed with gzip and Brotli (${reused} precompressed files reused)`);
 }
 
 run().catch((error) => {
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import locale_codec
+
+CODECS = sorted(locale_codec.CODECS)
+
+# Values orjson writes differently from the stdlib, or refuses, each of
+# which must send dumps() back to the stdlib encoder.
+DIVERGENT = [
+    {"a": 1e16},
+    {"a": [1e-05, "x"]},
+    {"a": {"b": -1e-07}},
+    {"a": 0.00001},
+    {"a": float("nan")},
+    {"a": [float("inf"), float("-inf")]},
+    {"a": None},
+    {"a": 2**64},
+    {"a": -(2**63) - 1},
+    {1: "int key"},
+]
+
+PLAIN = [
+    {},
+    {"a": "text", "b": [1, 2.5, -0.0, True, False], "c": {"d": []}},
+    {"é": "😀", "quote": '"\\/', "ctl": "\x00\x1f\x7f"},
+    # Strings that look like the fallback patterns must not change the output.
+    {"a": 'x": 1e5', "b": "null", "c": "0.00001"},
+    {"big": 2**63 - 1, "small": 1e15, "tiny": 1e-4},
+]
+
+
+def expected(tree):
+    return json.dumps(tree, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize("tree", DIVERGENT + PLAIN)
+def test_dumps_matches_stdlib(name, tree):
+    assert locale_codec.CODECS[name]().dumps(tree) == expected(tree)
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_generated_samples_match_stdlib(name):
+    codec = locale_codec.CODECS[name]()
+    for tree in locale_codec._samples():
+        assert codec.dumps(tree) == expected(tree)
+
+
+def test_check_passes_on_the_locale_files(tmp_path):
+    for i, tree in enumerate(PLAIN):
+        (tmp_path / f"l{i}.json").write_bytes(expected(tree))
+    assert locale_codec.check(str(tmp_path)) == []
+
+
+def test_dump_locale_uses_the_selected_codec():
+    tree = {"a": [1e16, "é"]}
+    for name in CODECS:
+        locale_codec.select(name)
+        assert locale_codec.dump_locale(tree) == expected(tree)
+        assert locale_codec.load_locale(expected(tree)) == tree
+    locale_codec.select()
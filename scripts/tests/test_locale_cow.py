@@ -0,0 +1,32 @@
+import copy
+import json
+
+import pytest
+
+from locale_cow import cow_merge
+from locale_merge import merge
+
+def dumps(tree):
+    return json.dumps(tree, ensure_ascii=False, indent=2)
+
+
+TREE = {"a": [1], "b": 1, "c": [{"x": 1, "y": 2}], "d": {"e": "text"}}
+
+
+@pytest.mark.parametrize(
+    "updates",
+    [
+        {"a": [True]},
+        {"b": 1.0},
+        {"b": True},
+        {"c": [{"y": 2, "x": 1}]},
+        {"d": {"e": "text"}, "a": [1]},
+        {"d": {"e": ["text"], "f": {"g": 1}}},
+    ],
+)
+def test_cow_merge_matches_merge(updates):
+    expected = copy.deepcopy(TREE)
+    changed = merge(expected, copy.deepcopy(updates))
+    tree = copy.deepcopy(TREE)
+    assert cow_merge(tree, updates) == changed
+    assert dumps(tree) == dumps(expected)
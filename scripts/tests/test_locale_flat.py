@@ -0,0 +1,38 @@
+import json
+import os
+
+import pytest
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+from locale_flat import flatten, unflatten
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TREES = [
+    {},
+    {"a": "x", "b": {"c": {"d": 1}, "e": [1, {"f": "g"}]}, "h": {}},
+    {"z": {"y": None}, "a": {"empty": {}, "list": []}, "m": True},
+]
+
+
+def dumps(tree):
+    # Compares key order too.
+    return json.dumps(tree, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize("tree", TREES)
+def test_unflatten_restores_the_tree(tree):
+    assert dumps(unflatten(flatten(tree))) == dumps(tree)
+
+
+def test_unflatten_restores_every_locale_file():
+    locales_dir = os.path.join(ROOT, LOCALES_DIR)
+    for lang in locale_languages(locales_dir):
+        with open(locale_path(lang, locales_dir), "r", encoding="utf-8") as f:
+            tree = json.load(f)
+        assert dumps(unflatten(flatten(tree))) == dumps(tree), lang
+
+
+def test_flatten_rejects_keys_with_the_separator():
+    with pytest.raises(ValueError):
+        flatten({"a.b": 1})
@@ -0,0 +1,74 @@
+import copy
+import io
+import json
+
+import pytest
+
+from locale_codec import dump_locale
+from locale_merge import merge
+from locale_store import LocaleStore
+
+TREE = {
+    "nav": {"home": "Home", "about": "Über"},
+    "list": [1, 2.5, None, True, {"x": []}, [[], {}]],
+    "empty": {},
+    "n": [2**64, 1e16, 1e-05, -0.0],
+    "esc": "\"quoted\" \\ \x00 😀",
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with LocaleStore(str(tmp_path / "locales.sqlite")) as store:
+        yield store
+
+
+def export(store, lang):
+    out = io.BytesIO()
+    store.write(lang, out)
+    return out.getvalue()
+
+
+def import_tree(store, tmp_path, tree, trailer=b""):
+    (tmp_path / "xx.json").write_bytes(dump_locale(tree) + trailer)
+    return store.import_files(["xx"], str(tmp_path))
+
+
+def test_export_matches_dump_locale(store, tmp_path):
+    assert import_tree(store, tmp_path, TREE) == {"xx": "imported"}
+    assert export(store, "xx") == dump_locale(TREE)
+    assert store.subtree("xx") == TREE
+
+
+def test_export_keeps_a_trailing_newline(store, tmp_path):
+    import_tree(store, tmp_path, TREE, b"\n")
+    assert export(store, "xx") == dump_locale(TREE) + b"\n"
+
+
+@pytest.mark.parametrize(
+    "updates",
+    [
+        {"nav": {"home": "Start", "new": "Neu"}},
+        {"nav": "replaced", "added": {"deep": [1, {"y": "z"}]}},
+        {"list": {"now": "a dict"}, "empty": {"a": {"b": "c"}}},
+        {"list": [1, 2.5, None, 1, {"x": []}, [[], {}]]},
+    ],
+)
+def test_export_after_merge_matches_dump_locale(store, tmp_path, updates):
+    import_tree(store, tmp_path, TREE)
+    expected = copy.deepcopy(TREE)
+    merge(expected, copy.deepcopy(updates))
+    with store.transaction():
+        store.merge("xx", updates)
+    assert export(store, "xx") == dump_locale(expected)
+
+
+def test_export_files_writes_dump_locale_bytes(store, tmp_path):
+    import_tree(store, tmp_path, TREE, b"\n")
+    results = store.update_all({"xx": {"nav": {"home": "Start"}}})
+    assert results["xx"]["status"] == "updated"
+    assert store.export_files(["xx"], str(tmp_path)) == {"xx": "exported"}
+    expected = copy.deepcopy(TREE)
+    expected["nav"]["home"] = "Start"
+    assert (tmp_path / "xx.json").read_bytes() == dump_locale(expected)
+    assert json.loads((tmp_path / "xx.json").read_bytes()) == expected
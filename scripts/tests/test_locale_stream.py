@@ -0,0 +1,82 @@
+import copy
+import hashlib
+import io
+import json
+
+import pytest
+
+from locale_merge import merge
+from locale_stream import JsonWriter, stream_merge
+
+TREES = [
+    {},
+    {"a": "x", "b": {"c": [1, 2.5, -0.0, None, True, False]}, "d": []},
+    {"é": "😀 \"quoted\" \\ /", "ctl": "\x00\x1f\x7f\n\t", "nested": [[], {}, [{}], [[1]]]},
+    {"n": [0, -1, 2**64, 10**30, 1e16, 1e-05, 1.7e308, 5e-324, 123456789.123]},
+    {"deep": {"a": {"b": {"c": {"d": [{"e": {"f": "g"}}]}}}}},
+]
+
+UPDATES = [
+    {},
+    {"a": "y"},
+    {"b": {"c": {"now": "a dict"}, "new": [1, {"x": []}]}},
+    {"d": {"replaced": True}, "z": {"added": {"deep": "é"}}},
+    {"b": {"c": [1, 2.5, -0.0, None, 1, False]}},
+]
+
+
+def dumps(tree):
+    return json.dumps(tree, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_tree(writer, value):
+    if isinstance(value, dict):
+        writer.open("{")
+        for key, child in value.items():
+            writer.key(key)
+            write_tree(writer, child)
+        writer.close()
+    elif isinstance(value, list):
+        writer.open("[")
+        for child in value:
+            write_tree(writer, child)
+        writer.close()
+    else:
+        writer.scalar(value)
+
+
+@pytest.mark.parametrize("tree", TREES)
+@pytest.mark.parametrize("buffer_size", [1, 7, 1 << 16])
+def test_writer_events_match_dumps(tree, buffer_size):
+    out = io.BytesIO()
+    writer = JsonWriter(out, buffer_size)
+    write_tree(writer, tree)
+    writer.flush()
+    assert out.getvalue() == dumps(tree)
+
+
+@pytest.mark.parametrize("tree", TREES)
+def test_writer_value_inside_containers_matches_dumps(tree):
+    out = io.BytesIO()
+    writer = JsonWriter(out)
+    writer.open("{")
+    writer.key("wrapped")
+    writer.open("[")
+    writer.value(tree)
+    writer.close()
+    writer.close()
+    writer.flush()
+    assert out.getvalue() == dumps({"wrapped": [tree]})
+
+
+@pytest.mark.parametrize("tree", TREES)
+@pytest.mark.parametrize("updates", UPDATES)
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_stream_merge_matches_merge(tree, updates, chunk_size):
+    expected = copy.deepcopy(tree)
+    changed = merge(expected, copy.deepcopy(updates))
+    out = io.BytesIO()
+    stream_changed, digest = stream_merge(io.BytesIO(dumps(tree)), out, updates, chunk_size)
+    assert out.getvalue() == dumps(expected)
+    assert stream_changed == changed
+    assert digest == hashlib.sha256(dumps(expected)).hexdigest()
@@ -0,0 +1,232 @@
+# Updates merged into src/locales/az.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Bloq"},
+    "contact": {"goToContactPage": "Əlaqə səhifəsinə baxın"},
+    "locationSpotlight": {
+        "tagline": "Yerli ekspertiza",
+        "title": "asyncz Azərbaycan komandaları üçün",
+        "description": "Bakıda və Gəncədə filiallarınızı lokal rezervasiya təcrübələri, vergi qaydaları və regiona hazır avtomatlaşdırmalarla sinxron saxlayın.",
+        "ctaLabel": "Azərbaycan komandamızla tanış olun",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "Regional tələblərə uyğunluq",
+                "description": "Hər bölgənin bayramlarını, xidmət qaydalarını və vergi dərəcələrini təkrarlanmayan təqvimlərlə idarə edin."
+            },
+            {
+                "icon": "users",
+                "title": "İkidilli dəstək",
+                "description": "Onboarding mütəxəssislərimiz resepsiya komandanızı bütün proses boyu müşayiət edir."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "Boş vaxt yuvası tapdınız",
+        "title": "Bu səhifə cədvəldə yoxdur",
+        "subtitle": "Keçid artıq mövcud deyil. Asyncz resurslarını araşdırın və planınıza qayıdın.",
+        "primaryCta": "Əsas səhifəyə qayıt",
+        "secondaryCta": "Dəstək ilə əlaqə",
+        "linkDescription": "{section} haqqında daha çox öyrənin.",
+        "explore": "Araşdırın"
+    },
+    "featuresPage": {
+        "pageTitle": "Funksiyalar - asyncz | AI ilə planlaşdırma axınları",
+        "metaDescription": "asyncz funksiyalarını kəşf edin: çox filiallı orkestrasiya, qara siyahı qoruması, analitika panelləri və AI gözləmə siyahıları.",
+        "keywords": [
+            "asyncz funksiyalar",
+            "ai planlaşdırma",
+            "gözləmə siyahısı avtomatlaşdırması",
+            "çox filiallı təqvim",
+            "asyncz analitika"
+        ],
+        "tagline": "Məhsul turu",
+        "heroTitle": "Hər görüş axını üçün vahid idarəetmə",
+        "heroSubtitle": "asyncz bronlaşdırmanı, marşrutlaşdırmanı, xatırlatmaları və analitikanı birləşdirir ki, bütün filiallar eyni səviyyədə xidmət göstərsin.",
+        "primaryCta": "Tarifləri müqayisə edin",
+        "secondaryCta": "Satışla danışın",
+        "coreTitle": "Filiallarınızla böyüyən əsas imkanlar",
+        "coreDescription": "Ağıllı təqvimlərdən brend kommunikasiya kanallarına qədər asyncz əlavə resurs tələb etmədən mürəkkəb əməliyyatları sadələşdirir.",
+        "deepDives": [
+            {
+                "title": "Çox filiallı güc planlaması",
+                "description": "Tələbi əlçatanlıq pəncərələri, tampon qaydalar və heyət limitləri ilə tarazlayın."
+            },
+            {
+                "title": "Avtomatlaşdırılmış kommunikasiya axınları",
+                "description": "Təsdiqləri, xatırlatmaları və izləmələri WhatsApp, SMS və e-poçt vasitəsilə avtomatik göndərin."
+            },
+            {
+                "title": "Rol əsaslı girişlər",
+                "description": "Baş ofis, filial menecerləri və resepsiya komandalarına təhlükəsizlikdən ödün vermədən lazım olan alətləri verin."
+            }
+        ],
+        "deepDiveTitle": "Ən vacib iş axınlarına daha dərindən baxın",
+        "deepDiveDescription": "asyncz müştəri səyahətinin hər addımını xəritələyir ki, heç nə diqqətdən yayınmasın.",
+        "analyticsHighlight": {
+            "title": "Real vaxt əməliyyat analitikası",
+            "description": "Xidmət markaları üçün hazırlanmış panellərlə istifadəni, no-show təsirini və resurs başına gəliri izləyin.",
+            "metrics": [
+                "Filial və əməkdaş performansının sürətli görünüşü",
+                "Ləğv səbəbləri və bərpa təklifləri",
+                "Marketinq kanalı üzrə konversiya tendensiyaları"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "AI gözləmə siyahısı boş yerləri doldurur",
+            "description": "asyncz seçimlərə, məsafəyə və xərcləmə tarixçəsinə əsaslanaraq dəvət ediləcək ən uyğun müştərini təklif edir.",
+            "metric": "Pilot filiallarda boş slotların orta hesabla 27% azalması."
+        },
+        "differentiatorTitle": "asyncz niyə standart rezervasiya alətlərindən üstündür",
+        "differentiatorDescription": "Sektora uyğun iş axınları çox filiallı komandaları sinxron saxlayır və spam trafiki ilə təkrarçı no-showları bloklayır.",
+        "differentiators": [
+            {
+                "title": "Enterprise səviyyəli qara siyahı qoruması",
+                "description": "Email, telefon və ödəniş nümunələrini təhlil edərək riskli rezervasiyaları dayandırın."
+            },
+            {
+                "title": "Hər rol üçün daxili analitika",
+                "description": "Komandalar ehtiyac duyduqları göstəriciləri cədvəllər arasında itirmədən görür."
+            },
+            {
+                "title": "İlk gündən API hazır",
+                "description": "Öz tətbiqlərinizi və partnyor platformalarını təhlükəsiz webhook və REST API-lərlə sinxronlaşdırın."
+            },
+            {
+                "title": "Lokallaşdırılmış təcrübələr",
+                "description": "Altı dildə məzmun, bildiriş və SEO optimallaşdırılmış səhifələr təqdim edin."
+            }
+        ],
+        "finalCtaTitle": "Hər görüşü asyncz ilə idarə etməyə hazırsınız?",
+        "finalCtaDescription": "Komandamız filiallarınızı, avtomatlaşdırmalarınızı və analitikanızı bir həftədən az müddətdə xəritələndirir.",
+        "finalPrimaryCta": "Strategiya sessiyası sifariş edin",
+        "finalSecondaryCta": "Müştəri hekayələrini oxuyun"
+    },
+    "contactPage": {
+        "pageTitle": "asyncz ilə əlaqə | Strategiya sessiyası təyin edin",
+        "metaDescription": "Demo, qiymət və ya dəstək üçün asyncz ilə əlaqə saxlayın. +1 (415) 555-0134 nömrəsinə zəng edin, info@asyncz.com ünvanına yazın və ya San-Fransiskodakı ofisimizi ziyarət edin.",
+        "keywords": [
+            "asyncz əlaqə",
+            "asyncz dəstək",
+            "asyncz telefon",
+            "asyncz email"
+        ],
+        "tagline": "Planlaşdırma üstünlüyünüzü birlikdə quraq",
+        "heroTitle": "asyncz komandası ilə əlaqə saxlayın",
+        "heroSubtitle": "Hədəflərinizi bölüşün, filiallar, komandalar və müştərilər üçün uyğun plan hazırlayaq.",
+        "formTitle": "Bizə mesaj göndərin",
+        "formSubtitle": "Necə kömək edə biləcəyimizi deyin, bir iş günü ərzində cavab verəcəyik.",
+        "form": {
+            "name": "Tam ad",
+            "namePlaceholder": "Nigar Məmmədova",
+            "email": "İş e-poçtu",
+            "emailPlaceholder": "nigar@sirketiniz.az",
+            "company": "Şirkət",
+            "companyPlaceholder": "Təşkilatınızın adı",
+            "phone": "Telefon (istəyə bağlı)",
+            "phonePlaceholder": "+994 50 123 45 67",
+            "topic": "Mövzu",
+            "topicPlaceholder": "Mövzu seçin",
+            "topics": [
+                "Məhsul demosu",
+                "Qiymət sualı",
+                "Onboarding dəstəyi",
+                "Partnyorluq imkanı",
+                "Mətbuat"
+            ],
+            "message": "Necə kömək edə bilərik?",
+            "messagePlaceholder": "Məzmunu, vaxt qrafikini və aktivləşdirmək istədiyiniz filialları paylaşın...",
+            "securityQuestion": "{a} + {b} nə qədərdir? (spam qoruması)",
+            "securityPlaceholder": "Cavabı daxil edin",
+            "submit": "Mesaj göndərin",
+            "success": "Təşəkkürlər! Bir iş günü ərzində geri dönəcəyik.",
+            "error": "Xəta baş verdi. Zəhmət olmasa yenidən cəhd edin."
+        },
+        "infoTitle": "Baş ofisimizə gəlin",
+        "hoursTitle": "Dəstək saatları (Sakit okean vaxtı)",
+        "supportTitle": "Dəstək və onboarding",
+        "supportDescription": "Hər asyncz planı yönləndirilən onboarding, avtomatlaşdırma yoxlamaları və əməliyyat kouçinqini əhatə edir.",
+        "supportItems": {
+            "enterprise": "Çox filiallı komandalar üçün tətbiq mütəxəssisləri",
+            "email": "24 saatdan az cavab müddətli xüsusi e-poçt",
+            "training": "Canlı təlimlər və sertifikat proqramları"
+        },
+        "days": {
+            "monday": "Bazar ertəsi",
+            "tuesday": "Çərşənbə axşamı",
+            "wednesday": "Çərşənbə",
+            "thursday": "Cümə axşamı",
+            "friday": "Cümə",
+            "saturday": "Şənbə",
+            "sunday": "Bazar"
+        }
+    },
+    "blog": {
+        "pageTitle": "asyncz Bloqu | AI planlaşdırma fikirləri",
+        "metaDescription": "AI planlaşdırması, avtomatlaşdırma axınları və çox filiallı analitika haqqında asyncz məqalələrini oxuyun.",
+        "keywords": [
+            "asyncz bloq",
+            "ai planlaşdırma",
+            "çox filiallı əməliyyat",
+            "asyncz avtomatlaşdırma"
+        ],
+        "tagline": "Müasir xidmət komandaları üçün məzmun",
+        "heroTitle": "Hər filial üçün planlaşdırma intellekti",
+        "heroSubtitle": "Etibarlı müştəri səyahətləri qurmaq istəyən əməliyyat liderləri üçün təlimatlar, çərçivələr və göstəricilər.",
+        "categories": ["Məhsul", "Əməliyyat", "Böyümə"],
+        "allLabel": "Bütün mövzular",
+        "readMore": "Məqaləni oxu",
+        "emptyState": "Bu filtrə uyğun məqalə hələ yoxdur.",
+        "articleNotFoundTitle": "Məqalə tapılmadı",
+        "articleNotFoundDescription": "Bu yazı silinmiş ola bilər. Ən son materiallara baxın.",
+        "backToBlog": "Bloqa qayıdın",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "Çox filiallı komandalar üçün AI planlaşdırma rəhbəri",
+                "excerpt": "Operasiyaları, avtomatlaşdırmanı və analitikanı hər yerdə uyğunlaşdırmaq üçün çərçivələr.",
+                "content": [
+                    "Şəbəkəniz böyüdükcə əməliyyat mürəkkəbliyi artır. asyncz qaydaları mərkəzləşdirir ki, hər filial eyni playbook ilə işləsin.",
+                    "Xidmətləri, əlçatanlıq qaydalarını və istisnaları xəritələndirin; asyncz onları bir dəfə tətbiq edib bütün filiallara ötürür.",
+                    "İstifadə, tələbat və dar boğazları erkən görmək üçün analitikanı əlavə edin ki, müştəri təcrübəsi zərər görməsin."
+                ],
+                "category": "Məhsul",
+                "author": "Asyncz redaksiya komandası",
+                "published": "2025-09-10",
+                "readingTime": "6 dəqiqəlik oxu",
+                "tags": ["ai planlaşdırma", "oyun kitabçası", "çox filial"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Avtomatlaşdırma planı: asyncz ilə no-show-ları azaldın",
+                "excerpt": "Təqvimləri doldurmaq və müştəriləri məsuliyyətli saxlamaq üçün addım-addım şablonlar.",
+                "content": [
+                    "Təsdiq pəncərələrini, ödəniş qaydalarını və xatırlatma ritmlərini birləşdirərək no-show riskini minimuma endirin.",
+                    "asyncz müştərilərin üstünlük verdiyi kanallar vasitəsilə WhatsApp, SMS və email mesajları göndərir.",
+                    "Ən dəyərli görüşlər üçün eskalasiya yolları qurun və boşalan yerlər üçün gözləmə siyahısı dəvətlərini avtomatlaşdırın."
+                ],
+                "category": "Əməliyyat",
+                "author": "Asyncz Müştəri Uğuru",
+                "published": "2025-08-22",
+                "readingTime": "5 dəqiqəlik oxu",
+                "tags": ["avtomatlaşdırma", "no-show", "müştəri təcrübəsi"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Çox filiallı operatorlar üçün analitika bələdçisi",
+                "excerpt": "asyncz müştəriləri istifadəni və gəlirliliyi artırmaq üçün hansı panel və göstəriciləri izləyir.",
+                "content": [
+                    "Sadə sayımlardan kənara çıxaraq asyncz dönüşüm, saxlanma və yenidən rezervasiya trendlərini önə çıxarır.",
+                    "Hər filialı istifadə, heyət səmərəliliyi və kanal performansı üzrə müqayisə edin.",
+                    "Doğru müştəriləri doğru zamanda cəlb etmək üçün bu insights-ları marketinq və işə qəbul planlarınıza tətbiq edin."
+                ],
+                "category": "Böyümə",
+                "author": "Asyncz Data komandası",
+                "published": "2025-08-05",
+                "readingTime": "7 dəqiqəlik oxu",
+                "tags": ["analitika", "böyümə", "panel"]
+            }
+        ]
+    }
+}
@@ -0,0 +1,232 @@
+# Updates merged into src/locales/de.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Blog"},
+    "contact": {"goToContactPage": "Kontaktseite ansehen"},
+    "locationSpotlight": {
+        "tagline": "Lokale Teams",
+        "title": "asyncz für Teams in Deutschland",
+        "description": "Steuere Filialen von Berlin bis München mit lokalen Buchungserlebnissen, steuerkonformen Regeln und Automationen pro Bundesland.",
+        "ctaLabel": "Mit unserem DACH-Team sprechen",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "Landesspezifische Vorgaben",
+                "description": "Berücksichtige Feiertage, Behandlungspausen und Umsatzsteuer automatisch je Standort."
+            },
+            {
+                "icon": "users",
+                "title": "Support auf Deutsch und Englisch",
+                "description": "Unsere Spezialisten begleiten Empfang und Management während des gesamten Rollouts."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "Du hast einen leeren Slot gefunden",
+        "title": "Diese Seite steht nicht im Plan",
+        "subtitle": "Der Link ist nicht mehr gültig. Entdecke stattdessen unsere wichtigsten asyncz-Seiten.",
+        "primaryCta": "Zur Startseite",
+        "secondaryCta": "Support kontaktieren",
+        "linkDescription": "Mehr über {section} erfahren.",
+        "explore": "Entdecken"
+    },
+    "featuresPage": {
+        "pageTitle": "Funktionen - asyncz | KI-gestützte Terminflüsse",
+        "metaDescription": "Lerne die asyncz-Funktionen kennen: Filialorchestrierung, Blacklist-Schutz, Analysen und intelligente Wartelisten.",
+        "keywords": [
+            "asyncz funktionen",
+            "ki terminplanung",
+            "warteliste automation",
+            "filial kalender",
+            "asyncz analytics"
+        ],
+        "tagline": "Produkt-Tour",
+        "heroTitle": "All-in-one-Orchestrierung für jeden Termin",
+        "heroSubtitle": "asyncz verbindet Buchung, Routing, Erinnerungen und Insights, damit alle Standorte gleichbleibend liefern.",
+        "primaryCta": "Preise vergleichen",
+        "secondaryCta": "Mit Vertrieb sprechen",
+        "coreTitle": "Kernfunktionen, die mitwachsen",
+        "coreDescription": "Intelligente Kalender, markenkonforme Kommunikation und Automationen reduzieren manuellen Aufwand in jeder Filiale.",
+        "deepDives": [
+            {
+                "title": "Kapazitätsplanung über Standorte",
+                "description": "Balanciere Nachfrage mit Verfügbarkeitsfenstern, Pufferzeiten und Personalgrenzen."
+            },
+            {
+                "title": "Automatisierte Kommunikationsflüsse",
+                "description": "Bestätigungen, Erinnerungen und Follow-ups laufen über WhatsApp, SMS oder E-Mail ganz ohne Nachfassen."
+            },
+            {
+                "title": "Rollenbasierte Zugriffe",
+                "description": "Zentrale, Filialleitung und Empfang arbeiten sicher in einer Plattform zusammen."
+            }
+        ],
+        "deepDiveTitle": "Tiefer in entscheidende Abläufe eintauchen",
+        "deepDiveDescription": "asyncz bildet jede Phase der Customer Journey ab, damit nichts verloren geht.",
+        "analyticsHighlight": {
+            "title": "Operative Analytics in Echtzeit",
+            "description": "Überwache Auslastung, No-Show-Quote und Umsatz pro Ressource mit branchenspezifischen Dashboards.",
+            "metrics": [
+                "Performance-Snapshot pro Standort und Mitarbeiter",
+                "Stornogründe mit Handlungsempfehlungen",
+                "Kanal- und Kampagnen-Attribution"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "KI-Warteliste füllt freie Slots",
+            "description": "asyncz schlägt den passenden Gast anhand von Präferenzen, Entfernung und Umsatzhistorie vor.",
+            "metric": "27 % weniger Leerzeiten in deutschen Pilotstandorten."
+        },
+        "differentiatorTitle": "Warum asyncz mehr kann als Standard-Tools",
+        "differentiatorDescription": "Branchenspezifische Workflows halten Multi-Location-Teams synchron und blocken Spam sowie Wiederholungstäter.",
+        "differentiators": [
+            {
+                "title": "Blacklist-Schutz auf Enterprise-Niveau",
+                "description": "Erkenne Muster über E-Mail, Telefon und Zahlungsmittel."
+            },
+            {
+                "title": "Insights direkt im Workflow",
+                "description": "Teams sehen nur die Kennzahlen, die sie wirklich brauchen."
+            },
+            {
+                "title": "API ab Tag eins",
+                "description": "Verknüpfe eigene Apps und Partnerportale per Webhook oder REST."                
+            },
+            {
+                "title": "Lokalisierte Erlebnisse",
+                "description": "Sechs Sprachen für Inhalte, Benachrichtigungen und SEO."
+            }
+        ],
+        "finalCtaTitle": "Bereit, jeden Termin mit asyncz zu steuern?",
+        "finalCtaDescription": "Wir entwerfen deinen Rollout inklusive Automationen und Analytics in weniger als einer Woche.",
+        "finalPrimaryCta": "Strategietermin buchen",
+        "finalSecondaryCta": "Erfolgsgeschichten lesen"
+    },
+    "contactPage": {
+        "pageTitle": "Kontakt asyncz | Strategietermin buchen",
+        "metaDescription": "Kontaktiere asyncz für Demos, Preise oder Support. Telefon +1 (415) 555-0134, E-Mail info@asyncz.com oder Besuch in San Francisco.",
+        "keywords": [
+            "asyncz kontakt",
+            "asyncz support",
+            "asyncz telefon",
+            "asyncz email"
+        ],
+        "tagline": "Gemeinsam schneller werden",
+        "heroTitle": "Sprich mit dem asyncz-Team",
+        "heroSubtitle": "Teile Ziele und Standorte – wir bauen den Fahrplan für deine Organisation.",
+        "formTitle": "Nachricht senden",
+        "formSubtitle": "Wir melden uns innerhalb eines Werktages.",
+        "form": {
+            "name": "Vollständiger Name",
+            "namePlaceholder": "Max Mustermann",
+            "email": "Geschäftliche E-Mail",
+            "emailPlaceholder": "max@firma.de",
+            "company": "Unternehmen",
+            "companyPlaceholder": "Name der Organisation",
+            "phone": "Telefon (optional)",
+            "phonePlaceholder": "+49 30 123456",
+            "topic": "Anliegen",
+            "topicPlaceholder": "Thema auswählen",
+            "topics": [
+                "Produktdemo",
+                "Frage zu Preisen",
+                "Onboarding-Support",
+                "Partnerschaft",
+                "Presse"
+            ],
+            "message": "Wie können wir helfen?",
+            "messagePlaceholder": "Beschreibe Kontext, Zeitplan und beteiligte Standorte...",
+            "securityQuestion": "Wie viel ist {a} + {b}? (Spam-Schutz)",
+            "securityPlaceholder": "Antwort eingeben",
+            "submit": "Nachricht senden",
+            "success": "Danke! Wir melden uns zeitnah.",
+            "error": "Etwas ist schiefgelaufen. Bitte erneut versuchen."
+        },
+        "infoTitle": "Besuche unser Headquarter",
+        "hoursTitle": "Supportzeiten (Pazifik)",
+        "supportTitle": "Support & Onboarding",
+        "supportDescription": "Jeder asyncz-Plan enthält geführtes Onboarding, Automations-Checks und Coaching.",
+        "supportItems": {
+            "enterprise": "Rollout-Spezialisten für Filialnetze",
+            "email": "Postfach mit Antwort binnen 24 Stunden",
+            "training": "Live-Trainings und Zertifizierungen"
+        },
+        "days": {
+            "monday": "Montag",
+            "tuesday": "Dienstag",
+            "wednesday": "Mittwoch",
+            "thursday": "Donnerstag",
+            "friday": "Freitag",
+            "saturday": "Samstag",
+            "sunday": "Sonntag"
+        }
+    },
+    "blog": {
+        "pageTitle": "asyncz Blog | Ideen für KI-gestützte Terminplanung",
+        "metaDescription": "Artikel über KI-gestützte Terminplanung, Automationen und Analytics für Filialbetriebe.",
+        "keywords": [
+            "asyncz blog",
+            "terminplanung ki",
+            "mehrere standorte",
+            "asyncz automation"
+        ],
+        "tagline": "Insights für Service-Teams",
+        "heroTitle": "Planungsintelligenz für jede Filiale",
+        "heroSubtitle": "Strategien und Benchmarks für Operations-Leader, die zuverlässige Kundenreisen schaffen.",
+        "categories": ["Produkt", "Operationen", "Wachstum"],
+        "allLabel": "Alle Themen",
+        "readMore": "Artikel lesen",
+        "emptyState": "Keine Beiträge für diesen Filter.",
+        "articleNotFoundTitle": "Artikel nicht gefunden",
+        "articleNotFoundDescription": "Dieser Beitrag wurde entfernt. Schau dir die neuesten Insights an.",
+        "backToBlog": "Zurück zum Blog",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "KI-Playbook für Filialbetriebe",
+                "excerpt": "Frameworks, um Operations, Automationen und Analytics standortübergreifend zu vereinen.",
+                "content": [
+                    "Mit jedem neuen Standort steigt die Komplexität. asyncz bündelt Regeln zentral, damit jedes Team dem gleichen Playbook folgt.",
+                    "Definiere Services, Verfügbarkeiten und Ausnahmen einmalig. asyncz spielt sie automatisch auf alle Standorte aus.",
+                    "Analytics zeigen Auslastung, Nachfrage und Engpässe, bevor sie den Kundendienst treffen."
+                ],
+                "category": "Produkt",
+                "author": "Asyncz Redaktion",
+                "published": "2025-09-10",
+                "readingTime": "Lesezeit 6 Minuten",
+                "tags": ["terminplanung", "ki", "filialen"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Automations-Blueprint gegen No-Shows",
+                "excerpt": "Schablonen, die Kalender füllen und Kunden verbindlich halten.",
+                "content": [
+                    "Kombiniere Bestätigungen, Zahlungsregeln und Reminder, um No-Shows drastisch zu reduzieren.",
+                    "asyncz versendet Erinnerungen über WhatsApp, SMS oder E-Mail – je nach Präferenz des Kunden.",
+                    "Definiere Eskalationen für wichtige Termine und aktiviere automatisch Wartelisten-Einladungen."
+                ],
+                "category": "Operationen",
+                "author": "Asyncz Customer Success",
+                "published": "2025-08-22",
+                "readingTime": "Lesezeit 5 Minuten",
+                "tags": ["automation", "no-shows", "kundenbindung"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Analytics-Leitfaden für Betreiber",
+                "excerpt": "Dashboards und Kennzahlen, mit denen asyncz-Kunden wachsen.",
+                "content": [
+                    "asyncz beleuchtet Conversion-, Retention- und Rebooking-Trends statt nur einfache Zählungen.",
+                    "Vergleiche Standorte hinsichtlich Auslastung, Personaleffizienz und Kanalperformance.",
+                    "Nutze diese Erkenntnisse für Marketing- und Einstellungsplanung, um die richtigen Gäste zu gewinnen."
+                ],
+                "category": "Wachstum",
+                "author": "Asyncz Datenteam",
+                "published": "2025-08-05",
+                "readingTime": "Lesezeit 7 Minuten",
+                "tags": ["analytics", "wachstum", "dashboard"]
+            }
+        ]
+    }
+}
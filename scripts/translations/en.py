@@ -0,0 +1,232 @@
+# Updates merged into src/locales/en.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Blog"},
+    "contact": {"goToContactPage": "View contact page"},
+    "locationSpotlight": {
+        "tagline": "Local expertise",
+        "title": "asyncz for teams across the globe",
+        "description": "Keep branches aligned from coast to coast with localized booking experiences, AI routing, and region-ready automations.",
+        "ctaLabel": "See how asyncz supports global teams",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "State-compliant scheduling",
+                "description": "Apply state and city blackout periods, service taxes, and provider rules without creating duplicate calendars."
+            },
+            {
+                "icon": "users",
+                "title": "Bilingual frontline support",
+                "description": "English and Spanish onboarding specialists keep every front desk confident and aligned."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "You found a missing timeslot",
+        "title": "This page is off the schedule",
+        "subtitle": "The URL you followed no longer exists. Explore asyncz resources to get back on track.",
+        "primaryCta": "Return to homepage",
+        "secondaryCta": "Contact support",
+        "linkDescription": "Discover more about {section}.",
+        "explore": "Explore"
+    },
+    "featuresPage": {
+        "pageTitle": "Features - asyncz | AI Scheduling Workflows",
+        "metaDescription": "Explore asyncz features including multi-branch orchestration, blacklist protection, analytics dashboards, and AI waitlists.",
+        "keywords": [
+            "asyncz features",
+            "ai scheduling",
+            "waitlist automation",
+            "multi-branch calendar",
+            "asyncz analytics"
+        ],
+        "tagline": "Product tour",
+        "heroTitle": "All-in-one orchestration for every appointment flow",
+        "heroSubtitle": "asyncz unifies booking, routing, reminders, and insights so your teams deliver consistent service across every branch.",
+        "primaryCta": "Compare pricing plans",
+        "secondaryCta": "Talk to sales",
+        "coreTitle": "Core capabilities that scale with your branches",
+        "coreDescription": "From intelligent calendars to branded communications, asyncz was built to streamline complex operations without extra headcount.",
+        "deepDives": [
+            {
+                "title": "Multi-location capacity planning",
+                "description": "Balance demand across locations with smart availability windows, padding rules, and staffing thresholds."
+            },
+            {
+                "title": "Automated communication flows",
+                "description": "Trigger confirmations, reminders, and follow-ups through WhatsApp, SMS, and email—no manual chasing required."
+            },
+            {
+                "title": "Role-aware access controls",
+                "description": "Give HQ, branch managers, and front-desk teams the right tools without compromising security or auditability."
+            }
+        ],
+        "deepDiveTitle": "Go deeper into the workflows that matter",
+        "deepDiveDescription": "asyncz maps every step of the customer journey, from discovery to rebooking, so nothing slips through the cracks.",
+        "analyticsHighlight": {
+            "title": "Operational analytics in real time",
+            "description": "Track utilization, no-show impact, and revenue per seat with dashboards built for service brands.",
+            "metrics": [
+                "Branch and provider performance snapshots",
+                "Cancellation reasons with recovery suggestions",
+                "Marketing source attribution with conversion trends"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "AI waitlist that fills empty seats",
+            "description": "asyncz recommends the best client to invite based on preferences, travel time, and historical spend so every slot is protected.",
+            "metric": "Average 27% fewer unfilled slots across pilot branches."
+        },
+        "differentiatorTitle": "Why asyncz beats generic booking tools",
+        "differentiatorDescription": "Purpose-built workflows keep multi-location teams aligned while protecting against no-shows and spam traffic.",
+        "differentiators": [
+            {
+                "title": "Enterprise-grade blacklist protection",
+                "description": "Stop repeat no-shows with pattern detection across email, phone, and payment methods."
+            },
+            {
+                "title": "Embedded analytics for every role",
+                "description": "Surface the insights each teammate needs without sending them to spreadsheets."
+            },
+            {
+                "title": "API-ready from day one",
+                "description": "Sync availability with custom apps and partner marketplaces through secure webhooks and REST APIs."
+            },
+            {
+                "title": "Localized experiences",
+                "description": "Serve customers in six languages with localized content, notifications, and SEO-ready pages."
+            }
+        ],
+        "finalCtaTitle": "Ready to orchestrate every appointment with asyncz?",
+        "finalCtaDescription": "Our team will blueprint your branches, automations, and analytics in less than a week.",
+        "finalPrimaryCta": "Book a strategy session",
+        "finalSecondaryCta": "Read customer stories"
+    },
+    "contactPage": {
+        "pageTitle": "Contact asyncz | Schedule a strategy session",
+        "metaDescription": "Reach asyncz for demos, pricing, or support. Call +1 (415) 555-0134, email info@asyncz.com, or visit our San Francisco office.",
+        "keywords": [
+            "asyncz contact",
+            "asyncz support",
+            "asyncz phone",
+            "asyncz email"
+        ],
+        "tagline": "Let's build your scheduling advantage",
+        "heroTitle": "Connect with the asyncz team",
+        "heroSubtitle": "Share your goals and we'll tailor a rollout plan for your branches, staff, and customers.",
+        "formTitle": "Send us a message",
+        "formSubtitle": "Tell us how we can help and we’ll respond within one business day.",
+        "form": {
+            "name": "Full name",
+            "namePlaceholder": "Alex Johnson",
+            "email": "Work email",
+            "emailPlaceholder": "alex@yourcompany.com",
+            "company": "Company",
+            "companyPlaceholder": "Your organization",
+            "phone": "Phone (optional)",
+            "phonePlaceholder": "+1 415 555 0134",
+            "topic": "Topic",
+            "topicPlaceholder": "Select a topic",
+            "topics": [
+                "Product demo",
+                "Pricing question",
+                "Onboarding support",
+                "Partnership opportunity",
+                "Press inquiry"
+            ],
+            "message": "How can we help?",
+            "messagePlaceholder": "Share context, timelines, and the branches you want to enable...",
+            "securityQuestion": "What is {a} + {b}? (spam check)",
+            "securityPlaceholder": "Enter the answer",
+            "submit": "Send message",
+            "success": "Thanks! We'll respond within one business day.",
+            "error": "Something went wrong. Please try again."
+        },
+        "infoTitle": "Visit our headquarters",
+        "hoursTitle": "Support hours (Pacific Time)",
+        "supportTitle": "Support & onboarding",
+        "supportDescription": "Every asyncz plan includes guided onboarding, automation audits, and operations coaching.",
+        "supportItems": {
+            "enterprise": "Enterprise rollout specialists for multi-location teams",
+            "email": "Dedicated inbox with <24h response times",
+            "training": "Live training sessions and certification tracks"
+        },
+        "days": {
+            "monday": "Monday",
+            "tuesday": "Tuesday",
+            "wednesday": "Wednesday",
+            "thursday": "Thursday",
+            "friday": "Friday",
+            "saturday": "Saturday",
+            "sunday": "Sunday"
+        }
+    },
+    "blog": {
+        "pageTitle": "asyncz Blog | AI Scheduling Ideas",
+        "metaDescription": "Read asyncz insights on AI scheduling, automation workflows, and multi-branch analytics.",
+        "keywords": [
+            "asyncz blog",
+            "ai scheduling tips",
+            "multi-branch operations",
+            "asyncz automation"
+        ],
+        "tagline": "Insights for modern service teams",
+        "heroTitle": "Scheduling intelligence for every branch",
+        "heroSubtitle": "Playbooks, frameworks, and benchmarks for operations leaders building reliable customer journeys.",
+        "categories": ["Product", "Operations", "Growth"],
+        "allLabel": "All topics",
+        "readMore": "Read article",
+        "emptyState": "No articles match this filter yet.",
+        "articleNotFoundTitle": "Article not found",
+        "articleNotFoundDescription": "This story may have been unpublished. Explore the latest posts instead.",
+        "backToBlog": "Back to blog",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "AI Scheduling Playbook for Multi-Branch Teams",
+                "excerpt": "Frameworks to align operations, automations, and analytics across every location.",
+                "content": [
+                    "Operational complexity scales quickly when your brand expands. asyncz centralizes rules so every branch follows the same, proven playbook.",
+                    "Start by mapping your services, availability rules, and exceptions. asyncz's rule engine lets you apply them once and reuse them everywhere.",
+                    "Layer analytics on top to keep leadership aware of utilization, demand, and bottlenecks before they affect the customer experience."
+                ],
+                "category": "Product",
+                "author": "Asyncz Editorial Team",
+                "published": "2025-09-10",
+                "readingTime": "6 min read",
+                "tags": ["ai scheduling", "playbook", "multi-branch"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Automation Blueprint: Reduce No-Shows with asyncz",
+                "excerpt": "Step-by-step automation templates to keep calendars full and customers accountable.",
+                "content": [
+                    "Combine confirmation windows, payment rules, and reminder cadences to dramatically cut no-shows without adding admin overhead.",
+                    "asyncz connects WhatsApp, SMS, and email so your customers always receive nudges on their preferred channel.",
+                    "Use escalation paths for high-value appointments and automatically trigger waitlist invitations when a slot opens."
+                ],
+                "category": "Operations",
+                "author": "Asyncz Customer Success",
+                "published": "2025-08-22",
+                "readingTime": "5 min read",
+                "tags": ["automation", "no-shows", "customer experience"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Analytics Guide for Multi-Branch Operators",
+                "excerpt": "Dashboards and metrics asyncz customers track to increase utilization and revenue.",
+                "content": [
+                    "Beyond basic counts, asyncz highlights the conversion, retention, and rebooking trends that predict revenue.",
+                    "Benchmark each branch on utilization, staffing efficiency, and channel performance to prioritize coaching.",
+                    "Feed these insights back into marketing and hiring plans so you keep winning the right customers at the right time."
+                ],
+                "category": "Growth",
+                "author": "Asyncz Data Team",
+                "published": "2025-08-05",
+                "readingTime": "7 min read",
+                "tags": ["analytics", "growth", "dashboards"]
+            }
+        ]
+    }
+}
@@ -0,0 +1,232 @@
+# Updates merged into src/locales/es.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Blog"},
+    "contact": {"goToContactPage": "Ver página de contacto"},
+    "locationSpotlight": {
+        "tagline": "Equipos locales",
+        "title": "asyncz para equipos en España",
+        "description": "Coordina sucursales de Madrid a Barcelona con reservas localizadas, reglas fiscales y automatizaciones adaptadas a cada provincia.",
+        "ctaLabel": "Habla con nuestro equipo en España",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "Cumplimiento autonómico",
+                "description": "Gestiona festivos regionales, franjas horarias y tipos de IVA sin duplicar calendarios."
+            },
+            {
+                "icon": "users",
+                "title": "Soporte bilingüe",
+                "description": "Especialistas en español e inglés acompañan a tus recepciones durante el despliegue."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "Has encontrado un hueco vacío",
+        "title": "Esta página no está disponible",
+        "subtitle": "El enlace que seguiste ya no existe. Explora los recursos de asyncz para continuar.",
+        "primaryCta": "Volver al inicio",
+        "secondaryCta": "Contactar soporte",
+        "linkDescription": "Descubre más sobre {section}.",
+        "explore": "Explorar"
+    },
+    "featuresPage": {
+        "pageTitle": "Funciones - asyncz | Flujos de programación con IA",
+        "metaDescription": "Descubre las funciones de asyncz: orquestación multisedes, protección contra listas negras, analítica y listas de espera inteligentes.",
+        "keywords": [
+            "funciones asyncz",
+            "agenda inteligente",
+            "automatización de listas de espera",
+            "calendario multisedes",
+            "analítica asyncz"
+        ],
+        "tagline": "Recorrido del producto",
+        "heroTitle": "Orquestación integral para cada cita",
+        "heroSubtitle": "asyncz unifica reservas, enrutamiento, recordatorios y analítica para ofrecer experiencias consistentes en todas tus sedes.",
+        "primaryCta": "Comparar planes",
+        "secondaryCta": "Hablar con ventas",
+        "coreTitle": "Capacidades clave que crecen contigo",
+        "coreDescription": "Desde calendarios inteligentes hasta comunicaciones personalizadas, asyncz simplifica operaciones complejas sin añadir carga administrativa.",
+        "deepDives": [
+            {
+                "title": "Planificación de capacidad multisedes",
+                "description": "Equilibra la demanda con ventanas de disponibilidad, reglas de desplazamiento y límites de personal."
+            },
+            {
+                "title": "Flujos de comunicación automatizados",
+                "description": "Envía confirmaciones, recordatorios y seguimientos por WhatsApp, SMS o email sin trabajo manual."
+            },
+            {
+                "title": "Accesos según rol",
+                "description": "Da a dirección, encargados y recepción las herramientas correctas manteniendo la seguridad."
+            }
+        ],
+        "deepDiveTitle": "Profundiza en los flujos que importan",
+        "deepDiveDescription": "asyncz mapea cada paso del viaje del cliente para que ningún detalle se pierda entre sedes.",
+        "analyticsHighlight": {
+            "title": "Analítica operativa en tiempo real",
+            "description": "Supervisa utilización, impacto de ausencias e ingresos por recurso con paneles diseñados para marcas de servicios.",
+            "metrics": [
+                "Instantáneas de rendimiento por sede y profesional",
+                "Motivos de cancelación con recomendaciones de recuperación",
+                "Atribución de canales y tendencias de conversión"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "Lista de espera con IA",
+            "description": "asyncz propone al cliente ideal según preferencias, tiempo de desplazamiento e historial de gasto para que cada hueco se aproveche.",
+            "metric": "27 % menos huecos sin cubrir en los pilotos de varias franquicias."
+        },
+        "differentiatorTitle": "Por qué asyncz supera a las agendas genéricas",
+        "differentiatorDescription": "Flujos específicos mantienen alineados a equipos multisedes mientras bloquean el spam y las ausencias repetidas.",
+        "differentiators": [
+            {
+                "title": "Protección avanzada contra listas negras",
+                "description": "Detecta patrones en correo, teléfono y pagos para frenar reincidencias."
+            },
+            {
+                "title": "Analítica integrada por rol",
+                "description": "Cada equipo recibe los indicadores que necesita sin hojas de cálculo."
+            },
+            {
+                "title": "API lista desde el día uno",
+                "description": "Sincroniza disponibilidad con apps propias y marketplaces mediante webhooks seguros."
+            },
+            {
+                "title": "Experiencias localizadas",
+                "description": "Contenido, notificaciones y SEO listos en seis idiomas."
+            }
+        ],
+        "finalCtaTitle": "¿Listo para orquestar todas tus citas con asyncz?",
+        "finalCtaDescription": "Diseñamos tu plan de sucursales, automatizaciones y analítica en menos de una semana.",
+        "finalPrimaryCta": "Reserva una sesión estratégica",
+        "finalSecondaryCta": "Leer casos de clientes"
+    },
+    "contactPage": {
+        "pageTitle": "Contacto asyncz | Solicita una sesión estratégica",
+        "metaDescription": "Contacta con asyncz para demos, precios o soporte. Llama al +1 (415) 555-0134, escribe a info@asyncz.com o visita nuestra oficina de San Francisco.",
+        "keywords": [
+            "contacto asyncz",
+            "soporte asyncz",
+            "teléfono asyncz",
+            "correo asyncz"
+        ],
+        "tagline": "Construyamos tu ventaja",
+        "heroTitle": "Conecta con el equipo de asyncz",
+        "heroSubtitle": "Comparte tus objetivos y prepararemos un plan de despliegue para tus sucursales y equipos.",
+        "formTitle": "Envíanos un mensaje",
+        "formSubtitle": "Te responderemos en menos de un día laborable.",
+        "form": {
+            "name": "Nombre completo",
+            "namePlaceholder": "Laura Gómez",
+            "email": "Correo corporativo",
+            "emailPlaceholder": "laura@tuempresa.com",
+            "company": "Empresa",
+            "companyPlaceholder": "Nombre de la organización",
+            "phone": "Teléfono (opcional)",
+            "phonePlaceholder": "+34 600 123 123",
+            "topic": "Tema",
+            "topicPlaceholder": "Selecciona un tema",
+            "topics": [
+                "Demostración del producto",
+                "Pregunta sobre precios",
+                "Soporte de implementación",
+                "Oportunidad de alianza",
+                "Prensa"
+            ],
+            "message": "¿Cómo podemos ayudarte?",
+            "messagePlaceholder": "Describe contexto, plazos y las sedes que quieres activar...",
+            "securityQuestion": "¿Cuánto es {a} + {b}? (control anti-spam)",
+            "securityPlaceholder": "Introduce la respuesta",
+            "submit": "Enviar mensaje",
+            "success": "¡Gracias! Te contactaremos en breve.",
+            "error": "Ha ocurrido un error. Intenta de nuevo."
+        },
+        "infoTitle": "Visita nuestra oficina",
+        "hoursTitle": "Horario de soporte (hora del Pacífico)",
+        "supportTitle": "Soporte y onboarding",
+        "supportDescription": "Todos los planes de asyncz incluyen acompañamiento, auditorías de automatización y sesiones de coaching.",
+        "supportItems": {
+            "enterprise": "Especialistas en despliegues multisedes",
+            "email": "Buzón dedicado con respuesta inferior a 24h",
+            "training": "Formaciones en directo y certificaciones"
+        },
+        "days": {
+            "monday": "Lunes",
+            "tuesday": "Martes",
+            "wednesday": "Miércoles",
+            "thursday": "Jueves",
+            "friday": "Viernes",
+            "saturday": "Sábado",
+            "sunday": "Domingo"
+        }
+    },
+    "blog": {
+        "pageTitle": "Blog asyncz | Ideas de programación inteligente",
+        "metaDescription": "Lee artículos sobre programación con IA, automatización y analítica para operadores multisedes.",
+        "keywords": [
+            "blog asyncz",
+            "programación inteligente",
+            "operaciones multisedes",
+            "automatización asyncz"
+        ],
+        "tagline": "Ideas para equipos de servicios",
+        "heroTitle": "Inteligencia de programación para cada sucursal",
+        "heroSubtitle": "Manual práctico para líderes de operaciones que quieren experiencias coherentes y predecibles.",
+        "categories": ["Producto", "Operaciones", "Crecimiento"],
+        "allLabel": "Todos los temas",
+        "readMore": "Leer artículo",
+        "emptyState": "No hay publicaciones con este filtro todavía.",
+        "articleNotFoundTitle": "Artículo no encontrado",
+        "articleNotFoundDescription": "Puede que la publicación haya sido retirada. Consulta las últimas novedades.",
+        "backToBlog": "Volver al blog",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "Guía de programación con IA para equipos multisedes",
+                "excerpt": "Métodos para alinear operaciones, automatizaciones y analítica en todas tus ubicaciones.",
+                "content": [
+                    "Cuando creces, la complejidad operativa se multiplica. asyncz centraliza las reglas para que cada sede trabaje con el mismo playbook.",
+                    "Empieza definiendo servicios, reglas de disponibilidad y excepciones. Con asyncz los aplicas una vez y se reutilizan en todas las sedes.",
+                    "Añade analítica para detectar utilización, demanda y cuellos de botella antes de que afecten al cliente."
+                ],
+                "category": "Producto",
+                "author": "Equipo editorial de Asyncz",
+                "published": "2025-09-10",
+                "readingTime": "Lectura de 6 minutos",
+                "tags": ["programación ia", "manual", "multisede"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Automatización para reducir ausencias con asyncz",
+                "excerpt": "Plantillas que mantienen la agenda llena y clientes responsables.",
+                "content": [
+                    "Combina ventanas de confirmación, reglas de pago y recordatorios para reducir ausencias sin más carga administrativa.",
+                    "asyncz integra WhatsApp, SMS y email para que cada cliente reciba avisos en su canal preferido.",
+                    "Crea rutas de escalado para citas críticas y activa invitaciones de lista de espera cuando se libere un hueco."
+                ],
+                "category": "Operaciones",
+                "author": "Customer Success de Asyncz",
+                "published": "2025-08-22",
+                "readingTime": "Lectura de 5 minutos",
+                "tags": ["automatización", "ausencias", "experiencia cliente"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Analítica para operadores multisedes",
+                "excerpt": "Paneles e indicadores que los clientes de asyncz usan para crecer.",
+                "content": [
+                    "Más allá de los conteos básicos, asyncz muestra tendencias de conversión, retención y rebooking que anticipan ingresos.",
+                    "Compara cada sede en utilización, eficiencia de personal y rendimiento de canales para priorizar formación.",
+                    "Usa estas métricas para planificar marketing y contratación ganando a los clientes correctos en el momento adecuado."
+                ],
+                "category": "Crecimiento",
+                "author": "Equipo de Datos de Asyncz",
+                "published": "2025-08-05",
+                "readingTime": "Lectura de 7 minutos",
+                "tags": ["analítica", "crecimiento", "paneles"]
+            }
+        ]
+    }
+}
@@ -0,0 +1,232 @@
+# Updates merged into src/locales/fr.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Blog"},
+    "contact": {"goToContactPage": "Voir la page contact"},
+    "locationSpotlight": {
+        "tagline": "Expertise locale",
+        "title": "asyncz pour les équipes en France",
+        "description": "Synchronisez vos agences de Paris à Lyon grâce à des parcours de réservation localisés, des règles fiscales et des automatisations adaptées à chaque région.",
+        "ctaLabel": "Rencontrer notre équipe France",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "Conformité régionale automatique",
+                "description": "Gérez jours fériés, TVA et contraintes de service de chaque région sans dupliquer vos calendriers."
+            },
+            {
+                "icon": "users",
+                "title": "Support bilingue FR/EN",
+                "description": "Des spécialistes accompagnent vos accueils pendant tout le déploiement."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "Vous avez trouvé un créneau vide",
+        "title": "Cette page n'est pas planifiée",
+        "subtitle": "Le lien suivi n'existe plus. Découvrez les ressources asyncz pour revenir au planning.",
+        "primaryCta": "Retour à l'accueil",
+        "secondaryCta": "Contacter le support",
+        "linkDescription": "En savoir plus sur {section}.",
+        "explore": "Explorer"
+    },
+    "featuresPage": {
+        "pageTitle": "Fonctionnalités - asyncz | Flux de planification IA",
+        "metaDescription": "Découvrez les fonctionnalités d'asyncz : orchestration multi-sites, protection blacklist, tableaux d'analytics et listes d'attente IA.",
+        "keywords": [
+            "fonctionnalités asyncz",
+            "planification ia",
+            "automatisation liste d'attente",
+            "calendrier multi-site",
+            "analytique asyncz"
+        ],
+        "tagline": "Parcours produit",
+        "heroTitle": "Orchestration tout-en-un pour chaque parcours de rendez-vous",
+        "heroSubtitle": "asyncz unifie la réservation, le routage, les rappels et les insights pour offrir une expérience homogène dans chaque agence.",
+        "primaryCta": "Comparer les forfaits",
+        "secondaryCta": "Parler à nos experts",
+        "coreTitle": "Des capacités clés qui suivent votre croissance",
+        "coreDescription": "Des calendriers intelligents aux communications personnalisées, asyncz simplifie les opérations complexes sans ajouter de charge.",
+        "deepDives": [
+            {
+                "title": "Planification de capacité multi-sites",
+                "description": "Équilibrez la demande avec des fenêtres de disponibilité, des règles de déplacement et des seuils d'équipe."
+            },
+            {
+                "title": "Flux de communication automatisés",
+                "description": "Déclenchez confirmations, rappels et suivis via WhatsApp, SMS et email sans relances manuelles."
+            },
+            {
+                "title": "Contrôles d'accès selon les rôles",
+                "description": "Offrez aux sièges, responsables et accueils les bons outils sans sacrifier la sécurité."
+            }
+        ],
+        "deepDiveTitle": "Approfondissez les flux essentiels",
+        "deepDiveDescription": "asyncz cartographie chaque étape du parcours client afin qu'aucune opportunité ne se perde.",
+        "analyticsHighlight": {
+            "title": "Analyses opérationnelles en temps réel",
+            "description": "Suivez l'utilisation, l'impact des absences et le chiffre d'affaires par ressource avec des tableaux conçus pour les marques de services.",
+            "metrics": [
+                "Performance des agences et collaborateurs en un coup d'œil",
+                "Raisons d'annulation avec actions correctives",
+                "Attribution marketing et tendances de conversion"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "Liste d'attente IA qui remplit chaque créneau",
+            "description": "asyncz propose le client idéal selon ses préférences, le temps de trajet et l'historique de dépenses pour exploiter chaque créneau.",
+            "metric": "Jusqu'à 27 % de créneaux non remplis en moins dans les réseaux pilotes."
+        },
+        "differentiatorTitle": "Pourquoi asyncz dépasse les outils génériques",
+        "differentiatorDescription": "Des workflows conçus pour votre secteur maintiennent les équipes multi-sites alignées tout en bloquant les absences et le trafic indésirable.",
+        "differentiators": [
+            {
+                "title": "Protection blacklist de niveau entreprise",
+                "description": "Détectez les répétitions via email, téléphone et paiement pour sécuriser vos agendas."
+            },
+            {
+                "title": "Analyses intégrées pour chaque rôle",
+                "description": "Chaque équipe visualise les indicateurs dont elle a besoin sans tableurs."
+            },
+            {
+                "title": "API prête dès le premier jour",
+                "description": "Synchronisez disponibilités avec vos applications et marketplaces via webhooks sécurisés."
+            },
+            {
+                "title": "Expériences localisées",
+                "description": "Servez vos clients dans six langues avec contenu, notifications et pages SEO prêtes."
+            }
+        ],
+        "finalCtaTitle": "Prêt à orchestrer chaque rendez-vous avec asyncz ?",
+        "finalCtaDescription": "Notre équipe modélise vos agences, automatisations et tableaux de bord en moins d'une semaine.",
+        "finalPrimaryCta": "Planifier une session stratégique",
+        "finalSecondaryCta": "Lire les témoignages clients"
+    },
+    "contactPage": {
+        "pageTitle": "Contact asyncz | Planifier une session stratégique",
+        "metaDescription": "Contactez asyncz pour une démo, les tarifs ou le support. Appelez le +1 (415) 555-0134, écrivez à info@asyncz.com ou rendez-vous à notre bureau de San Francisco.",
+        "keywords": [
+            "contact asyncz",
+            "support asyncz",
+            "téléphone asyncz",
+            "email asyncz"
+        ],
+        "tagline": "Construisons ensemble votre avantage planning",
+        "heroTitle": "Connectez-vous avec l'équipe asyncz",
+        "heroSubtitle": "Partagez vos objectifs et nous préparerons un plan de déploiement pour vos agences, équipes et clients.",
+        "formTitle": "Envoyez-nous un message",
+        "formSubtitle": "Dites-nous comment aider et nous répondrons sous un jour ouvré.",
+        "form": {
+            "name": "Nom complet",
+            "namePlaceholder": "Camille Dupont",
+            "email": "Email professionnel",
+            "emailPlaceholder": "camille@votreentreprise.fr",
+            "company": "Entreprise",
+            "companyPlaceholder": "Nom de l'organisation",
+            "phone": "Téléphone (optionnel)",
+            "phonePlaceholder": "+33 1 23 45 67 89",
+            "topic": "Sujet",
+            "topicPlaceholder": "Choisir un sujet",
+            "topics": [
+                "Démo produit",
+                "Question sur les tarifs",
+                "Support d'onboarding",
+                "Opportunité de partenariat",
+                "Presse"
+            ],
+            "message": "Comment pouvons-nous aider ?",
+            "messagePlaceholder": "Partagez le contexte, l'échéance et les agences à activer...",
+            "securityQuestion": "Combien font {a} + {b} ? (anti-spam)",
+            "securityPlaceholder": "Saisir la réponse",
+            "submit": "Envoyer le message",
+            "success": "Merci ! Nous vous répondrons sous un jour ouvré.",
+            "error": "Une erreur est survenue. Merci de réessayer."
+        },
+        "infoTitle": "Visitez notre siège",
+        "hoursTitle": "Heures de support (heure du Pacifique)",
+        "supportTitle": "Support et accompagnement",
+        "supportDescription": "Chaque offre asyncz inclut un onboarding guidé, des audits d'automatisation et du coaching opérationnel.",
+        "supportItems": {
+            "enterprise": "Spécialistes du déploiement multi-sites",
+            "email": "Boîte dédiée avec réponse en moins de 24 h",
+            "training": "Sessions en direct et parcours de certification"
+        },
+        "days": {
+            "monday": "Lundi",
+            "tuesday": "Mardi",
+            "wednesday": "Mercredi",
+            "thursday": "Jeudi",
+            "friday": "Vendredi",
+            "saturday": "Samedi",
+            "sunday": "Dimanche"
+        }
+    },
+    "blog": {
+        "pageTitle": "Blog asyncz | Idées de planification intelligente",
+        "metaDescription": "Découvrez les insights asyncz sur la planification par IA, les workflows d'automatisation et l'analytique multi-sites.",
+        "keywords": [
+            "blog asyncz",
+            "idées planification ia",
+            "opérations multi-sites",
+            "automatisation asyncz"
+        ],
+        "tagline": "Idées pour les équipes de services modernes",
+        "heroTitle": "Intelligence de planification pour chaque agence",
+        "heroSubtitle": "Guides, frameworks et benchmarks pour les responsables opérations qui veulent des parcours clients fiables.",
+        "categories": ["Produit", "Opérations", "Croissance"],
+        "allLabel": "Tous les sujets",
+        "readMore": "Lire l’article",
+        "emptyState": "Aucun article ne correspond encore à ce filtre.",
+        "articleNotFoundTitle": "Article introuvable",
+        "articleNotFoundDescription": "Ce contenu n’est peut-être plus disponible. Consultez plutôt nos dernières publications.",
+        "backToBlog": "Retour au blog",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "Playbook de planification IA pour réseaux multi-sites",
+                "excerpt": "Des frameworks pour aligner opérations, automatisations et analytique dans toutes vos agences.",
+                "content": [
+                    "Quand votre réseau s'étend, la complexité explose. asyncz centralise les règles pour que chaque site suive le même playbook.",
+                    "Commencez par cartographier services, règles de disponibilité et exceptions. Avec asyncz, vous les appliquez une fois et les réutilisez partout.",
+                    "Ajoutez l'analytique pour garder la direction informée de l'utilisation, de la demande et des goulots d'étranglement avant qu'ils n'affectent l'expérience client."
+                ],
+                "category": "Produit",
+                "author": "Équipe éditoriale d'Asyncz",
+                "published": "2025-09-10",
+                "readingTime": "Lecture 6 min",
+                "tags": ["planification ia", "playbook", "multi-site"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Blueprint d’automatisation : réduire les absences avec asyncz",
+                "excerpt": "Des modèles étape par étape pour garder un agenda plein et responsabiliser vos clients.",
+                "content": [
+                    "Associez fenêtres de confirmation, règles de paiement et rappels pour réduire drastiquement les absences.",
+                    "asyncz envoie des rappels via WhatsApp, SMS ou email selon le canal favori du client.",
+                    "Définissez des escalades pour les rendez-vous critiques et déclenchez automatiquement les invitations de liste d'attente."
+                ],
+                "category": "Opérations",
+                "author": "Succès client asyncz",
+                "published": "2025-08-22",
+                "readingTime": "Lecture 5 min",
+                "tags": ["automatisation", "absences", "expérience client"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Guide analytique pour opérateurs multi-sites",
+                "excerpt": "Tableaux de bord et indicateurs suivis par les clients asyncz pour accroître l’utilisation et les revenus.",
+                "content": [
+                    "Au-delà des volumes, asyncz met en lumière les tendances de conversion, de fidélisation et de rebooking qui prédisent le chiffre d'affaires.",
+                    "Comparez chaque agence sur l'utilisation, l'efficacité des équipes et la performance des canaux pour cibler le coaching.",
+                    "Réinjectez ces insights dans vos plans marketing et recrutement pour attirer les bons clients au bon moment."
+                ],
+                "category": "Croissance",
+                "author": "Équipe data asyncz",
+                "published": "2025-08-05",
+                "readingTime": "Lecture 7 min",
+                "tags": ["analytique", "croissance", "tableaux de bord"]
+            }
+        ]
+    }
+}
@@ -0,0 +1,232 @@
+# Updates merged into src/locales/tr.json by scripts/update_locales.py.
+
+updates = {
+    "navigation": {"blog": "Blog"},
+    "contact": {"goToContactPage": "İletişim sayfasını görüntüle"},
+    "locationSpotlight": {
+        "tagline": "Yerel uzmanlık",
+        "title": "asyncz Türkiye ekipleri için",
+        "description": "İstanbul'dan Ankara'ya kadar şubelerinizi yerelleştirilmiş rezervasyon deneyimleri, vergi kuralları ve bölgeye hazır otomasyonlarla senkronize edin.",
+        "ctaLabel": "Türkiye ekibimizle iletişime geçin",
+        "ctaHref": "/contact",
+        "highlights": [
+            {
+                "icon": "map",
+                "title": "Bölgesel uyumluluk otomatik",
+                "description": "Her il için resmi tatilleri, vergi türlerini ve hizmet kısıtlarını takvimleri çoğaltmadan yönetin."
+            },
+            {
+                "icon": "users",
+                "title": "İki dilli saha desteği",
+                "description": "Türkçe ve İngilizce uzmanlarımız resepsiyon ekiplerinizi tüm kurulum boyunca destekler."
+            }
+        ]
+    },
+    "notFound": {
+        "tagline": "Boş bir zaman aralığı buldunuz",
+        "title": "Bu sayfa planınızda yok",
+        "subtitle": "Ulaştığınız bağlantı artık mevcut değil. Programınıza geri dönmek için asyncz kaynaklarını keşfedin.",
+        "primaryCta": "Ana sayfaya dön",
+        "secondaryCta": "Destekle iletişime geç",
+        "linkDescription": "{section} hakkında daha fazla bilgi alın.",
+        "explore": "Keşfet"
+    },
+    "featuresPage": {
+        "pageTitle": "Özellikler - asyncz | Yapay zekâ destekli planlama akışları",
+        "metaDescription": "asyncz özelliklerini keşfedin: çok şubeli orkestrasyon, kara liste koruması, analitik panolar ve yapay zekâ bekleme listeleri.",
+        "keywords": [
+            "asyncz özellikler",
+            "yapay zekâ planlama",
+            "bekleme listesi otomasyonu",
+            "çok şubeli takvim",
+            "asyncz analitik"
+        ],
+        "tagline": "Ürün turu",
+        "heroTitle": "Her randevu akışı için tek platform",
+        "heroSubtitle": "asyncz rezervasyon, yönlendirme, hatırlatmalar ve içgörüleri birleştirerek tüm şubelerde tutarlı hizmet sunar.",
+        "primaryCta": "Paketleri karşılaştır",
+        "secondaryCta": "Satış ekibiyle konuş",
+        "coreTitle": "Şubelerinizle birlikte ölçeklenen temel yetenekler",
+        "coreDescription": "Akıllı takvimlerden markalı iletişime kadar asyncz, ek iş gücüne ihtiyaç duymadan karmaşık operasyonları sadeleştirir.",
+        "deepDives": [
+            {
+                "title": "Çok lokasyonlu kapasite planlama",
+                "description": "Talebi uygunluk pencereleri, tampon süreler ve ekip limitleriyle dengeleyin."
+            },
+            {
+                "title": "Otomatik iletişim akışları",
+                "description": "Onay, hatırlatma ve takip mesajlarını WhatsApp, SMS ve e-posta üzerinden otomatik gönderin."
+            },
+            {
+                "title": "Role göre yetkilendirme",
+                "description": "Merkez, şube yöneticileri ve resepsiyon ekiplerine güvenliği bozmadan doğru araçları sağlayın."
+            }
+        ],
+        "deepDiveTitle": "Önemli akışları yakından inceleyin",
+        "deepDiveDescription": "asyncz müşteri yolculuğunun her adımını eşler; böylece hiçbir fırsat kaçmaz.",
+        "analyticsHighlight": {
+            "title": "Gerçek zamanlı operasyon analitiği",
+            "description": "Hizmet markaları için tasarlanan panolarla kullanım oranını, no-show etkisini ve gelir performansını takip edin.",
+            "metrics": [
+                "Şube ve ekip performansına hızlı bakış",
+                "İptal nedenleri ve önerilen aksiyonlar",
+                "Pazarlama kanalı ve kampanya dönüşüm trendleri"
+            ]
+        },
+        "waitlistHighlight": {
+            "title": "Yapay zekâlı bekleme listesi boş slotları doldurur",
+            "description": "asyncz tercihleri, yol süresini ve harcama geçmişini analiz ederek davet edilecek en uygun müşteriyi önerir.",
+            "metric": "Pilot şubelerde %27'ye varan boş slot azalışı."
+        },
+        "differentiatorTitle": "asyncz neden klasik araçlardan daha iyi?",
+        "differentiatorDescription": "Sektöre özel iş akışları çok lokasyonlu ekipleri uyumlu tutarken spam ve tekrar eden no-showları engeller.",
+        "differentiators": [
+            {
+                "title": "Kurumsal seviye kara liste koruması",
+                "description": "E-posta, telefon ve ödeme kalıplarını tespit ederek riskli rezervasyonları durdurun."
+            },
+            {
+                "title": "Her rol için yerleşik içgörüler",
+                "description": "Ekipler ihtiyaç duydukları metrikleri tablolar arasında kaybolmadan görür."
+            },
+            {
+                "title": "İlk günden API hazır",
+                "description": "Özel uygulamalarınızı ve iş ortaklarınızı güvenli webhook ve REST API'lerle bağlayın."
+            },
+            {
+                "title": "Yerelleştirilmiş deneyimler",
+                "description": "Altı dilde içerik, bildirim ve SEO uyumlu sayfalar sunun."
+            }
+        ],
+        "finalCtaTitle": "asyncz ile her randevuyu orkestre etmeye hazır mısınız?",
+        "finalCtaDescription": "Ekibimiz şubelerinizi, otomasyonlarınızı ve analitiklerinizi bir haftadan kısa sürede haritalandırır.",
+        "finalPrimaryCta": "Strateji oturumu planla",
+        "finalSecondaryCta": "Müşteri hikayelerini oku"
+    },
+    "contactPage": {
+        "pageTitle": "asyncz İletişim | Strateji oturumu planlayın",
+        "metaDescription": "Demo, fiyat veya destek için asyncz ile iletişime geçin. +1 (415) 555-0134 numarasını arayın, info@asyncz.com adresine yazın veya San Francisco ofisimizi ziyaret edin.",
+        "keywords": [
+            "asyncz iletişim",
+            "asyncz destek",
+            "asyncz telefon",
+            "asyncz email"
+        ],
+        "tagline": "Planlama avantajınızı birlikte kuralım",
+        "heroTitle": "asyncz ekibiyle iletişime geçin",
+        "heroSubtitle": "Hedeflerinizi paylaşın; şubeleriniz, ekipleriniz ve müşterileriniz için yol haritası çıkaralım.",
+        "formTitle": "Bize mesaj gönderin",
+        "formSubtitle": "Nasıl yardımcı olabileceğimizi paylaşın, bir iş günü içinde dönüş yapalım.",
+        "form": {
+            "name": "Tam ad",
+            "namePlaceholder": "Ayşe Yılmaz",
+            "email": "İş e-postası",
+            "emailPlaceholder": "ayse@sirketiniz.com",
+            "company": "Şirket",
+            "companyPlaceholder": "Organizasyon adı",
+            "phone": "Telefon (isteğe bağlı)",
+            "phonePlaceholder": "+90 212 555 01 34",
+            "topic": "Konu",
+            "topicPlaceholder": "Konu seçin",
+            "topics": [
+                "Ürün demosu",
+                "Fiyat sorusu",
+                "Onboarding desteği",
+                "Ortaklık fırsatı",
+                "Basın"
+            ],
+            "message": "Nasıl yardımcı olabiliriz?",
+            "messagePlaceholder": "Bağlamı, zaman çizelgesini ve etkinleştirmek istediğiniz şubeleri paylaşın...",
+            "securityQuestion": "{a} + {b} kaç eder? (spam koruması)",
+            "securityPlaceholder": "Yanıtı girin",
+            "submit": "Mesaj gönder",
+            "success": "Teşekkürler! Bir iş günü içinde dönüş yapacağız.",
+            "error": "Bir hata oluştu. Lütfen yeniden deneyin."
+        },
+        "infoTitle": "Merkezimizi ziyaret edin",
+        "hoursTitle": "Destek saatleri (Pasifik Saati)",
+        "supportTitle": "Destek ve onboarding",
+        "supportDescription": "Her asyncz planı yönlendirmeli onboarding, otomasyon denetimleri ve koçluk içerir.",
+        "supportItems": {
+            "enterprise": "Çok lokasyonlu takımlar için yaygınlaştırma uzmanları",
+            "email": "24 saat içinde dönüş yapılan özel e-posta",
+            "training": "Canlı eğitimler ve sertifika programları"
+        },
+        "days": {
+            "monday": "Pazartesi",
+            "tuesday": "Salı",
+            "wednesday": "Çarşamba",
+            "thursday": "Perşembe",
+            "friday": "Cuma",
+            "saturday": "Cumartesi",
+            "sunday": "Pazar"
+        }
+    },
+    "blog": {
+        "pageTitle": "asyncz Blog | Yapay zekâlı planlama fikirleri",
+        "metaDescription": "Yapay zekâlı planlama, otomasyon iş akışları ve çok şubeli analitik üzerine asyncz içgörülerini okuyun.",
+        "keywords": [
+            "asyncz blog",
+            "yapay zekâ planlama",
+            "çok şubeli operasyon",
+            "asyncz otomasyon"
+        ],
+        "tagline": "Modern hizmet ekipleri için içgörüler",
+        "heroTitle": "Her şube için planlama zekâsı",
+        "heroSubtitle": "Güvenilir müşteri yolculukları inşa etmek isteyen operasyon liderlerine yönelik oyun kitapları, çerçeveler ve kıyaslar.",
+        "categories": ["Ürün", "Operasyon", "Büyüme"],
+        "allLabel": "Tüm konular",
+        "readMore": "Makaleyi oku",
+        "emptyState": "Bu filtreyle eşleşen makale henüz yok.",
+        "articleNotFoundTitle": "Makale bulunamadı",
+        "articleNotFoundDescription": "İçerik yayından kaldırılmış olabilir. En yeni yazılara göz atın.",
+        "backToBlog": "Bloga dön",
+        "posts": [
+            {
+                "slug": "ai-scheduling-playbook",
+                "title": "Çok şubeli ekipler için yapay zekâ planlama oyunu",
+                "excerpt": "Operasyonları, otomasyonları ve analitikleri tüm lokasyonlarda hizalamak için çerçeveler.",
+                "content": [
+                    "Markanız büyüdükçe operasyonel karmaşıklık artar. asyncz, tüm şubelerin aynı playbook'u kullanması için kuralları merkezileştirir.",
+                    "Hizmetleri, uygunluk kurallarını ve istisnaları haritalayın; asyncz bunları bir kez tanımlayıp her yerde uygular.",
+                    "Yönetimin kullanım, talep ve darboğazları erken görmesi için analitik katmanını ekleyin."
+                ],
+                "category": "Ürün",
+                "author": "Asyncz Editör Ekibi",
+                "published": "2025-09-10",
+                "readingTime": "6 dakikalık okuma",
+                "tags": ["yapay zeka planlama", "oyun kitabı", "çok şube"]
+            },
+            {
+                "slug": "asyncz-automation-blueprint",
+                "title": "Otomasyon taslağı: asyncz ile no-showları azaltın",
+                "excerpt": "Takvimleri dolu tutmak ve müşterileri sorumlu kılmak için adım adım şablonlar.",
+                "content": [
+                    "Onay pencereleri, ödeme kuralları ve hatırlatma ritimlerini bir araya getirerek no-showları ciddi oranda azaltın.",
+                    "asyncz müşterilerin tercih ettiği kanallar üzerinden WhatsApp, SMS veya e-posta ile hatırlatma gönderir.",
+                    "Önemli randevular için eskalasyon yolları belirleyin ve boşalan slotlarda bekleme listesi davetlerini otomatikleştirin."
+                ],
+                "category": "Operasyon",
+                "author": "Asyncz Müşteri Başarısı",
+                "published": "2025-08-22",
+                "readingTime": "5 dakikalık okuma",
+                "tags": ["otomasyon", "no-show", "müşteri deneyimi"]
+            },
+            {
+                "slug": "multi-branch-analytics-guide",
+                "title": "Çok şubeli yöneticiler için analitik rehberi",
+                "excerpt": "asyncz müşterilerinin kullanım ve gelir artışı için takip ettiği panolar ve metrikler.",
+                "content": [
+                    "Basit sayımların ötesinde asyncz, gelir tahmin eden dönüşüm, sadakat ve yeniden rezervasyon trendlerini öne çıkarır.",
+                    "Her şubeyi kullanım, ekip verimliliği ve kanal performansı açısından kıyaslayın.",
+                    "Doğru müşterileri doğru zamanda kazanmak için bu içgörüleri pazarlama ve işe alım planlarınıza geri besleyin."
+                ],
+                "category": "Büyüme",
+                "author": "Asyncz Veri Ekibi",
+                "published": "2025-08-05",
+                "readingTime": "7 dakikalık okuma",
+                "tags": ["analitik", "büyüme", "panolar"]
+            }
+        ]
+    }
+}
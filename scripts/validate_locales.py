@@ -0,0 +1,230 @@
+"""Check every locale file against en.json.
+
+    python scripts/validate_locales.py [langs or paths...] [-j 4] [--json] [--ignore missing]
+
+en.json is compiled once into a schema index: one entry per object key,
+array item and leaf, holding its type, its array length or its set of
+{placeholder} tokens. Each language is then checked in a single walk of its
+own tree, in a pool of worker processes that receive the index once.
+Issues are reported by code:
+
+    parse         the file cannot be read as JSON; nothing else is checked
+    missing       en has the path, the language does not (t() falls back to en)
+    extra         the language has a path en does not
+    type          the value has a different JSON type
+    length        an array has a different number of items
+    placeholders  a string uses different {tokens} than en
+
+Only the topmost path of a missing or extra subtree is reported. Exit
+status is 1 if any issue remains after --ignore, so the script can run as
+a pre-commit hook on the changed locale files.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from locale_codec import LOCALES_DIR, locale_languages, locale_path
+
+CODES = ("parse", "missing", "extra", "type", "length", "placeholders")
+REFERENCE = "en"
+
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def kind(value):
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, bool):
+        return "boolean"
+    if value is None:
+        return "null"
+    return "number"
+
+
+def placeholders(text):
+    return frozenset(_PLACEHOLDER.findall(text)) if "{" in text else frozenset()
+
+
+def format_path(path):
+    parts = []
+    for part in path:
+        if isinstance(part, int):
+            parts.append(f"[{part}]")
+        else:
+            parts.append(("." if parts else "") + part)
+    return "".join(parts)
+
+
+class Schema:
+    """path tuple -> (kind, detail); detail is an array's length or a string's placeholders."""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    @classmethod
+    def compile(cls, tree):
+        entries = {}
+        stack = [((), tree)]
+        while stack:
+            path, value = stack.pop()
+            node_kind = kind(value)
+            if node_kind == "object":
+                entries[path] = (node_kind, None)
+                stack.extend((path + (key,), child) for key, child in value.items())
+            elif node_kind == "array":
+                entries[path] = (node_kind, len(value))
+                stack.extend((path + (i,), child) for i, child in enumerate(value))
+            elif node_kind == "string":
+                entries[path] = (node_kind, placeholders(value))
+            else:
+                entries[path] = (node_kind, None)
+        return cls(entries)
+
+    def check(self, tree):
+        """Return the list of issues, each (code, path, expected, actual)."""
+        entries = self.entries
+        issues = []
+        seen = set()
+        # Paths whose subtree is already explained by one issue.
+        covered = set()
+        stack = [((), tree)]
+        while stack:
+            path, value = stack.pop()
+            entry = entries.get(path)
+            if entry is None:
+                issues.append(("extra", path, None, kind(value)))
+                continue
+            seen.add(path)
+            expected_kind, detail = entry
+            actual_kind = kind(value)
+            if actual_kind != expected_kind:
+                issues.append(("type", path, expected_kind, actual_kind))
+                covered.add(path)
+                continue
+            if actual_kind == "object":
+                stack.extend((path + (key,), child) for key, child in value.items())
+            elif actual_kind == "array":
+                if len(value) != detail:
+                    issues.append(("length", path, detail, len(value)))
+                    covered.update(path + (i,) for i in range(len(value), detail))
+                stack.extend((path + (i,), child) for i, child in enumerate(value[:detail]))
+            elif actual_kind == "string" and (detail or "{" in value):
+                found = placeholders(value)
+                if found != detail:
+                    issues.append(("placeholders", path, sorted(detail), sorted(found)))
+
+        for path in entries.keys() - seen:
+            # Report a missing subtree once, at its root.
+            parent = path[:-1]
+            if parent in seen and parent not in covered and path not in covered:
+                issues.append(("missing", path, entries[path][0], None))
+        issues.sort(key=lambda issue: (CODES.index(issue[0]), format_path(issue[1])))
+        return issues
+
+
+_schema = None
+
+
+def _init_worker(schema):
+    global _schema
+    _schema = schema
+
+
+def check_file(lang, path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = json.load(f)
+    except (OSError, ValueError) as exc:
+        # JSONDecodeError and UnicodeDecodeError are both ValueErrors.
+        return lang, [("parse", (), None, str(exc))]
+    return lang, _schema.check(tree)
+
+
+def language_files(args_langs, locales_dir):
+    if not args_langs:
+        return {lang: locale_path(lang, locales_dir) for lang in locale_languages(locales_dir)}
+    files = {}
+    for item in args_langs:
+        if item.endswith(".json"):
+            files[os.path.basename(item)[:-5]] = item
+        else:
+            files[item] = locale_path(item, locales_dir)
+    return files
+
+
+def validate(files, reference_path, jobs=1):
+    """Return {lang: [issue dicts]} for every file in files (lang -> path)."""
+    with open(reference_path, "r", encoding="utf-8") as f:
+        schema = Schema.compile(json.load(f))
+    files = {lang: path for lang, path in files.items() if lang != REFERENCE}
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(files)), initializer=_init_worker, initargs=(schema,)
+        ) as pool:
+            results = dict(pool.map(check_file, files, files.values()))
+    else:
+        _init_worker(schema)
+        results = dict(check_file(lang, path) for lang, path in files.items())
+    return {
+        lang: [
+            {"code": code, "path": format_path(path), "expected": expected, "actual": actual}
+            for code, path, expected, actual in results[lang]
+        ]
+        for lang in files
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check every locale file against en.json.")
+    parser.add_argument("languages", nargs="*", help="language codes or locale file paths (default: all)")
+    parser.add_argument("--locales-dir", default=LOCALES_DIR)
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0, help="worker processes; 0 uses every core (default)"
+    )
+    parser.add_argument(
+        "--ignore", action="append", choices=CODES[1:], default=[], help="do not report CODE"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    files = language_files(args.languages, args.locales_dir)
+    reference = locale_path(REFERENCE, args.locales_dir)
+    try:
+        report = validate(files, reference, jobs)
+    except (OSError, ValueError) as exc:
+        print(f"{reference}: {exc}", file=sys.stderr)
+        return 1
+    report = {
+        lang: [issue for issue in issues if issue["code"] not in args.ignore]
+        for lang, issues in report.items()
+    }
+    total = sum(len(issues) for issues in report.values())
+
+    if args.json:
+        print(json.dumps({"reference": REFERENCE, "issues": total, "languages": report}, ensure_ascii=False, indent=2))
+    else:
+        for lang, issues in report.items():
+            counts = {code: sum(1 for issue in issues if issue["code"] == code) for code in CODES}
+            summary = ", ".join(f"{count} {code}" for code, count in counts.items() if count) or "ok"
+            print(f"{lang}: {summary}")
+            for issue in issues:
+                detail = ""
+                if issue["code"] == "parse":
+                    detail = issue["actual"]
+                elif issue["code"] != "missing" and issue["code"] != "extra":
+                    detail = f": expected {issue['expected']}, got {issue['actual']}"
+                print(f"  {issue['code']:<12} {issue['path']}{detail}")
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())